@@ -28,6 +28,8 @@ class UserAdmin(BaseUserAdmin):
     list_filter = ("role", "is_staff", "is_active", "department")
     search_fields = ("email", "first_name", "last_name", "middle_name", "phone")
     ordering = ("id",)
+    list_select_related = ("role", "department")
+    autocomplete_fields = ("department",)
     readonly_fields = ("date_joined",)
     fieldsets = (
         (None, {"fields": ("email", "phone", "password")}),
@@ -89,6 +91,8 @@ class DepartmentAdmin(admin.ModelAdmin):
     )
     search_fields = ("name", "short_name")
     list_filter = ("parent", "can_save_project_applications")
+    list_select_related = ("parent",)
+    autocomplete_fields = ("parent",)
 
 
 @admin.register(RegistrationRequest)
@@ -115,6 +119,9 @@ class RegistrationRequestAdmin(admin.ModelAdmin):
         "phone",
         "reason",
     )
+    list_select_related = ("department", "actor__role")
+    autocomplete_fields = ("department",)
+    raw_id_fields = ("actor",)
 
 
 @admin.register(Role)
@@ -149,3 +156,4 @@ class SemesterAdmin(admin.ModelAdmin):
     search_fields = ("code", "name")
     list_filter = ("academic_year",)
     ordering = ("position",)
+    list_select_related = ("academic_year",)
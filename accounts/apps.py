@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
+
+    def ready(self):
+        # Инвалидация кешей (principal JWT и т.п.) при изменении справочников
+        from accounts import signals  # noqa: F401
@@ -0,0 +1,105 @@
+"""Аутентификация по JWT с кешированием пользователя."""
+
+from __future__ import annotations
+
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from accounts.cache import get_principal_ttl, principal_cache_key
+from accounts.models import User
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication, загружающий пользователя с ролью и подразделением.
+
+    Пользователь загружается одним запросом (role, department,
+    department.parent) и кешируется на ``AUTH_PRINCIPAL_CACHE_TTL`` секунд
+    по идентификатору токена. Кеш инвалидируется сигналами при изменении
+    пользователя, ролей и подразделений (см. accounts.signals).
+
+    Хеш пароля не загружается и не попадает в кеш (кеш может храниться в
+    файлах на диске); при обращении к ``password`` он читается из БД.
+    """
+
+    def get_user(self, validated_token: Token) -> User:
+        """Возвращает пользователя для проверенного токена.
+
+        Args:
+            validated_token: Проверенный JWT
+
+        Returns:
+            User: Пользователь с загруженными role, department и department.parent
+                (без хеша пароля)
+
+        Raises:
+            InvalidToken: В токене нет идентификатора пользователя
+            AuthenticationFailed: Пользователь не найден или неактивен
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        ttl = get_principal_ttl()
+        key = None
+        user = None
+        if ttl > 0:
+            key = principal_cache_key(user_id, self._token_id(validated_token))
+            user = cache.get(key)
+
+        if user is None:
+            user = (
+                User.objects.select_related("role", "department__parent")
+                .defer("password")
+                .filter(**{api_settings.USER_ID_FIELD: user_id})
+                .first()
+            )
+            if user is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            if key is not None:
+                cache.set(key, user, ttl)
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                _("The user's password has been changed."), code="password_changed"
+            )
+
+        return user
+
+    @staticmethod
+    def _token_id(validated_token: Token) -> str:
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if jti:
+            return str(jti)
+        return hashlib.sha256(bytes(str(validated_token), "utf-8")).hexdigest()
+
+
+async def authenticate_async(request) -> User | None:
+    """Аутентифицирует Django-запрос по JWT для async view.
+
+    Синхронная аутентификация выполняется в общем потоке sync_to_async, где
+    Django следит за возрастом и исправностью соединений с БД.
+
+    Returns:
+        User или None, если заголовка Authorization нет
+
+    Raises:
+        AuthenticationFailed, InvalidToken: Токен недействителен
+    """
+    result = await sync_to_async(CachedJWTAuthentication().authenticate)(request)
+    return result[0] if result else None
@@ -0,0 +1,181 @@
+"""Кеш principal'ов (пользователей) для JWT-аутентификации и профиля /user/.
+
+Ключи версионируются: изменение пользователя увеличивает его версию,
+изменение ролей или подразделений — общую версию. Старые записи после
+этого просто перестают читаться и истекают по TTL.
+
+Здесь же кешируется карта «подразделение → активные институты»
+(:class:`DepartmentInstituteMap`): её используют профиль пользователя и
+карта доступа к направлениям (teams.cache).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from accounts.models import Department
+from core.cache import cache_ttl
+
+GLOBAL_VERSION_KEY = "accounts:principal:version"
+USER_VERSION_KEY = "accounts:principal:user:{user_id}"
+PRINCIPAL_KEY = "accounts:principal:{version}:{user_version}:{user_id}:{token_id}"
+PROFILE_KEY = (
+    "accounts:profile:{version}:{user_version}:{institutes_version}:{user_id}"
+)
+DEPARTMENT_INSTITUTES_VERSION_KEY = "accounts:department_institutes:version"
+DEPARTMENT_INSTITUTES_KEY = "accounts:department_institutes:{version}:map"
+
+
+@dataclass(frozen=True)
+class DepartmentInstituteMap:
+    """Родители подразделений и их активные институты."""
+
+    department_parents: dict[int, int | None]
+    # Коды институтов в порядке (position, code)
+    department_institutes: dict[int, tuple[str, ...]]
+
+    def institute_codes_for_department(self, department_id: int | None) -> list[str]:
+        """Институты подразделения и его родителя."""
+        if not department_id:
+            return []
+        codes = list(self.department_institutes.get(department_id, ()))
+        parent_id = self.department_parents.get(department_id)
+        if parent_id:
+            codes.extend(self.department_institutes.get(parent_id, ()))
+        return codes
+
+
+def get_principal_ttl() -> int:
+    """TTL записи principal'а в секундах (0 — кеш отключён)."""
+    return cache_ttl(int(getattr(settings, "AUTH_PRINCIPAL_CACHE_TTL", 60)))
+
+
+def bump_version(key: str) -> None:
+    """Увеличивает счётчик версии; при отсутствии ключа задаёт новое значение."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Начальное значение на основе времени: после вытеснения ключа из кеша
+        # версия не совпадёт со старыми записями
+        cache.set(key, time.time_ns(), None)
+
+
+def get_versions(user_id) -> tuple[int, int]:
+    """Возвращает (общую версию, версию пользователя)."""
+    user_key = USER_VERSION_KEY.format(user_id=user_id)
+    values = cache.get_many([GLOBAL_VERSION_KEY, user_key])
+    return values.get(GLOBAL_VERSION_KEY, 0), values.get(user_key, 0)
+
+
+def principal_cache_key(user_id, token_id: str) -> str:
+    """Ключ кеша principal'а для пользователя и токена."""
+    version, user_version = get_versions(user_id)
+    return PRINCIPAL_KEY.format(
+        version=version,
+        user_version=user_version,
+        user_id=user_id,
+        token_id=token_id,
+    )
+
+
+def invalidate_user_principal(user_id) -> None:
+    """Инвалидирует кешированные principal'ы пользователя."""
+    bump_version(USER_VERSION_KEY.format(user_id=user_id))
+
+
+def invalidate_all_principals() -> None:
+    """Инвалидирует principal'ы всех пользователей (изменились роли/подразделения)."""
+    bump_version(GLOBAL_VERSION_KEY)
+
+
+def get_profile_ttl() -> int:
+    """TTL профиля пользователя (/user/) в секундах (0 — кеш отключён)."""
+    return cache_ttl(int(getattr(settings, "USER_PROFILE_CACHE_TTL", 300)))
+
+
+def get_cached_profile(user_id, build: Callable[[], dict[str, Any]]) -> dict[str, Any]:
+    """Профиль пользователя из кеша; при промахе строится через ``build``.
+
+    Ключ содержит версии principal'а (пользователь, роли, подразделения) и
+    версию карты институтов подразделений, поэтому профиль сбрасывается теми
+    же сигналами: см. accounts.signals и showcase.signals.
+    """
+    ttl = get_profile_ttl()
+    if ttl <= 0:
+        return build()
+
+    user_key = USER_VERSION_KEY.format(user_id=user_id)
+    versions = cache.get_many(
+        [GLOBAL_VERSION_KEY, user_key, DEPARTMENT_INSTITUTES_VERSION_KEY]
+    )
+    key = PROFILE_KEY.format(
+        version=versions.get(GLOBAL_VERSION_KEY, 0),
+        user_version=versions.get(user_key, 0),
+        institutes_version=versions.get(DEPARTMENT_INSTITUTES_VERSION_KEY, 0),
+        user_id=user_id,
+    )
+    profile = cache.get(key)
+    if profile is None:
+        profile = build()
+        cache.set(key, profile, ttl)
+    return profile
+
+
+def get_department_institutes_ttl() -> int:
+    """TTL карты институтов подразделений в секундах (0 — кеш отключён)."""
+    return cache_ttl(int(getattr(settings, "INSTITUTE_ACCESS_CACHE_TTL", 300)))
+
+
+def build_department_institute_map() -> DepartmentInstituteMap:
+    """Собирает карту из БД двумя запросами."""
+    department_institutes: dict[int, list[str]] = defaultdict(list)
+    for department_id, code in (
+        Department.objects.filter(institutes__is_active=True)
+        .order_by("institutes__position", "institutes__code")
+        .values_list("id", "institutes__code")
+    ):
+        department_institutes[department_id].append(code)
+
+    return DepartmentInstituteMap(
+        department_parents=dict(Department.objects.values_list("id", "parent_id")),
+        department_institutes={
+            key: tuple(value) for key, value in department_institutes.items()
+        },
+    )
+
+
+def get_department_institute_map() -> DepartmentInstituteMap:
+    """Карта институтов подразделений из кеша; при промахе собирается заново."""
+    ttl = get_department_institutes_ttl()
+    if ttl <= 0:
+        return build_department_institute_map()
+
+    key = DEPARTMENT_INSTITUTES_KEY.format(
+        version=cache.get(DEPARTMENT_INSTITUTES_VERSION_KEY, 0)
+    )
+    department_map = cache.get(key)
+    if department_map is None:
+        department_map = build_department_institute_map()
+        cache.set(key, department_map, ttl)
+    return department_map
+
+
+def invalidate_department_institutes() -> None:
+    """Инвалидирует карту институтов подразделений (и профили пользователей).
+
+    Внутри транзакции версия увеличивается ещё раз после фиксации, чтобы
+    параллельный запрос не закешировал данные до коммита.
+    """
+    bump_version(DEPARTMENT_INSTITUTES_VERSION_KEY)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(
+            lambda: bump_version(DEPARTMENT_INSTITUTES_VERSION_KEY)
+        )
@@ -63,6 +63,9 @@ class Command(BaseCommand):
                 else:
                     updated += 1
 
+        # Сигналы срабатывают на каждую строку; явный сброс — на случай,
+        # если импорт будет переведён на массовые операции
+        Semester.invalidate_setting_map()
         self._validate_known_keys()
         self.stdout.write(
             self.style.SUCCESS(f"Готово: создано {created}, обновлено {updated}")
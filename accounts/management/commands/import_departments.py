@@ -1,32 +1,75 @@
-from django.core.management.base import BaseCommand
-import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
 
-from accounts.models import Department
+from accounts.cache import invalidate_all_principals, invalidate_department_institutes
+from accounts.services.department_import_service import (
+    DepartmentRecord,
+    upsert_departments,
+)
+from core.bulk_import import (
+    ImportDataError,
+    clean_str,
+    import_transaction,
+    parse_bool,
+    read_table,
+)
+
+# Заголовки столбцов в старом формате выгрузки
+LEGACY_COLUMNS = {
+    "Название подразделения": "name",
+    "Краткое название": "short_name",
+    "Родительское подразделение": "parent_name",
+}
 
 
 class Command(BaseCommand):
     help = "Импортирует подразделения из xlsx-файла (pandas, путь в коде)."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Показать изменения без записи в БД",
+        )
+
     def handle(self, *args, **options):
         filepath = "accounts/management/commands/departments.xlsx"
-        df = pd.read_excel(filepath)
-        dep_cache = {}
-        for _, row in df.iterrows():
-            name = row["Название подразделения"]
-            short_name = row["Краткое название"]
-            parent_name = row["Родительское подразделение"]
-            parent = None
-            if pd.notna(parent_name) and parent_name:
-                parent = (
-                    dep_cache.get(parent_name)
-                    or Department.objects.filter(name=parent_name).first()
-                )
-            dep, created = Department.objects.get_or_create(
-                name=name, defaults={"short_name": short_name, "parent": parent}
+        try:
+            rows = [
+                {LEGACY_COLUMNS.get(column, column): value for column, value in row.items()}
+                for row in read_table(filepath)
+            ]
+        except ImportDataError as exc:
+            raise CommandError(str(exc)) from exc
+        if rows and not {"name", "short_name"} <= rows[0].keys():
+            raise CommandError(
+                f"В файле '{filepath}' отсутствуют столбцы name и short_name"
+            )
+
+        has_can_save = bool(rows) and "can_save_project_applications" in rows[0]
+        records = [
+            DepartmentRecord(
+                name=clean_str(row["name"]),
+                short_name=clean_str(row["short_name"]),
+                parent_name=clean_str(row.get("parent_name")) or None,
+                can_save_project_applications=parse_bool(
+                    row.get("can_save_project_applications")
+                ),
+            )
+            for row in rows
+        ]
+        with import_transaction(options["dry_run"]):
+            result, warnings = upsert_departments(
+                records, update_can_save=has_can_save
+            )
+
+        if not options["dry_run"]:
+            invalidate_all_principals()
+            invalidate_department_institutes()
+        for warning in warnings:
+            self.stdout.write(self.style.WARNING(warning))
+        prefix = "Пробный запуск. " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}Импорт подразделений завершён. {result.summary()}"
             )
-            if not created:
-                dep.short_name = short_name
-                dep.parent = parent
-                dep.save()
-            dep_cache[name] = dep
-        self.stdout.write(self.style.SUCCESS("Импорт подразделений завершён."))
+        )
@@ -1,27 +1,53 @@
+from dataclasses import dataclass
 import os
 
-from django.core.management.base import BaseCommand
-import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
 
+from accounts.cache import invalidate_all_principals
 from accounts.models import Role
+from core.bulk_import import (
+    BulkUpsert,
+    ImportDataError,
+    clean_str,
+    import_transaction,
+    read_table,
+)
+
+
+@dataclass(frozen=True)
+class RoleRecord:
+    code: str
+    name: str
 
 
 class Command(BaseCommand):
     help = "Импорт ролей из Excel-файла roles.xlsx (рядом с этим файлом)"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Показать изменения без записи в БД",
+        )
+
     def handle(self, *args, **options):
         file_path = os.path.join(os.path.dirname(__file__), "roles.xlsx")
         if not os.path.exists(file_path):
             self.stderr.write(self.style.ERROR(f"Файл {file_path} не найден."))
             return
-        df = pd.read_excel(file_path)
-        count = 0
-        for _, row in df.iterrows():
-            code = str(row["code"]).strip()
-            name = str(row["name"]).strip()
-            obj, created = Role.objects.update_or_create(
-                code=code, defaults={"name": name}
-            )
-            count += 1
-            self.stdout.write(f"{'Создана' if created else 'Обновлена'} роль: {obj}")
-        self.stdout.write(self.style.SUCCESS(f"Импортировано ролей: {count}"))
+        try:
+            records = [
+                RoleRecord(code=clean_str(row["code"]), name=clean_str(row["name"]))
+                for row in read_table(file_path, ("code", "name"))
+            ]
+            with import_transaction(options["dry_run"]):
+                result = BulkUpsert(Role, "code", ["name"]).run(records)
+        except ImportDataError as exc:
+            raise CommandError(str(exc)) from exc
+
+        if not options["dry_run"]:
+            invalidate_all_principals()
+        prefix = "Пробный запуск. " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(f"{prefix}Импорт ролей завершён. {result.summary()}")
+        )
@@ -2,11 +2,24 @@ import os
 from typing import Any, Dict, Iterable, List, Optional
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
-from django.db.models import ProtectedError
-import pandas as pd
 
+from accounts.cache import invalidate_all_principals, invalidate_department_institutes
 from accounts.models import Department
+from accounts.services.department_import_service import (
+    DepartmentRecord,
+    InstituteRecord,
+    upsert_departments,
+)
+from core.bulk_import import (
+    BulkUpsert,
+    ImportDataError,
+    build_lookup,
+    clean_str,
+    import_transaction,
+    parse_bool,
+    read_table,
+    write_excel,
+)
 from showcase.models import Institute
 
 
@@ -46,6 +59,11 @@ class Command(BaseCommand):
                 "departments.xlsx или institutes.xlsx."
             ),
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Импорт: показать изменения без записи в БД.",
+        )
 
     def handle(self, *args: Any, **options: Any) -> None:
         """Точка входа команды."""
@@ -63,9 +81,9 @@ class Command(BaseCommand):
                 raise CommandError(f"Файл '{file_path}' не найден.")
 
             if entity == "departments":
-                self._import_departments(file_path)
+                self._import_departments(file_path, options["dry_run"])
             else:
-                self._import_institutes(file_path)
+                self._import_institutes(file_path, options["dry_run"])
 
     def _resolve_file_path(self, file_option: Optional[str], entity: str) -> str:
         """Определяет путь к файлу Excel."""
@@ -85,7 +103,9 @@ class Command(BaseCommand):
 
     def _export_departments(self, file_path: str) -> None:
         """Экспортирует все подразделения в Excel."""
-        departments: Iterable[Department] = Department.objects.all().order_by("name")
+        departments: Iterable[Department] = Department.objects.select_related(
+            "parent"
+        ).order_by("name")
 
         data: List[Dict[str, Any]] = []
         for dep in departments:
@@ -101,7 +121,7 @@ class Command(BaseCommand):
         if not data:
             self.stdout.write(self.style.WARNING("Подразделения в базе не найдены."))
 
-        pd.DataFrame(data).to_excel(file_path, index=False)
+        write_excel(file_path, data)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -111,9 +131,9 @@ class Command(BaseCommand):
 
     def _export_institutes(self, file_path: str) -> None:
         """Экспортирует все институты в Excel."""
-        institutes: Iterable[Institute] = Institute.objects.all().order_by(
-            "position", "code"
-        )
+        institutes: Iterable[Institute] = Institute.objects.select_related(
+            "department"
+        ).order_by("position", "code")
 
         data: List[Dict[str, Any]] = []
         for inst in institutes:
@@ -132,7 +152,7 @@ class Command(BaseCommand):
         if not data:
             self.stdout.write(self.style.WARNING("Институты в базе не найдены."))
 
-        pd.DataFrame(data).to_excel(file_path, index=False)
+        write_excel(file_path, data)
 
         self.stdout.write(
             self.style.SUCCESS(
@@ -142,159 +162,91 @@ class Command(BaseCommand):
 
     # ===== IMPORT =====
 
-    def _import_departments(self, file_path: str) -> None:
+    def _import_departments(self, file_path: str, dry_run: bool) -> None:
         """Импортирует подразделения из Excel с обновлением и удалением лишних."""
-        df = pd.read_excel(file_path)
-        df = df.where(pd.notnull(df), None)
-
-        required_columns = {"name", "short_name"}
-        missing = required_columns - set(df.columns)
-        if missing:
-            raise CommandError(
-                f"В файле '{file_path}' отсутствуют обязательные столбцы: {', '.join(sorted(missing))}"
+        rows = self._read(file_path, ("name", "short_name"))
+        has_can_save = bool(rows) and "can_save_project_applications" in rows[0]
+        records = [
+            DepartmentRecord(
+                name=clean_str(row["name"]),
+                short_name=clean_str(row["short_name"]),
+                parent_name=clean_str(row.get("parent_name")) or None,
+                can_save_project_applications=parse_bool(
+                    row.get("can_save_project_applications")
+                ),
             )
+            for row in rows
+        ]
 
-        with transaction.atomic():
-            # Собираем имена подразделений из файла
-            file_names: List[str] = []
-            parent_map: Dict[str, Optional[str]] = {}
-
-            created_count = 0
-            updated_count = 0
-
-            # Первый проход: создаём/обновляем без родителя
-            for _, row in df.iterrows():
-                name = str(row["name"]).strip()
-                short_name = str(row["short_name"]).strip() if row["short_name"] else ""
-                parent_name = (
-                    str(row["parent_name"]).strip()
-                    if "parent_name" in df.columns and row["parent_name"]
-                    else None
-                )
-
-                can_save_value = False
-                if (
-                    "can_save_project_applications" in df.columns
-                    and row["can_save_project_applications"] is not None
-                ):
-                    can_save_value = bool(row["can_save_project_applications"])
-
-                file_names.append(name)
-                parent_map[name] = parent_name
-
-                dep, created = Department.objects.update_or_create(
-                    name=name,
-                    defaults={
-                        "short_name": short_name,
-                        "can_save_project_applications": can_save_value,
-                        "parent": None,
-                    },
-                )
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-
-            # Второй проход: проставляем родительские подразделения
-            deps_by_name: Dict[str, Department] = {
-                d.name: d for d in Department.objects.all()
-            }
-            warnings: List[str] = []
-            for name, parent_name in parent_map.items():
-                if not parent_name:
-                    continue
-                dep = deps_by_name.get(name)
-                parent = deps_by_name.get(parent_name)
-                if not parent:
-                    warnings.append(
-                        f"Для подразделения '{name}' не найден родитель '{parent_name}'"
-                    )
-                    continue
-                if dep.parent_id != parent.id:
-                    dep.parent = parent
-                    dep.save(update_fields=["parent"])
-
-            # Удаляем подразделения, которых нет в файле
-            existing_deps: Iterable[Department] = Department.objects.all()
-            deleted_count = 0
-            for dep in existing_deps:
-                if dep.name not in file_names:
-                    try:
-                        dep.delete()
-                        deleted_count += 1
-                    except ProtectedError:
-                        warnings.append(
-                            f"Не удалось удалить подразделение '{dep.name}' из-за связанных объектов."
-                        )
+        with import_transaction(dry_run):
+            result, warnings = upsert_departments(
+                records, update_can_save=has_can_save, delete_missing=True
+            )
 
+        if not dry_run:
+            invalidate_all_principals()
+            invalidate_department_institutes()
+        for name in result.protected:
+            warnings.append(
+                f"Не удалось удалить подразделение '{name}' из-за связанных объектов."
+            )
         for w in warnings:
             self.stdout.write(self.style.WARNING(w))
 
         self.stdout.write(
             self.style.SUCCESS(
-                "Импорт подразделений завершён. "
-                f"Создано: {created_count}, обновлено: {updated_count}, удалено: {deleted_count}."
+                f"{self._prefix(dry_run)}Импорт подразделений завершён. "
+                f"{result.summary()}"
             )
         )
 
-    def _import_institutes(self, file_path: str) -> None:
+    def _import_institutes(self, file_path: str, dry_run: bool) -> None:
         """Импортирует институты из Excel с обновлением и удалением лишних."""
-        df = pd.read_excel(file_path)
-        df = df.where(pd.notnull(df), None)
-
-        required_columns = {"code", "name", "position"}
-        missing = required_columns - set(df.columns)
-        if missing:
-            raise CommandError(
-                f"В файле '{file_path}' отсутствуют обязательные столбцы: {', '.join(sorted(missing))}"
-            )
-
-        with transaction.atomic():
-            file_codes: List[str] = []
-            created_count = 0
-            updated_count = 0
-
-            for _, row in df.iterrows():
-                code = str(row["code"]).strip()
-                name = str(row["name"]).strip()
-                position = int(row["position"])
-
-                is_active = True
-                if "is_active" in df.columns and row["is_active"] is not None:
-                    is_active = bool(row["is_active"])
-
-                department = None
-                if "department_name" in df.columns and row["department_name"]:
-                    dep_name = str(row["department_name"]).strip()
-                    department = Department.objects.filter(name=dep_name).first()
-
-                file_codes.append(code)
-
-                inst, created = Institute.objects.update_or_create(
+        rows = self._read(file_path, ("code", "name", "position"))
+        departments = build_lookup(Department.objects.all(), "name")
+
+        warnings: List[str] = []
+        records: List[InstituteRecord] = []
+        for row in rows:
+            code = clean_str(row["code"])
+            dep_name = clean_str(row.get("department_name"))
+            department_id = departments.get(dep_name) if dep_name else None
+            if dep_name and department_id is None:
+                warnings.append(
+                    f"Для института '{code}' не найдено подразделение '{dep_name}'"
+                )
+            records.append(
+                InstituteRecord(
                     code=code,
-                    defaults={
-                        "name": name,
-                        "position": position,
-                        "is_active": is_active,
-                        "department": department,
-                    },
+                    name=clean_str(row["name"]),
+                    position=int(row["position"]),
+                    is_active=parse_bool(row.get("is_active"), default=True),
+                    department_id=department_id,
                 )
-                if created:
-                    created_count += 1
-                else:
-                    updated_count += 1
-
-            # Удаляем институты, которых нет в файле
-            existing_institutes: Iterable[Institute] = Institute.objects.all()
-            deleted_count = 0
-            for inst in existing_institutes:
-                if inst.code not in file_codes:
-                    inst.delete()
-                    deleted_count += 1
+            )
 
+        with import_transaction(dry_run):
+            result = BulkUpsert(
+                Institute, "code", ["name", "position", "is_active", "department_id"]
+            ).run(records, delete_missing=True)
+            invalidate_department_institutes()
+
+        for w in warnings:
+            self.stdout.write(self.style.WARNING(w))
         self.stdout.write(
             self.style.SUCCESS(
-                "Импорт институтов завершён. "
-                f"Создано: {created_count}, обновлено: {updated_count}, удалено: {deleted_count}."
+                f"{self._prefix(dry_run)}Импорт институтов завершён. "
+                f"{result.summary()}"
             )
         )
+
+    @staticmethod
+    def _read(file_path: str, required: Iterable[str]) -> List[Dict[str, Any]]:
+        try:
+            return read_table(file_path, required)
+        except ImportDataError as exc:
+            raise CommandError(str(exc)) from exc
+
+    @staticmethod
+    def _prefix(dry_run: bool) -> str:
+        return "Пробный запуск. " if dry_run else ""
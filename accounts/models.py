@@ -4,8 +4,11 @@ from django.contrib.auth.models import (
     BaseUserManager,
     PermissionsMixin,
 )
+from django.core.cache import cache
 from django.db import models
 
+from core.cache import cache_ttl
+
 
 class UserManager(BaseUserManager):
     def create_user(self, email, password=None, **extra_fields):
@@ -215,6 +218,12 @@ class Settings(models.Model):
 ACTIVE_SEMESTER_SETTING_CODE = "active_semester_code"
 NEXT_SEMESTER_SETTING_CODE = "next_semester_code"
 
+# Кеш снимка настроек семестров; сбрасывается сигналами при изменении
+# Settings/Semester (accounts.signals), TTL — страховка (для кеша в памяти
+# процесса ограничивается core.cache.cache_ttl: сигнал видит только один воркер)
+SEMESTER_MAP_CACHE_KEY = "accounts:semester_setting_map"
+SEMESTER_MAP_CACHE_TTL = 60 * 60
+
 
 class Semester(models.Model):
     code = models.CharField(
@@ -243,35 +252,71 @@ class Semester(models.Model):
         return f"{self.code} — {self.name}"
 
     @classmethod
-    def _setting_value(cls, setting_code: str) -> str | None:
-        try:
-            setting = Settings.objects.get(code=setting_code)
-        except Settings.DoesNotExist:
-            return None
-        code = (setting.value or "").strip()
-        return code or None
+    def get_setting_map(cls) -> dict:
+        """Снимок настроек семестров (кешируется до изменения Settings/Semester).
+
+        Returns:
+            dict: {
+                "codes": {"active": код | None, "next": код | None},
+                "semesters": {"active": Semester | None, "next": Semester | None},
+                "ids": {"active": id | None, "next": id | None},
+                "semester_ids": frozenset id всех семестров,
+            }
+        """
+        data = cache.get(SEMESTER_MAP_CACHE_KEY)
+        if data is None:
+            data = cls._build_setting_map()
+            cache.set(
+                SEMESTER_MAP_CACHE_KEY, data, cache_ttl(SEMESTER_MAP_CACHE_TTL)
+            )
+        return data
 
     @classmethod
-    def get_active_code(cls) -> str | None:
-        """Код текущего активного семестра (Settings.active_semester_code)."""
-        return cls._setting_value(ACTIVE_SEMESTER_SETTING_CODE)
+    def _build_setting_map(cls) -> dict:
+        setting_codes = {
+            "active": ACTIVE_SEMESTER_SETTING_CODE,
+            "next": NEXT_SEMESTER_SETTING_CODE,
+        }
+        values = dict(
+            Settings.objects.filter(code__in=setting_codes.values()).values_list(
+                "code", "value"
+            )
+        )
+        codes = {
+            key: (values.get(setting_code) or "").strip() or None
+            for key, setting_code in setting_codes.items()
+        }
+        semesters = list(cls.objects.all())
+        by_code = {semester.code: semester for semester in semesters}
+        resolved = {
+            key: by_code.get(code) if code else None for key, code in codes.items()
+        }
+        return {
+            "codes": codes,
+            "semesters": resolved,
+            "ids": {key: s.pk if s else None for key, s in resolved.items()},
+            "semester_ids": frozenset(semester.pk for semester in semesters),
+        }
 
     @classmethod
-    def _from_setting_code(cls, setting_code: str) -> "Semester | None":
-        code = cls._setting_value(setting_code)
-        if not code:
-            return None
-        return cls.objects.filter(code=code).first()
+    def invalidate_setting_map(cls) -> None:
+        """Сбрасывает кеш настроек семестров."""
+        cache.delete(SEMESTER_MAP_CACHE_KEY)
+
+    @classmethod
+    def get_active_code(cls) -> str | None:
+        """Код текущего активного семестра (Settings.active_semester_code)."""
+        return cls.get_setting_map()["codes"]["active"]
 
     @classmethod
     def get_active(cls) -> "Semester | None":
         """Текущий активный семестр (Settings.active_semester_code)."""
-        return cls._from_setting_code(ACTIVE_SEMESTER_SETTING_CODE)
+        return cls.get_setting_map()["semesters"]["active"]
 
     @classmethod
     def get_next(cls) -> "Semester | None":
         """Следующий семестр для новых заявок (Settings.next_semester_code)."""
-        return cls._from_setting_code(NEXT_SEMESTER_SETTING_CODE)
+        return cls.get_setting_map()["semesters"]["next"]
 
     @classmethod
     def resolve_list_semester_id(cls, raw: str | None) -> int:
@@ -282,21 +327,22 @@ class Semester(models.Model):
         if not value:
             raise ValueError("Параметр semester_id не может быть пустым")
 
+        setting_map = cls.get_setting_map()
         lowered = value.lower()
         if lowered == "next":
-            semester = cls.get_next()
-            if semester is None:
+            semester_id = setting_map["ids"]["next"]
+            if semester_id is None:
                 raise ValueError(
                     "Семестр next не настроен (проверьте next_semester_code)"
                 )
-            return semester.pk
+            return semester_id
         if lowered == "actual":
-            semester = cls.get_active()
-            if semester is None:
+            semester_id = setting_map["ids"]["active"]
+            if semester_id is None:
                 raise ValueError(
                     "Семестр actual не настроен (проверьте active_semester_code)"
                 )
-            return semester.pk
+            return semester_id
 
         try:
             pk = int(value)
@@ -306,6 +352,6 @@ class Semester(models.Model):
             ) from err
         if pk <= 0:
             raise ValueError(f"Некорректный semester_id: {pk}")
-        if not cls.objects.filter(pk=pk).exists():
+        if pk not in setting_map["semester_ids"]:
             raise ValueError(f"Семестр с id={pk} не найден")
         return pk
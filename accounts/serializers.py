@@ -9,8 +9,7 @@ from django.utils.encoding import force_bytes
 from django.utils.http import urlsafe_base64_decode, urlsafe_base64_encode
 from rest_framework import serializers
 
-from showcase.models import Institute
-
+from .cache import get_department_institute_map
 from .models import AcademicYear, Department, RegistrationRequest, Role, Semester, User
 
 
@@ -99,24 +98,40 @@ class UserSerializer(serializers.ModelSerializer):
     def get_institute_code(self, obj: User) -> str | None:
         """Возвращает код института, сопоставленного с подразделением пользователя.
 
+        Берётся первый по позиции активный институт подразделения: из
+        prefetch ``department__institutes``, если он выполнен, иначе из
+        кешированной карты институтов подразделений — без запроса к БД.
         Если у пользователя нет подразделения или нет подходящего института,
         возвращает None.
         """
-        department = getattr(obj, "department", None)
-        if not department:
+        if not obj.department_id:
             return None
 
-        # Ищем первый активный институт, связанный с этим подразделением.
-        institute = (
-            Institute.objects.filter(department=department, is_active=True)
-            .order_by("position")
-            .only("code")
-            .first()
+        department_field = User._meta.get_field("department")
+        department = obj.department if department_field.is_cached(obj) else None
+        prefetched = getattr(department, "_prefetched_objects_cache", {})
+        if "institutes" in prefetched:
+            institutes = [i for i in prefetched["institutes"] if i.is_active]
+            if not institutes:
+                return None
+            return min(institutes, key=lambda i: (i.position, i.code)).code
+
+        codes = get_department_institute_map().department_institutes.get(
+            obj.department_id, ()
         )
-        return institute.code if institute else None
+        return codes[0] if codes else None
 
 
 class CustomResetPasswordForm(_PasswordResetForm):
+    def get_users(self, email):
+        """Активные пользователи с этим email, в том числе ещё без пароля.
+
+        Пользователи из одобренных заявок на регистрацию создаются без
+        пароля; если ссылка из письма об одобрении истекла, задать пароль
+        можно только через восстановление.
+        """
+        return User._default_manager.filter(email__iexact=email, is_active=True)
+
     def save(self, request=None, **kwargs):
         email = self.cleaned_data["email"]
         token_generator = kwargs.get("token_generator", default_token_generator)
@@ -305,3 +320,15 @@ class ApproveRequestSerializer(serializers.Serializer):
 
 class RejectRequestSerializer(serializers.Serializer):
     reason = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+
+class BulkApproveRequestSerializer(ApproveRequestSerializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000
+    )
+
+
+class BulkRejectRequestSerializer(RejectRequestSerializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000
+    )
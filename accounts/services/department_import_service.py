@@ -0,0 +1,84 @@
+"""Синхронизация справочников подразделений и институтов из файлов."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from accounts.models import Department
+from core.bulk_import import BulkUpsert, ImportResult, build_lookup
+
+
+@dataclass(frozen=True)
+class DepartmentRecord:
+    name: str
+    short_name: str
+    parent_name: str | None
+    can_save_project_applications: bool = False
+
+
+@dataclass(frozen=True)
+class InstituteRecord:
+    code: str
+    name: str
+    position: int
+    is_active: bool
+    department_id: int | None
+
+
+def upsert_departments(
+    records: list[DepartmentRecord],
+    update_can_save: bool = True,
+    delete_missing: bool = False,
+) -> tuple[ImportResult, list[str]]:
+    """Синхронизирует подразделения по названию в два прохода.
+
+    Первый проход создаёт и обновляет подразделения, второй — проставляет
+    родителей (родитель может быть описан в файле ниже дочернего).
+
+    Returns:
+        tuple: итог импорта и список предупреждений
+    """
+    fields = ["short_name"]
+    if update_can_save:
+        fields.append("can_save_project_applications")
+    engine = BulkUpsert(Department, "name", fields)
+    plan = engine.plan(
+        [
+            {
+                "name": r.name,
+                "short_name": r.short_name,
+                **(
+                    {"can_save_project_applications": r.can_save_project_applications}
+                    if update_can_save
+                    else {}
+                ),
+            }
+            for r in records
+        ],
+        delete_missing=delete_missing,
+    )
+    created = {obj.name for obj in plan.to_create}
+    updated = {obj.name for obj in plan.to_update}
+    result = engine.apply(plan)
+
+    ids_by_name = build_lookup(Department.objects.all(), "name")
+    warnings: list[str] = []
+    parent_records = []
+    for r in records:
+        parent_id = None
+        if r.parent_name:
+            parent_id = ids_by_name.get(r.parent_name)
+            if parent_id is None:
+                warnings.append(
+                    f"Для подразделения '{r.name}' не найден родитель '{r.parent_name}'"
+                )
+                continue
+        parent_records.append({"name": r.name, "parent_id": parent_id})
+
+    parents_plan = BulkUpsert(Department, "name", ["parent_id"]).plan(parent_records)
+    updated |= {obj.name for obj in parents_plan.to_update} - created
+    BulkUpsert(Department, "name", ["parent_id"]).apply(parents_plan)
+
+    result.updated = len(updated)
+    result.unchanged = len(records) - len(created) - len(updated)
+    return result, warnings
@@ -0,0 +1,202 @@
+"""Пакетная обработка заявок на регистрацию."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.tokens import default_token_generator
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+from accounts.models import Department, RegistrationRequest, Role, User
+from core.outbox import OutgoingEmail, enqueue_emails
+
+BATCH_SIZE = 500
+
+
+class BulkRegistrationError(ValueError):
+    """Часть заявок не прошла проверку; ничего не изменено.
+
+    Attributes:
+        errors: ID заявки -> описание ошибки
+    """
+
+    def __init__(self, errors: dict[int, str]):
+        super().__init__("Некоторые заявки не могут быть обработаны.")
+        self.errors = errors
+
+
+def build_set_password_url(user: User) -> str:
+    """Ссылка на страницу задания пароля (та же, что при сбросе пароля)."""
+    uid = urlsafe_base64_encode(force_bytes(user.pk))
+    token = default_token_generator.make_token(user)
+    return f"{settings.FRONT_END}/reset-password/{uid}/{token}"
+
+
+class RegistrationBulkService:
+    """Одобрение и отклонение заявок пачкой.
+
+    Все заявки проверяются за один проход; при любой ошибке ничего не
+    меняется. Пользователи создаются одним bulk_create, заявки обновляются
+    одним bulk_update, а письма ставятся в очередь EmailOutbox в той же
+    транзакции и отправляются командой send_outbox_emails.
+
+    Пароль в письме не передаётся: пользователь создаётся без пароля и
+    получает ссылку для его задания (действует PASSWORD_RESET_TIMEOUT,
+    затем пароль задаётся через восстановление).
+    """
+
+    @transaction.atomic
+    def approve(
+        self,
+        request_ids: Iterable[int],
+        role: Role,
+        actor: User,
+        department: Department | None = None,
+    ) -> list[RegistrationRequest]:
+        """Одобряет заявки и создаёт пользователей.
+
+        Args:
+            request_ids: ID заявок
+            role: Роль новых пользователей
+            actor: Кто одобряет
+            department: Подразделение вместо указанного в заявках
+
+        Raises:
+            BulkRegistrationError: Если хотя бы одна заявка не подходит
+        """
+        requests, errors = self._lock_submitted(request_ids)
+        emails = {
+            req.pk: User.objects.normalize_email(req.email) for req in requests
+        }
+        existing = set(
+            User.objects.filter(email__in=emails.values()).values_list(
+                "email", flat=True
+            )
+        )
+        seen: set[str] = set()
+        for pk, email in emails.items():
+            if email in existing:
+                errors[pk] = "Пользователь с таким email уже существует."
+            elif email in seen:
+                errors[pk] = "Email повторяется среди выбранных заявок."
+            seen.add(email)
+        if errors:
+            raise BulkRegistrationError(errors)
+
+        users = User.objects.bulk_create(
+            [
+                User(
+                    email=emails[req.pk],
+                    password=make_password(None),
+                    first_name=req.first_name,
+                    last_name=req.last_name,
+                    middle_name=req.middle_name,
+                    role=role,
+                    department_id=department.pk if department else req.department_id,
+                    phone=req.phone,
+                )
+                for req in requests
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+        now = timezone.now()
+        for req in requests:
+            if department is not None:
+                req.department_id = department.pk
+            req.role = role
+            req.status = RegistrationRequest.Status.APPROVED
+            req.actor = actor
+            req.updated_at = now
+        RegistrationRequest.objects.bulk_update(
+            requests,
+            ["department", "role", "status", "actor", "updated_at"],
+            batch_size=BATCH_SIZE,
+        )
+
+        subject = render_to_string("registration/approved_subject.txt").strip()
+        enqueue_emails(
+            OutgoingEmail(
+                to_email=req.email,
+                subject=subject,
+                body=render_to_string(
+                    "registration/approved_link_body.txt",
+                    {
+                        "last_name": req.last_name,
+                        "first_name": req.first_name,
+                        "email": user.email,
+                        "set_password_url": build_set_password_url(user),
+                    },
+                ),
+            )
+            for req, user in zip(requests, users)
+        )
+        return requests
+
+    @transaction.atomic
+    def reject(
+        self, request_ids: Iterable[int], actor: User, reason: str = ""
+    ) -> list[RegistrationRequest]:
+        """Отклоняет заявки и ставит в очередь уведомления.
+
+        Raises:
+            BulkRegistrationError: Если хотя бы одна заявка не подходит
+        """
+        requests, errors = self._lock_submitted(request_ids)
+        if errors:
+            raise BulkRegistrationError(errors)
+
+        now = timezone.now()
+        for req in requests:
+            req.status = RegistrationRequest.Status.REJECTED
+            req.actor = actor
+            req.reason = reason
+            req.updated_at = now
+        RegistrationRequest.objects.bulk_update(
+            requests, ["status", "actor", "reason", "updated_at"], batch_size=BATCH_SIZE
+        )
+
+        subject = render_to_string("registration/rejected_subject.txt").strip()
+        enqueue_emails(
+            OutgoingEmail(
+                to_email=req.email,
+                subject=subject,
+                body=render_to_string(
+                    "registration/rejected_body.txt",
+                    {
+                        "last_name": req.last_name,
+                        "first_name": req.first_name,
+                        "reason": reason,
+                    },
+                ),
+            )
+            for req in requests
+        )
+        return requests
+
+    @staticmethod
+    def _lock_submitted(
+        request_ids: Iterable[int],
+    ) -> tuple[list[RegistrationRequest], dict[int, str]]:
+        """Блокирует заявки; возвращает подходящие и ошибки по остальным ID."""
+        ids = list(dict.fromkeys(request_ids))
+        found = {
+            req.pk: req
+            for req in RegistrationRequest.objects.select_for_update().filter(
+                pk__in=ids
+            )
+        }
+        errors = {}
+        for pk in ids:
+            req = found.get(pk)
+            if req is None:
+                errors[pk] = "Заявка не найдена."
+            elif req.status != RegistrationRequest.Status.SUBMITTED:
+                errors[pk] = "Заявка уже обработана."
+        return [found[pk] for pk in ids if pk not in errors], errors
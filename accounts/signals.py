@@ -0,0 +1,43 @@
+"""Сигналы accounts: инвалидация кешей при изменении справочников."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.cache import (
+    invalidate_all_principals,
+    invalidate_department_institutes,
+    invalidate_user_principal,
+)
+from accounts.models import Department, Role, Semester, Settings, User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance: User, **kwargs) -> None:
+    """Сбрасывает кешированный principal пользователя."""
+    invalidate_user_principal(instance.pk)
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def invalidate_principals_cache(sender, **kwargs) -> None:
+    """Роль или подразделение входят в principal любого пользователя."""
+    invalidate_all_principals()
+
+
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+def invalidate_department_institutes_map(sender, **kwargs) -> None:
+    """Родители подразделений входят в карту институтов подразделений."""
+    invalidate_department_institutes()
+
+
+@receiver(post_save, sender=Settings)
+@receiver(post_delete, sender=Settings)
+@receiver(post_save, sender=Semester)
+@receiver(post_delete, sender=Semester)
+def invalidate_semester_map(sender, **kwargs) -> None:
+    """Сбрасывает кеш активного/следующего семестра."""
+    Semester.invalidate_setting_map()
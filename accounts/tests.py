@@ -570,7 +570,7 @@ class AccountsApiTests(TestCase):
         response = self.client.get("/api/accounts/semesters/")
         self.assertEqual(response.status_code, 200)
 
-        by_code = {item["code"]: item["is_active"] for item in response.data}
+        by_code = {item["code"]: item["is_active"] for item in response.data["results"]}
         self.assertFalse(by_code["old"])
         self.assertTrue(by_code["current"])
 
@@ -25,3 +25,38 @@ def get_root_department(department: Optional[Department]) -> Optional[Department
         current = current.parent
 
     return current
+
+
+def get_user_department_with_parent(user) -> Optional[Department]:
+    """Возвращает подразделение пользователя с загруженным родителем.
+
+    Если подразделение и его родитель уже загружены (например, principal из
+    CachedJWTAuthentication получен через select_related), запрос к БД не
+    выполняется. Иначе подразделение загружается одним запросом и
+    подставляется в ``user.department``.
+
+    Args:
+        user: Пользователь (может быть анонимным)
+
+    Returns:
+        Подразделение пользователя или None
+    """
+    if not getattr(user, "is_authenticated", False):
+        return None
+    department_id = getattr(user, "department_id", None)
+    if not department_id:
+        return None
+
+    department_field = user._meta.get_field("department")
+    if department_field.is_cached(user):
+        department = user.department
+        parent_field = Department._meta.get_field("parent")
+        if department.parent_id is None or parent_field.is_cached(department):
+            return department
+
+    department = (
+        Department.objects.select_related("parent").filter(pk=department_id).first()
+    )
+    if department is not None:
+        user.department = department
+    return department
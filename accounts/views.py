@@ -2,7 +2,6 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core import mail
 from django.db import transaction
-from django.db.models import Prefetch
 from django.template.loader import render_to_string
 from django.utils.crypto import get_random_string
 from rest_framework import decorators, permissions, status, viewsets
@@ -13,12 +12,15 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
 
-from showcase.models import Institute
+from core.pagination import LegacyCompatibleCursorPagination
 
+from .cache import get_cached_profile
 from .models import Department, RegistrationRequest, Role, Semester, User
 from .permissions import IsAdminOrCpds, IsCpdsUser, RegistrationRequestManagePermission
 from .serializers import (
     ApproveRequestSerializer,
+    BulkApproveRequestSerializer,
+    BulkRejectRequestSerializer,
     DepartmentSerializer,
     PasswordChangeSerializer,
     PasswordResetConfirmSerializer,
@@ -30,23 +32,30 @@ from .serializers import (
     SemesterSerializer,
     UserSerializer,
 )
+from .services.registration_service import (
+    BulkRegistrationError,
+    RegistrationBulkService,
+)
+
+
+def get_user_profile(user_id) -> dict:
+    """Данные профиля (UserSerializer) из кеша или одним запросом к БД.
+
+    Код института берётся из кешированной карты подразделение → институты,
+    поэтому prefetch институтов не нужен.
+    """
+
+    def build() -> dict:
+        user = User.objects.select_related("department", "role").get(pk=user_id)
+        return dict(UserSerializer(user).data)
+
+    return get_cached_profile(user_id, build)
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
-        # Используем select_related и prefetch_related для оптимизации
-        user = (
-            User.objects.select_related("department", "role")
-            .prefetch_related(
-                Prefetch(
-                    "department__institutes",
-                    queryset=Institute.objects.filter(is_active=True),
-                )
-            )
-            .get(pk=self.user.pk)
-        )
-        data["user"] = UserSerializer(user).data
+        data["user"] = get_user_profile(self.user.pk)
         return data
 
 
@@ -60,19 +69,8 @@ class LoginView(TokenObtainPairView):
 
 class UserMeView(APIView):
     def get(self, request):
-        # Используем select_related и prefetch_related для оптимизации запроса
-        user = (
-            User.objects.select_related("department", "role")
-            .prefetch_related(
-                Prefetch(
-                    "department__institutes",
-                    queryset=Institute.objects.filter(is_active=True),
-                )
-            )
-            .get(pk=request.user.pk)
-        )
-        serializer = UserSerializer(user)
-        return Response(serializer.data)
+        # Фронтенд запрашивает профиль при каждой навигации — отдаём из кеша
+        return Response(get_user_profile(request.user.pk))
 
 
 class PasswordResetView(APIView):
@@ -126,12 +124,14 @@ class DepartmentViewSet(viewsets.ReadOnlyModelViewSet):
     Список подразделений должен быть доступен всем пользователям (AllowAny),
     чтобы пользователь мог выбрать своё подразделение ещё до авторизации.
     Другие действия (detail) по умолчанию требуют авторизации.
+    Список отдаётся курсорной пагинацией; ``?legacy=true`` — весь список массивом.
     """
 
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     permission_classes = [permissions.IsAuthenticated]
-    pagination_class = None
+    pagination_class = LegacyCompatibleCursorPagination
+    cursor_ordering = ("id",)
 
     def get_permissions(self):
         """Для list используем AllowAny, остальные действия требуют авторизации."""
@@ -155,7 +155,8 @@ class SemesterViewSet(viewsets.ModelViewSet):
     queryset = Semester.objects.select_related("academic_year").order_by("position")
     serializer_class = SemesterSerializer
     permission_classes = [permissions.IsAuthenticated]
-    pagination_class = None
+    pagination_class = LegacyCompatibleCursorPagination
+    cursor_ordering = ("position", "id")
 
     def get_serializer_context(self):
         """Один запрос к Settings на ответ — код активного семестра для is_active."""
@@ -175,7 +176,7 @@ class RegistrationRequestViewSet(viewsets.ModelViewSet):
     queryset = RegistrationRequest.objects.select_related("department", "actor").all()
     permission_classes = [RegistrationRequestManagePermission]
     filterset_fields = ["status"]
-    pagination_class = None
+    pagination_class = LegacyCompatibleCursorPagination
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -329,3 +330,68 @@ class RegistrationRequestViewSet(viewsets.ModelViewSet):
             RegistrationRequestSerializer(reg_request).data,
             status=status.HTTP_200_OK,
         )
+
+    @decorators.action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-approve",
+        permission_classes=[permissions.IsAdminUser | IsCpdsUser],
+    )
+    def bulk_approve(self, request):
+        """Одобрение пачки заявок: {"ids": [...], "role_id": ..., "department_id"?}.
+
+        Если хотя бы одна заявка не подходит, ничего не меняется и в ответе
+        возвращаются ошибки по ID. Письма со ссылкой для задания пароля
+        ставятся в очередь и отправляются командой send_outbox_emails.
+        """
+        serializer = BulkApproveRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            approved = RegistrationBulkService().approve(
+                data["ids"],
+                role=Role.objects.get(pk=data["role_id"]),
+                actor=request.user,
+                department=data.get("department_id"),
+            )
+        except BulkRegistrationError as exc:
+            return self._bulk_error_response(exc)
+        return self._bulk_response(approved)
+
+    @decorators.action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-reject",
+        permission_classes=[permissions.IsAdminUser | IsCpdsUser],
+    )
+    def bulk_reject(self, request):
+        """Отклонение пачки заявок: {"ids": [...], "reason"?}."""
+        serializer = BulkRejectRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            rejected = RegistrationBulkService().reject(
+                data["ids"], actor=request.user, reason=data.get("reason") or ""
+            )
+        except BulkRegistrationError as exc:
+            return self._bulk_error_response(exc)
+        return self._bulk_response(rejected)
+
+    def _bulk_response(self, processed):
+        queryset = RegistrationRequest.objects.select_related(
+            "department", "actor", "role"
+        ).filter(pk__in=[req.pk for req in processed])
+        return Response(
+            {
+                "results": RegistrationRequestSerializer(queryset, many=True).data,
+                "queued_emails": len(processed),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @staticmethod
+    def _bulk_error_response(exc: BulkRegistrationError):
+        return Response(
+            {"detail": str(exc), "errors": exc.errors},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
@@ -0,0 +1,35 @@
+"""Конфигурация gunicorn.
+
+Профиль по умолчанию — ``gthread``: несколько процессов, в каждом пул
+потоков. Медленная отправка письма или выгрузка занимает один поток, а не
+весь воркер. Запуск::
+
+    gunicorn -c config/gunicorn.conf.py config.wsgi:application
+
+ASGI-профиль (async view списка, карточки заявок и ленты изменений не
+занимают поток на время ожидания) требует ``pip install uvicorn``::
+
+    GUNICORN_WORKER_CLASS=uvicorn.workers.UvicornWorker \\
+        gunicorn -c config/gunicorn.conf.py config.asgi:application
+
+Все параметры переопределяются переменными окружения GUNICORN_*.
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+workers = int(os.getenv("GUNICORN_WORKERS", "3"))
+# Запросы в основном ждут БД, поэтому потоков больше, чем ядер. Каждый поток
+# держит своё соединение с БД: workers * threads <= max_connections PostgreSQL
+# (или размер пула DB_POOL_MAX_SIZE на процесс).
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+# Периодический перезапуск воркеров ограничивает рост памяти
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "200"))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+errorlog = os.getenv("GUNICORN_ERROR_LOG", "-")
@@ -1,8 +1,10 @@
 from datetime import timedelta
+from importlib.util import find_spec
 import os
 from pathlib import Path
 
 from corsheaders.defaults import default_headers, default_methods
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -41,11 +43,15 @@ INSTALLED_APPS = [
     "accounts",
     "showcase",
     "teams",
+    "core",
     "allauth",
     "allauth.account",
 ]
 
 MIDDLEWARE = [
+    "core.middleware.CompressionMiddleware",
+    "core.middleware.QueryInstrumentationMiddleware",
+    "core.middleware.ReplicaRoutingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -91,6 +97,77 @@ DATABASES = {
     }
 }
 
+# Постоянные соединения: воркер переиспользует соединение до DB_CONN_MAX_AGE
+# секунд вместо подключения к PostgreSQL на каждый запрос; перед повторным
+# использованием соединение проверяется (CONN_HEALTH_CHECKS).
+DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = (
+    os.getenv("DB_CONN_HEALTH_CHECKS", "true").lower() == "true"
+)
+
+# Пул соединений в процессе (только PostgreSQL с psycopg 3 и psycopg[pool],
+# необязательная зависимость из requirements.txt) — для воркеров gthread, где
+# потоки одного процесса делят соединения. С пулом постоянные соединения
+# Django отключаются.
+if os.getenv("DB_POOL", "false").lower() == "true":
+    if DATABASES["default"]["ENGINE"] != "django.db.backends.postgresql":
+        raise ImproperlyConfigured(
+            "DB_POOL=true поддерживается только для "
+            "DB_ENGINE=django.db.backends.postgresql"
+        )
+    if find_spec("psycopg") is None or find_spec("psycopg_pool") is None:
+        raise ImproperlyConfigured(
+            "Для DB_POOL=true установите драйвер psycopg 3 с пулом: "
+            'pip install "psycopg[binary,pool]>=3.1.8"'
+        )
+    DATABASES["default"]["CONN_MAX_AGE"] = 0
+    DATABASES["default"]["OPTIONS"] = {
+        "pool": {
+            "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "timeout": int(os.getenv("DB_POOL_TIMEOUT", "10")),
+        }
+    }
+
+# Реплика только для чтения (необязательно). Безопасные запросы API читают
+# с неё, запись и чтение после записи — с основной БД (core.db_router).
+# Незаданные параметры берутся из основной БД.
+if os.environ.get("DB_REPLICA_HOST") or os.environ.get("DB_REPLICA_NAME"):
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": os.environ.get("DB_REPLICA_NAME", DATABASES["default"]["NAME"]),
+        "USER": os.environ.get("DB_REPLICA_USER", DATABASES["default"]["USER"]),
+        "PASSWORD": os.environ.get(
+            "DB_REPLICA_PASSWORD", DATABASES["default"]["PASSWORD"]
+        ),
+        "HOST": os.environ.get("DB_REPLICA_HOST", DATABASES["default"]["HOST"]),
+        "PORT": os.environ.get("DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        # В тестах реплика — та же тестовая БД
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["core.db_router.PrimaryReplicaRouter"]
+
+# Сколько секунд после записи клиент читает с основной БД, а не с реплики
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+
+
+# Кеш. По умолчанию — в памяти процесса. При нескольких воркерах gunicorn
+# используйте общий бэкенд (например, FileBasedCache или Redis), чтобы
+# инвалидация кеша была видна всем воркерам.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", "project-activity"),
+        "TIMEOUT": int(os.getenv("CACHE_TIMEOUT", "300")),
+    }
+}
+# Для кеша в памяти процесса TTL инвалидируемых сигналами записей не больше
+# этого значения (секунды): сигнал сбрасывает запись только в одном воркере
+LOCAL_CACHE_MAX_TTL = int(os.getenv("LOCAL_CACHE_MAX_TTL", "5"))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -144,14 +221,29 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # DRF и JWT настройки
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "accounts.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_FILTER_BACKENDS": ("django_filters.rest_framework.DjangoFilterBackend",),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    # orjson, если установлен (core.renderers); иначе стандартный json
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
 }
 
+# Сжатие ответов (core.middleware.CompressionMiddleware): brotli, если
+# установлен пакет brotli, иначе gzip; ответы меньше MIN_SIZE байт не сжимаются
+RESPONSE_COMPRESSION_ENABLED = (
+    os.getenv("RESPONSE_COMPRESSION_ENABLED", "true").lower() == "true"
+)
+RESPONSE_COMPRESSION_MIN_SIZE = int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "1024"))
+RESPONSE_COMPRESSION_BROTLI_QUALITY = int(
+    os.getenv("RESPONSE_COMPRESSION_BROTLI_QUALITY", "4")
+)
+
 # Кастомная модель пользователя
 AUTH_USER_MODEL = "accounts.User"
 
@@ -161,6 +253,27 @@ SIMPLE_JWT = {
     "REFRESH_TOKEN_LIFETIME": timedelta(days=36500),
 }
 
+# Время жизни кеша пользователя для JWT-аутентификации (секунды, 0 — отключить)
+AUTH_PRINCIPAL_CACHE_TTL = int(os.getenv("AUTH_PRINCIPAL_CACHE_TTL", "60"))
+
+# Время жизни кеша профиля /api/accounts/user/ (секунды, 0 — отключить)
+USER_PROFILE_CACHE_TTL = int(os.getenv("USER_PROFILE_CACHE_TTL", "300"))
+
+# Время жизни кеша справочника тегов (секунды, 0 — отключить)
+TAG_CACHE_TTL = int(os.getenv("TAG_CACHE_TTL", "300"))
+
+# Время жизни кеша карты доступа к институтам (секунды, 0 — отключить)
+INSTITUTE_ACCESS_CACHE_TTL = int(os.getenv("INSTITUTE_ACCESS_CACHE_TTL", "300"))
+
+# С какого числа строк админка показывает оценку из статистики СУБД вместо COUNT(*)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(
+    os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", "10000")
+)
+
+# Лента изменений заявок: максимальное ожидание новых записей и интервал опроса
+CHANGE_FEED_MAX_WAIT = float(os.getenv("CHANGE_FEED_MAX_WAIT", "25"))
+CHANGE_FEED_POLL_INTERVAL = float(os.getenv("CHANGE_FEED_POLL_INTERVAL", "1"))
+
 CORS_ALLOW_ALL_ORIGINS = True
 
 # Разрешаем нестандартный заголовок, который присылает фронтенд (например, 'body')
@@ -203,3 +316,35 @@ FRONT_END_APPLICATION_PATH = os.environ.get(
 
 
 SWAGGER_USE_COMPAT_RENDERERS = False
+
+# Swagger UI и ReDoc загружают заранее построенную схему (core.openapi)
+SWAGGER_SETTINGS = {"SPEC_URL": "openapi-schema"}
+REDOC_SETTINGS = {"SPEC_URL": "openapi-schema"}
+
+# Версия кода для артефактов сборки (по умолчанию — коммит из .git)
+CODE_VERSION = os.getenv("CODE_VERSION", "")
+
+
+# Инструментирование запросов: число SQL-запросов, время ответа, дубликаты.
+# Запросы, превысившие пороги, логируются; статистика по эндпоинтам доступна
+# сотрудникам по адресу /api/core/request-stats/
+QUERY_INSTRUMENTATION = {
+    "ENABLED": os.getenv("QUERY_INSTRUMENTATION_ENABLED", "true").lower() == "true",
+    "SLOW_REQUEST_MS": float(os.getenv("QUERY_SLOW_REQUEST_MS", "500")),
+    "MAX_QUERIES": int(os.getenv("QUERY_MAX_QUERIES", "50")),
+    "DUPLICATE_THRESHOLD": int(os.getenv("QUERY_DUPLICATE_THRESHOLD", "3")),
+}
+
+# Метрики в формате Prometheus (/api/core/metrics/).
+# Для нескольких воркеров gunicorn укажите общий каталог: каждый воркер
+# сохраняет туда свои значения, эндпоинт суммирует их.
+METRICS_MULTIPROC_DIR = os.getenv("METRICS_MULTIPROC_DIR", "")
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "1.0"))
+# IP-адреса, с которых метрики доступны без авторизации (сборщик Prometheus).
+# По умолчанию пусто: за nginx на том же хосте REMOTE_ADDR всегда 127.0.0.1.
+# Запросы с X-Forwarded-For по IP не пропускаются.
+METRICS_ALLOWED_IPS = [
+    ip.strip() for ip in os.getenv("METRICS_ALLOWED_IPS", "").split(",") if ip.strip()
+]
+# Токен сборщика метрик: Authorization: Bearer <METRICS_TOKEN>
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
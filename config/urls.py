@@ -2,19 +2,8 @@ from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import include, path
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-from rest_framework import permissions
 
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Project Activity API",
-        default_version="v1",
-        description="Документация для API проектной деятельности студентов",
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+from core.openapi import openapi_schema, redoc_ui, swagger_ui
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -22,16 +11,10 @@ urlpatterns = [
     path("api/accounts/", include("accounts.urls")),
     path("api/showcase/", include("showcase.urls")),
     path("api/teams/", include("teams.urls")),
-    path(
-        "swagger/",
-        schema_view.with_ui("swagger", cache_timeout=0),
-        name="schema-swagger-ui",
-    ),
-    path(
-        "redoc/",
-        schema_view.with_ui("redoc", cache_timeout=0),
-        name="schema-redoc",
-    ),
+    path("api/core/", include("core.urls")),
+    path("swagger.json", openapi_schema, name="openapi-schema"),
+    path("swagger/", swagger_ui, name="schema-swagger-ui"),
+    path("redoc/", redoc_ui, name="schema-redoc"),
 ]
 
 # Добавляем маршруты для media файлов в режиме разработки
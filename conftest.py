@@ -1,3 +1,4 @@
+from django.core.cache import cache
 import pytest
 
 
@@ -5,3 +6,11 @@ import pytest
 def enable_db_access_for_all_tests(db):
     # Автоматически включаем доступ к базе для всех тестов pytest
     pass
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Кеш не откатывается вместе с транзакцией теста — очищаем его явно
+    cache.clear()
+    yield
+    cache.clear()
@@ -0,0 +1,21 @@
+from django.contrib import admin
+
+from core.models import EmailOutbox
+
+
+@admin.register(EmailOutbox)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    list_display = ("to_email", "subject", "status", "attempts", "created_at", "sent_at")
+    list_filter = ("status",)
+    search_fields = ("to_email", "subject")
+    # Текст не показываем: до отправки в нём может быть ссылка для задания пароля
+    exclude = ("body",)
+    readonly_fields = (
+        "to_email",
+        "subject",
+        "status",
+        "attempts",
+        "last_error",
+        "created_at",
+        "sent_at",
+    )
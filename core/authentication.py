@@ -0,0 +1,30 @@
+"""Аутентификация служебных клиентов (сборщик метрик)."""
+
+from __future__ import annotations
+
+import hmac
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.request import Request
+
+# Значение request.auth для запроса с токеном сборщика метрик
+METRICS_TOKEN_AUTH = "metrics-token"
+
+
+class MetricsTokenAuthentication(BaseAuthentication):
+    """``Authorization: Bearer <METRICS_TOKEN>`` для сборщика Prometheus.
+
+    Пользователь остаётся анонимным, признак доступа — ``request.auth``.
+    Другие Bearer-токены пропускаются дальше (например, JWT сотрудника).
+    """
+
+    def authenticate(self, request: Request):
+        token = getattr(settings, "METRICS_TOKEN", "")
+        header = request.META.get("HTTP_AUTHORIZATION", "")
+        if not token or not header.startswith("Bearer "):
+            return None
+        if not hmac.compare_digest(header[len("Bearer ") :], token):
+            return None
+        return AnonymousUser(), METRICS_TOKEN_AUTH
@@ -0,0 +1,250 @@
+"""Бенчмарк основных эндпоинтов через тестовый клиент Django.
+
+Каждый сценарий выполняется заданное число раз; для каждого запроса
+фиксируются время ответа и число SQL-запросов. Все изменения данных
+(например, одобрение заявок) откатываются по завершении прогона, поэтому
+повторные запуски на одной базе сопоставимы.
+
+В режиме ``reconnect`` соединение с БД закрывается после каждого запроса,
+как при ``CONN_MAX_AGE=0``: сравнение с обычным прогоном показывает
+выигрыш от постоянных соединений. Этот режим работает без общей
+транзакции, поэтому в нём доступны только сценарии чтения.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from itertools import cycle
+import math
+import statistics
+import time
+from typing import Any
+
+from django.db import connection, transaction
+from django.db.backends.signals import connection_created
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import Semester, User
+from core.instrumentation import QueryRecorder
+from showcase.models import ProjectApplication
+
+
+class BenchmarkError(Exception):
+    """Невозможно подготовить сценарий (нет нужных данных)."""
+
+
+@dataclass
+class Scenario:
+    """Сценарий бенчмарка: метод, генератор путей и пользователь."""
+
+    name: str
+    method: str
+    user: User
+    paths: Iterator[str]
+    data: dict[str, Any] = field(default_factory=dict)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Перцентиль методом ближайшего ранга."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _first_user(role_code: str, **filters) -> User:
+    user = (
+        User.objects.filter(role_id=role_code, is_active=True, **filters)
+        .order_by("id")
+        .first()
+    )
+    if user is None:
+        raise BenchmarkError(f"Нет пользователя с ролью {role_code}")
+    return user
+
+
+def _application_ids(limit: int, **filters) -> list[int]:
+    ids = list(
+        ProjectApplication.objects.filter(**filters)
+        .order_by("-id")
+        .values_list("id", flat=True)[:limit]
+    )
+    if not ids:
+        raise BenchmarkError(f"Нет заявок для сценария ({filters})")
+    return ids
+
+
+def _build_list(iterations: int) -> Scenario:
+    return Scenario(
+        "list",
+        "get",
+        _first_user("admin"),
+        cycle(["/api/showcase/project-applications/"]),
+    )
+
+
+def _build_coordination(iterations: int) -> Scenario:
+    user = _first_user("department_validator", department__isnull=False)
+    return Scenario(
+        "coordination",
+        "get",
+        user,
+        cycle(["/api/showcase/project-applications/coordination/"]),
+    )
+
+
+def _build_retrieve(iterations: int) -> Scenario:
+    ids = _application_ids(iterations)
+    return Scenario(
+        "retrieve",
+        "get",
+        _first_user("admin"),
+        cycle([f"/api/showcase/project-applications/{pk}/" for pk in ids]),
+    )
+
+
+def _build_approve(iterations: int) -> Scenario:
+    ids = _application_ids(iterations, status_id="await_cpds")
+    if len(ids) < iterations:
+        raise BenchmarkError(
+            f"Для сценария approve нужно {iterations} заявок в статусе await_cpds"
+        )
+    return Scenario(
+        "approve",
+        "post",
+        _first_user("cpds"),
+        iter([f"/api/showcase/project-applications/{pk}/approve/" for pk in ids]),
+    )
+
+
+def _build_department_plans(iterations: int) -> Scenario:
+    semester = Semester.get_active() or Semester.objects.order_by("position").first()
+    if semester is None:
+        raise BenchmarkError("Нет семестров")
+    return Scenario(
+        "department-plans",
+        "get",
+        _first_user("cpds"),
+        cycle([f"/api/showcase/department-plans/?semester_id={semester.pk}"]),
+    )
+
+
+def _build_tags(iterations: int) -> Scenario:
+    return Scenario(
+        "tags",
+        "get",
+        _first_user("institute_validator", department__isnull=False),
+        cycle(["/api/showcase/tags/"]),
+    )
+
+
+SCENARIOS: dict[str, Callable[[int], Scenario]] = {
+    "list": _build_list,
+    "coordination": _build_coordination,
+    "retrieve": _build_retrieve,
+    "approve": _build_approve,
+    "department-plans": _build_department_plans,
+    "tags": _build_tags,
+}
+
+
+class BenchmarkRunner:
+    """Запускает сценарии и собирает статистику латентности и SQL-запросов."""
+
+    def __init__(
+        self, iterations: int = 50, warmup: int = 5, reconnect: bool = False
+    ) -> None:
+        self.iterations = iterations
+        self.warmup = warmup
+        self.reconnect = reconnect
+
+    def run(self, names: list[str] | None = None) -> dict[str, Any]:
+        """Выполняет сценарии и возвращает отчёт.
+
+        Args:
+            names: Имена сценариев (по умолчанию — все)
+
+        Returns:
+            dict: отчёт вида {"scenarios": {имя: метрики}, ...}
+
+        Raises:
+            BenchmarkError: Если сценарий неизвестен или для него нет данных
+        """
+        names = names or list(SCENARIOS)
+        unknown = set(names) - set(SCENARIOS)
+        if unknown:
+            raise BenchmarkError(f"Неизвестные сценарии: {', '.join(sorted(unknown))}")
+
+        report: dict[str, Any] = {
+            "iterations": self.iterations,
+            "warmup": self.warmup,
+            "database": connection.vendor,
+            "reconnect": self.reconnect,
+            "scenarios": {},
+        }
+        scenarios = [SCENARIOS[name](self.iterations + self.warmup) for name in names]
+        if self.reconnect:
+            writing = [s.name for s in scenarios if s.method != "get"]
+            if writing:
+                raise BenchmarkError(
+                    "Сценарии с записью недоступны в режиме reconnect: "
+                    + ", ".join(writing)
+                )
+        with nullcontext() if self.reconnect else transaction.atomic():
+            for scenario in scenarios:
+                report["scenarios"][scenario.name] = self._run_scenario(scenario)
+            if not self.reconnect:
+                transaction.set_rollback(True)
+        return report
+
+    def _run_scenario(self, scenario: Scenario) -> dict[str, Any]:
+        client = APIClient()
+        token = RefreshToken.for_user(scenario.user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        request = getattr(client, scenario.method)
+
+        durations: list[float] = []
+        queries: list[int] = []
+        status_codes: dict[str, int] = {}
+        opened = [0]
+
+        def count_connection(sender, **kwargs):
+            opened[0] += 1
+
+        connection_created.connect(count_connection)
+        try:
+            for index in range(self.warmup + self.iterations):
+                if index == self.warmup:
+                    opened[0] = 0
+                path = next(scenario.paths)
+                recorder = QueryRecorder()
+                with connection.execute_wrapper(recorder):
+                    started = time.perf_counter()
+                    response = request(path, scenario.data, format="json")
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                if self.reconnect:
+                    connection.close()
+                if index < self.warmup:
+                    continue
+                durations.append(elapsed_ms)
+                queries.append(recorder.count)
+                key = str(response.status_code)
+                status_codes[key] = status_codes.get(key, 0) + 1
+        finally:
+            connection_created.disconnect(count_connection)
+
+        return {
+            "requests": len(durations),
+            "p50_ms": round(percentile(durations, 50), 3),
+            "p95_ms": round(percentile(durations, 95), 3),
+            "max_ms": round(max(durations, default=0.0), 3),
+            "mean_ms": round(statistics.fmean(durations), 3) if durations else 0.0,
+            "queries_p50": percentile(queries, 50),
+            "queries_max": max(queries, default=0),
+            "connections_opened": opened[0],
+            "status_codes": status_codes,
+        }
@@ -0,0 +1,267 @@
+"""Множественный импорт справочников из CSV/Excel.
+
+Команды импорта читают файл один раз в список типизированных записей,
+разрешают внешние ключи через заранее загруженные словари и передают
+записи в :class:`BulkUpsert`. Тот сравнивает их с текущим содержимым
+таблицы (одним запросом), строит план изменений и применяет его пачками
+через ``bulk_create`` / ``bulk_update``. Сигналы моделей при этом не
+вызываются — зависимые кеши команды сбрасывают явно.
+
+pandas импортируется внутри функций чтения и записи файлов: модуль
+подключается всеми командами импорта, а pandas нужен только им.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, is_dataclass
+import os
+from typing import Any
+
+from django.db import models, transaction
+from django.db.models import ProtectedError
+
+DEFAULT_BATCH_SIZE = 500
+
+
+class ImportDataError(Exception):
+    """Некорректные данные во входном файле."""
+
+
+def resolve_command_file(command_file: str, file_path: str) -> str:
+    """Относительный путь считается от каталога команды."""
+    if os.path.isabs(file_path):
+        return file_path
+    return os.path.join(os.path.dirname(os.path.abspath(command_file)), file_path)
+
+
+def read_table(
+    file_path: str, required_columns: Iterable[str] = ()
+) -> list[dict[str, Any]]:
+    """Читает CSV или Excel целиком и возвращает строки в виде словарей.
+
+    Пустые ячейки заменяются на ``None``.
+
+    Raises:
+        ImportDataError: Если в файле нет обязательных столбцов
+    """
+    import pandas as pd
+
+    if file_path.lower().endswith(".csv"):
+        df = pd.read_csv(file_path)
+    else:
+        df = pd.read_excel(file_path)
+    missing = set(required_columns) - set(df.columns)
+    if missing:
+        raise ImportDataError(
+            f"В файле '{file_path}' отсутствуют обязательные столбцы: "
+            f"{', '.join(sorted(missing))}"
+        )
+    df = df.astype(object).where(pd.notnull(df), None)
+    return df.to_dict("records")
+
+
+def write_excel(file_path: str, rows: list[dict[str, Any]]) -> None:
+    """Сохраняет строки в Excel (столбцы — ключи словарей)."""
+    import pandas as pd
+
+    pd.DataFrame(rows).to_excel(file_path, index=False)
+
+
+def clean_str(value: Any) -> str:
+    """Строковое значение ячейки без пробелов по краям (``None`` → "")."""
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def parse_bool(value: Any, default: bool = False) -> bool:
+    """Булево значение ячейки: поддерживает true/false, да/нет, 1/0."""
+    if value is None:
+        return default
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if not normalized:
+            return default
+        return normalized in {"1", "true", "yes", "да", "y"}
+    return bool(value)
+
+
+@contextmanager
+def import_transaction(dry_run: bool) -> Iterator[None]:
+    """Транзакция импорта; в пробном режиме все изменения откатываются."""
+    with transaction.atomic():
+        yield
+        if dry_run:
+            transaction.set_rollback(True)
+
+
+@dataclass
+class UpsertPlan:
+    """План изменений таблицы, построенный :meth:`BulkUpsert.plan`."""
+
+    to_create: list[models.Model] = field(default_factory=list)
+    to_update: list[models.Model] = field(default_factory=list)
+    unchanged: int = 0
+    to_delete: list[Any] = field(default_factory=list)
+
+
+@dataclass
+class ImportResult:
+    """Итог применения плана."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    protected: list[Any] = field(default_factory=list)
+
+    def summary(self) -> str:
+        """Краткая сводка изменений для вывода в консоль."""
+        return (
+            f"Создано: {self.created}, обновлено: {self.updated}, "
+            f"без изменений: {self.unchanged}, удалено: {self.deleted}."
+        )
+
+
+class BulkUpsert:
+    """Синхронизация таблицы со списком записей по ключевому полю.
+
+    Args:
+        model: Модель Django
+        key: Поле, по которому запись из файла сопоставляется со строкой БД
+        fields: Обновляемые поля (для внешних ключей — ``<имя>_id``)
+        batch_size: Размер пачки для bulk-операций
+    """
+
+    def __init__(
+        self,
+        model: type[models.Model],
+        key: str,
+        fields: Sequence[str],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self.model = model
+        self.key = key
+        self.fields = list(fields)
+        self.batch_size = batch_size
+        self._key_is_unique = model._meta.get_field(key).unique
+
+    def plan(
+        self,
+        records: Iterable[Any],
+        delete_missing: bool = False,
+        queryset: models.QuerySet | None = None,
+    ) -> UpsertPlan:
+        """Сравнивает записи с содержимым таблицы.
+
+        Args:
+            records: Записи (dataclass или словари с ключом и полями)
+            delete_missing: Удалять строки, ключей которых нет среди записей
+            queryset: Ограничение сравниваемых строк (по умолчанию — вся таблица)
+
+        Raises:
+            ImportDataError: Если ключ повторяется среди записей
+        """
+        if queryset is None:
+            queryset = self.model._default_manager.all()
+        existing = {
+            getattr(obj, self.key): obj
+            for obj in queryset.only(self.model._meta.pk.attname, self.key, *self.fields)
+        }
+
+        result = UpsertPlan()
+        seen: set[Any] = set()
+        for record in records:
+            values = asdict(record) if is_dataclass(record) else dict(record)
+            key_value = values[self.key]
+            if key_value in seen:
+                raise ImportDataError(f"Значение '{key_value}' повторяется в файле")
+            seen.add(key_value)
+
+            obj = existing.get(key_value)
+            if obj is None:
+                result.to_create.append(self.model(**values))
+                continue
+            changed = False
+            for name in self.fields:
+                if getattr(obj, name) != values[name]:
+                    setattr(obj, name, values[name])
+                    changed = True
+            if changed:
+                result.to_update.append(obj)
+            else:
+                result.unchanged += 1
+
+        if delete_missing:
+            result.to_delete = [key for key in existing if key not in seen]
+        return result
+
+    def apply(self, plan: UpsertPlan) -> ImportResult:
+        """Применяет план пачками; строки с защищёнными связями не удаляются."""
+        if plan.to_create:
+            if self._key_is_unique:
+                # Конфликт возможен, если строку успели создать параллельно
+                self.model._default_manager.bulk_create(
+                    plan.to_create,
+                    batch_size=self.batch_size,
+                    update_conflicts=True,
+                    unique_fields=[self.key],
+                    update_fields=self.fields,
+                )
+            else:
+                self.model._default_manager.bulk_create(
+                    plan.to_create, batch_size=self.batch_size
+                )
+        if plan.to_update:
+            self.model._default_manager.bulk_update(
+                plan.to_update, self.fields, batch_size=self.batch_size
+            )
+        deleted, protected = self._delete(plan.to_delete)
+        return ImportResult(
+            created=len(plan.to_create),
+            updated=len(plan.to_update),
+            unchanged=plan.unchanged,
+            deleted=deleted,
+            protected=protected,
+        )
+
+    def run(
+        self,
+        records: Iterable[Any],
+        delete_missing: bool = False,
+        queryset: models.QuerySet | None = None,
+    ) -> ImportResult:
+        """Строит план и сразу применяет его."""
+        return self.apply(self.plan(records, delete_missing, queryset))
+
+    def _delete(self, keys: list[Any]) -> tuple[int, list[Any]]:
+        manager = self.model._default_manager
+        deleted = 0
+        protected: list[Any] = []
+        for start in range(0, len(keys), self.batch_size):
+            batch = keys[start : start + self.batch_size]
+            try:
+                with transaction.atomic():
+                    manager.filter(**{f"{self.key}__in": batch}).delete()
+                deleted += len(batch)
+                continue
+            except ProtectedError:
+                pass
+            # В пачке есть защищённые строки — удаляем по одной
+            for key in batch:
+                try:
+                    with transaction.atomic():
+                        manager.filter(**{self.key: key}).delete()
+                    deleted += 1
+                except ProtectedError:
+                    protected.append(key)
+        return deleted, protected
+
+
+def build_lookup(
+    queryset: models.QuerySet, key_field: str, value_field: str = "pk"
+) -> Mapping[Any, Any]:
+    """Словарь ``key_field → value_field`` одним запросом."""
+    return dict(queryset.values_list(key_field, value_field))
@@ -0,0 +1,37 @@
+"""Общие правила времени жизни записей кеша.
+
+Записи кеша (principal, профиль, теги, карта доступа, настройки семестров)
+инвалидируются сигналами. Для кеша в памяти процесса (LocMemCache) сигнал
+сбрасывает запись только в том воркере, где произошло изменение, поэтому
+для таких бэкендов TTL ограничивается ``LOCAL_CACHE_MAX_TTL`` секундами.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+
+# Бэкенды, не разделяемые между процессами
+PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def is_shared_cache(alias: str = "default") -> bool:
+    """Видят ли все воркеры одни и те же записи кеша."""
+    backend = settings.CACHES.get(alias, {}).get("BACKEND", "")
+    return backend not in PROCESS_LOCAL_BACKENDS
+
+
+def cache_ttl(ttl: int, alias: str = "default") -> int:
+    """TTL с учётом бэкенда: для кеша в памяти процесса — не больше лимита.
+
+    Args:
+        ttl: Желаемое время жизни в секундах (0 — кеш отключён)
+
+    Returns:
+        int: Время жизни для cache.set
+    """
+    if ttl <= 0 or is_shared_cache(alias):
+        return ttl
+    return min(ttl, int(getattr(settings, "LOCAL_CACHE_MAX_TTL", 5)))
@@ -0,0 +1,125 @@
+"""Маршрутизация чтения на реплику БД.
+
+Если в ``settings.DATABASES`` задан псевдоним ``replica``, безопасные
+запросы (GET/HEAD/OPTIONS) читают с реплики, всё остальное идёт в
+``default``. Решение принимает :class:`ReplicaRoutingMiddleware`
+(core.middleware) и сохраняет его в контекстной переменной на время
+запроса; вне HTTP-запросов (команды, shell) чтение всегда с основной БД.
+
+Чтобы не показывать пользователю устаревшие данные:
+
+* после первой записи в рамках запроса все последующие чтения этого
+  запроса идут в ``default`` (read-after-write);
+* после запроса с записью клиент на ``REPLICA_STICKY_SECONDS`` секунд
+  «прилипает» к основной БД — реплика успевает догнать изменения.
+"""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+from dataclasses import dataclass
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICA_DB_ALIAS = "replica"
+STICKY_PRIMARY_KEY = "core:db:sticky_primary:{client}"
+
+
+@dataclass
+class RoutingState:
+    """Состояние маршрутизации в рамках одного запроса."""
+
+    use_replica: bool = False
+    wrote: bool = False
+
+
+_state: ContextVar[RoutingState | None] = ContextVar("db_routing_state", default=None)
+
+
+def replica_configured() -> bool:
+    """Задан ли псевдоним реплики в настройках."""
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+def get_sticky_seconds() -> int:
+    """Сколько секунд после записи клиент читает с основной БД."""
+    return int(getattr(settings, "REPLICA_STICKY_SECONDS", 5))
+
+
+def begin_request(use_replica: bool):
+    """Открывает состояние маршрутизации запроса, возвращает токен для сброса."""
+    return _state.set(RoutingState(use_replica=use_replica))
+
+
+def allow_replica_reads() -> None:
+    """Разрешает текущему запросу читать с реплики."""
+    state = _state.get()
+    if state is not None:
+        state.use_replica = True
+
+
+def end_request(token) -> RoutingState | None:
+    """Закрывает состояние запроса и возвращает его."""
+    state = _state.get()
+    _state.reset(token)
+    return state
+
+
+def client_key(request) -> str | None:
+    """Идентификатор клиента для «прилипания» к основной БД.
+
+    Используется хеш заголовка Authorization (JWT) или сессионной cookie:
+    пользователь на этапе middleware ещё не аутентифицирован DRF.
+    """
+    credential = request.META.get("HTTP_AUTHORIZATION") or request.COOKIES.get(
+        settings.SESSION_COOKIE_NAME
+    )
+    if not credential:
+        return None
+    return hashlib.sha256(credential.encode()).hexdigest()[:32]
+
+
+def stick_to_primary(client: str) -> None:
+    """Направляет чтения клиента в основную БД на ``REPLICA_STICKY_SECONDS``."""
+    seconds = get_sticky_seconds()
+    if seconds > 0:
+        cache.set(STICKY_PRIMARY_KEY.format(client=client), True, seconds)
+
+
+def is_sticky_primary(client: str) -> bool:
+    """Недавно ли клиент что-то записывал."""
+    return bool(cache.get(STICKY_PRIMARY_KEY.format(client=client)))
+
+
+class PrimaryReplicaRouter:
+    """Роутер: запись — в ``default``, чтение — по состоянию запроса."""
+
+    def db_for_read(self, model, **hints):
+        if not replica_configured():
+            return None
+        state = _state.get()
+        if state is None or not state.use_replica or state.wrote:
+            # Явно, иначе связанные объекты читались бы из instance._state.db
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Реплика получает схему репликацией с основной БД
+        if db == REPLICA_DB_ALIAS:
+            return False
+        return None
@@ -0,0 +1,257 @@
+"""Инструментирование запросов: число SQL-запросов, время и дубликаты.
+
+Модуль содержит обёртку над выполнением SQL (``connection.execute_wrapper``),
+собирающую статистику в рамках одного HTTP-запроса, и потокобезопасный
+реестр агрегированной статистики по эндпоинтам (гистограммы в памяти
+процесса).
+
+Под ASGI SQL выполняется в потоках ``sync_to_async`` со своими соединениями,
+поэтому обёртку нельзя поставить заранее на соединение запроса. Вместо этого
+на каждое соединение ставится :func:`record_current`, которая передаёт
+запрос рекордеру из контекстной переменной (контекст копируется в потоки
+``sync_to_async``), — см. :func:`enable_context_recording`.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from threading import Lock
+import time
+from typing import Any
+
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# Границы корзин гистограмм: длительность запроса (мс) и число SQL-запросов
+DURATION_BUCKETS_MS: tuple[float, ...] = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_COUNT_BUCKETS: tuple[int, ...] = (1, 2, 5, 10, 20, 50, 100, 200)
+
+# Сколько самых частых дубликатов хранить на эндпоинт
+MAX_DUPLICATES_PER_ENDPOINT = 10
+
+
+@dataclass(frozen=True)
+class InstrumentationSettings:
+    """Настройки инструментирования запросов."""
+
+    enabled: bool = True
+    slow_request_ms: float = 500.0
+    max_queries: int = 50
+    duplicate_threshold: int = 3
+
+
+def get_instrumentation_settings() -> InstrumentationSettings:
+    """Возвращает настройки инструментирования из ``settings.QUERY_INSTRUMENTATION``."""
+    config: dict[str, Any] = getattr(settings, "QUERY_INSTRUMENTATION", {}) or {}
+    defaults = InstrumentationSettings()
+    return InstrumentationSettings(
+        enabled=bool(config.get("ENABLED", defaults.enabled)),
+        slow_request_ms=float(config.get("SLOW_REQUEST_MS", defaults.slow_request_ms)),
+        max_queries=int(config.get("MAX_QUERIES", defaults.max_queries)),
+        duplicate_threshold=int(
+            config.get("DUPLICATE_THRESHOLD", defaults.duplicate_threshold)
+        ),
+    )
+
+
+class QueryRecorder:
+    """Обёртка для ``connection.execute_wrapper``, считающая SQL-запросы.
+
+    Django передаёт в обёртку параметризованный SQL (с плейсхолдерами),
+    поэтому сам текст запроса используется как отпечаток (fingerprint):
+    одинаковый текст означает одинаковую «форму» запроса, что и позволяет
+    находить N+1 без разбора SQL.
+    """
+
+    __slots__ = ("count", "duration", "fingerprints", "aliases", "opened")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.fingerprints: dict[str, int] = {}
+        # Псевдонимы БД, к которым были запросы
+        self.aliases: set[str] = set()
+        # Псевдонимы, соединения с которыми открыты во время записи
+        # (отмечаются только при записи через контекстную переменную)
+        self.opened: set[str] = set()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+            self.fingerprints[sql] = self.fingerprints.get(sql, 0) + 1
+            self.aliases.add(context["connection"].alias)
+
+    def duplicates(self, threshold: int) -> dict[str, int]:
+        """Возвращает запросы, повторившиеся не менее ``threshold`` раз.
+
+        Args:
+            threshold: Минимальное число повторений
+
+        Returns:
+            dict[str, int]: SQL -> количество выполнений
+        """
+        return {sql: n for sql, n in self.fingerprints.items() if n >= threshold}
+
+
+_current_recorder: ContextVar[QueryRecorder | None] = ContextVar(
+    "query_recorder", default=None
+)
+
+
+def start_context_recording(recorder: QueryRecorder):
+    """Делает рекордер текущим для контекста, возвращает токен для сброса."""
+    return _current_recorder.set(recorder)
+
+
+def stop_context_recording(token) -> None:
+    _current_recorder.reset(token)
+
+
+def record_current(execute, sql, params, many, context):
+    """Обёртка соединения: передаёт SQL текущему рекордеру, если он есть."""
+    recorder = _current_recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def _install_record_current(connection) -> None:
+    # В начало списка: execute_wrapper() снимает свою обёртку через pop()
+    if record_current not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_current)
+
+
+def _on_connection_created(sender, connection, **kwargs) -> None:
+    _install_record_current(connection)
+    recorder = _current_recorder.get()
+    if recorder is not None:
+        recorder.opened.add(connection.alias)
+
+
+def enable_context_recording() -> None:
+    """Ставит :func:`record_current` на соединения текущего потока и все новые."""
+    connection_created.connect(
+        _on_connection_created, dispatch_uid="core.instrumentation.record_current"
+    )
+    for connection in connections.all(initialized_only=True):
+        _install_record_current(connection)
+
+
+class EndpointStats:
+    """Агрегированная статистика одного эндпоинта."""
+
+    __slots__ = (
+        "requests",
+        "total_ms",
+        "max_ms",
+        "total_queries",
+        "max_queries",
+        "total_sql_ms",
+        "duration_histogram",
+        "queries_histogram",
+        "duplicates",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.total_queries = 0
+        self.max_queries = 0
+        self.total_sql_ms = 0.0
+        self.duration_histogram = [0] * (len(DURATION_BUCKETS_MS) + 1)
+        self.queries_histogram = [0] * (len(QUERY_COUNT_BUCKETS) + 1)
+        self.duplicates: dict[str, int] = {}
+
+    def add(
+        self,
+        duration_ms: float,
+        query_count: int,
+        sql_ms: float,
+        duplicates: dict[str, int],
+    ) -> None:
+        self.requests += 1
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.total_queries += query_count
+        self.max_queries = max(self.max_queries, query_count)
+        self.total_sql_ms += sql_ms
+        self.duration_histogram[bisect_left(DURATION_BUCKETS_MS, duration_ms)] += 1
+        self.queries_histogram[bisect_left(QUERY_COUNT_BUCKETS, query_count)] += 1
+        for sql, n in duplicates.items():
+            self.duplicates[sql] = max(self.duplicates.get(sql, 0), n)
+        if len(self.duplicates) > MAX_DUPLICATES_PER_ENDPOINT:
+            top = sorted(self.duplicates.items(), key=lambda item: -item[1])
+            self.duplicates = dict(top[:MAX_DUPLICATES_PER_ENDPOINT])
+
+    def to_dict(self) -> dict[str, Any]:
+        requests = self.requests or 1
+        return {
+            "requests": self.requests,
+            "avg_ms": round(self.total_ms / requests, 3),
+            "max_ms": round(self.max_ms, 3),
+            "avg_queries": round(self.total_queries / requests, 3),
+            "max_queries": self.max_queries,
+            "avg_sql_ms": round(self.total_sql_ms / requests, 3),
+            "duration_histogram_ms": _histogram_to_dict(
+                DURATION_BUCKETS_MS, self.duration_histogram
+            ),
+            "queries_histogram": _histogram_to_dict(
+                QUERY_COUNT_BUCKETS, self.queries_histogram
+            ),
+            "duplicate_queries": [
+                {"sql": sql, "max_per_request": n}
+                for sql, n in sorted(self.duplicates.items(), key=lambda item: -item[1])
+            ],
+        }
+
+
+def _histogram_to_dict(bounds, counts: list[int]) -> dict[str, int]:
+    labels = [f"le_{bound:g}" for bound in bounds] + ["le_inf"]
+    return dict(zip(labels, counts))
+
+
+class RequestStatsRegistry:
+    """Потокобезопасный реестр статистики по эндпоинтам (в памяти процесса)."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._endpoints: dict[str, EndpointStats] = {}
+
+    def record(
+        self,
+        endpoint: str,
+        duration_ms: float,
+        query_count: int,
+        sql_ms: float,
+        duplicates: dict[str, int] | None = None,
+    ) -> None:
+        """Добавляет результаты одного запроса в статистику эндпоинта."""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            if stats is None:
+                stats = self._endpoints[endpoint] = EndpointStats()
+            stats.add(duration_ms, query_count, sql_ms, duplicates or {})
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Возвращает копию статистики, отсортированную по имени эндпоинта."""
+        with self._lock:
+            return {
+                endpoint: stats.to_dict()
+                for endpoint, stats in sorted(self._endpoints.items())
+            }
+
+    def reset(self) -> None:
+        """Очищает накопленную статистику."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+request_stats = RequestStatsRegistry()
@@ -0,0 +1,39 @@
+"""Генерация OpenAPI-схемы в STATIC_ROOT при деплое."""
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from core.openapi import (
+    clear_schema_cache,
+    generate_schema,
+    get_code_version,
+    schema_file_path,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Строит OpenAPI-схему API и сохраняет её в STATIC_ROOT/openapi/"
+        "<версия кода>.json; /swagger.json отдаёт этот файл без интроспекции."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            type=str,
+            help="Путь к файлу (по умолчанию — STATIC_ROOT/openapi/<версия>.json)",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["output"]) if options.get("output") else schema_file_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        schema = generate_schema()
+        path.write_bytes(schema)
+        clear_schema_cache()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Схема версии {get_code_version()} сохранена: {path} "
+                f"({len(schema)} байт)"
+            )
+        )
@@ -0,0 +1,77 @@
+"""Профиль запуска Django: время django.setup(), загрузки URL и импортов."""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.startup import HEAVY_MODULES, StartupProfileError, profile_startup
+
+
+class Command(BaseCommand):
+    help = (
+        "Запускает отдельный интерпретатор с python -X importtime, выполняет "
+        "django.setup() и загрузку URL и выводит самые долгие импорты."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=25, help="Сколько модулей показать"
+        )
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Сортировка: суммарное время с зависимостями или собственное",
+        )
+        parser.add_argument(
+            "--json", action="store_true", help="Вывести отчёт в JSON"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            # Общее время — отдельным прогоном: importtime его искажает
+            plain = profile_startup()
+            traced = profile_startup(importtime=True)
+        except StartupProfileError as e:
+            raise CommandError(str(e)) from e
+
+        top = traced.top_imports(options["limit"], by=options["sort"])
+        heavy = [name for name in HEAVY_MODULES if plain.loaded(name)]
+        if options["json"]:
+            report = {
+                "setup_s": round(plain.setup_s, 4),
+                "urls_s": round(plain.urls_s, 4),
+                "total_s": round(plain.total_s, 4),
+                "modules_loaded": len(plain.modules),
+                "heavy_modules_loaded": heavy,
+                "imports": [
+                    {
+                        "module": item.module,
+                        "self_ms": round(item.self_us / 1000, 2),
+                        "cumulative_ms": round(item.cumulative_us / 1000, 2),
+                    }
+                    for item in top
+                ],
+                "packages": [
+                    {"package": name, "self_ms": round(us / 1000, 2)}
+                    for name, us in traced.packages(options["limit"])
+                ],
+            }
+            self.stdout.write(json.dumps(report, ensure_ascii=False, indent=2))
+            return
+
+        self.stdout.write(
+            f"django.setup(): {plain.setup_s * 1000:.0f} мс, "
+            f"загрузка URL: {plain.urls_s * 1000:.0f} мс, "
+            f"модулей: {len(plain.modules)}"
+        )
+        if heavy:
+            self.stdout.write(
+                self.style.WARNING(f"Тяжёлые модули при старте: {', '.join(heavy)}")
+            )
+        self.stdout.write(f"\n{'self, мс':>10} {'всего, мс':>10}  модуль")
+        for item in top:
+            self.stdout.write(
+                f"{item.self_us / 1000:>10.1f} {item.cumulative_us / 1000:>10.1f}  "
+                f"{'  ' * item.depth}{item.module}"
+            )
@@ -0,0 +1,71 @@
+"""Бенчмарк основных эндпоинтов API с отчётом в JSON."""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import SCENARIOS, BenchmarkError, BenchmarkRunner
+
+
+class Command(BaseCommand):
+    help = (
+        "Прогоняет основные эндпоинты (list, coordination, retrieve, approve, "
+        "department-plans, tags) через тестовый клиент Django и выводит "
+        "p50/p95 латентности и число SQL-запросов в JSON. "
+        "Данные для прогона создаёт команда generate_load_data."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=sorted(SCENARIOS),
+            help="Сценарий (можно указать несколько раз; по умолчанию — все)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=50,
+            help="Количество измеряемых запросов на сценарий",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=5,
+            help="Количество прогревочных запросов (не учитываются)",
+        )
+        parser.add_argument(
+            "--reconnect",
+            action="store_true",
+            help=(
+                "Закрывать соединение с БД после каждого запроса (как при "
+                "CONN_MAX_AGE=0); только сценарии чтения"
+            ),
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            help="Сохранить отчёт в файл (иначе вывод в stdout)",
+        )
+
+    def handle(self, *args, **options):
+        if options["iterations"] < 1 or options["warmup"] < 0:
+            raise CommandError("Некорректное число итераций")
+
+        runner = BenchmarkRunner(
+            iterations=options["iterations"],
+            warmup=options["warmup"],
+            reconnect=options["reconnect"],
+        )
+        try:
+            report = runner.run(options.get("scenario"))
+        except BenchmarkError as e:
+            raise CommandError(str(e)) from e
+
+        payload = json.dumps(report, ensure_ascii=False, indent=2)
+        if options.get("output"):
+            Path(options["output"]).write_text(payload + "\n", encoding="utf-8")
+            self.stdout.write(self.style.SUCCESS(f"Отчёт сохранён: {options['output']}"))
+        else:
+            self.stdout.write(payload)
@@ -0,0 +1,53 @@
+"""Бенчмарк размера ответов API и времени сериализации JSON."""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.benchmark import BenchmarkError
+from core.payload_benchmark import READ_SCENARIOS, PayloadBenchmarkRunner
+
+
+class Command(BaseCommand):
+    help = (
+        "Для сценариев чтения сравнивает размер ответа без сжатия, с gzip и "
+        "brotli, а также время рендеринга стандартным JSONRenderer и "
+        "FastJSONRenderer (orjson). Отчёт выводится в JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=READ_SCENARIOS,
+            help="Сценарий (можно указать несколько раз; по умолчанию — все)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Сколько раз рендерить каждый ответ",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            help="Сохранить отчёт в файл (иначе вывод в stdout)",
+        )
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("Некорректное число повторов")
+
+        runner = PayloadBenchmarkRunner(repeat=options["repeat"])
+        try:
+            report = runner.run(options.get("scenario"))
+        except BenchmarkError as e:
+            raise CommandError(str(e)) from e
+
+        payload = json.dumps(report, ensure_ascii=False, indent=2)
+        if options.get("output"):
+            Path(options["output"]).write_text(payload + "\n", encoding="utf-8")
+            self.stdout.write(self.style.SUCCESS(f"Отчёт сохранён: {options['output']}"))
+        else:
+            self.stdout.write(payload)
@@ -0,0 +1,82 @@
+"""Замер пропускной способности запущенного сервера (RPS, латентность)."""
+
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import User
+from core.throughput import ThroughputRunner
+
+DEFAULT_PATHS = (
+    "/api/showcase/project-applications/",
+    "/api/showcase/tags/",
+    "/api/accounts/departments/",
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Нагружает запущенный сервер параллельными GET-запросами и выводит "
+        "RPS и p50/p95 в JSON. Запустите по очереди для каждого профиля "
+        "(sync, gthread, ASGI) и сравните отчёты."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--url", default="http://127.0.0.1:8000", help="Адрес сервера"
+        )
+        parser.add_argument(
+            "--path",
+            action="append",
+            help="Путь для запроса (можно несколько раз; по умолчанию — списки API)",
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=20, help="Одновременных клиентов"
+        )
+        parser.add_argument(
+            "--duration", type=float, default=10.0, help="Длительность, секунды"
+        )
+        parser.add_argument(
+            "--email",
+            help="Пользователь, от имени которого выпускается JWT "
+            "(по умолчанию — первый активный admin)",
+        )
+        parser.add_argument("--label", default="", help="Метка профиля в отчёте")
+        parser.add_argument("--output", type=str, help="Сохранить отчёт в файл")
+
+    def handle(self, *args, **options):
+        if options["concurrency"] < 1 or options["duration"] <= 0:
+            raise CommandError("Некорректные concurrency или duration")
+
+        users = User.objects.filter(is_active=True)
+        if options.get("email"):
+            user = users.filter(email=options["email"]).first()
+        else:
+            user = users.filter(role_id="admin").order_by("id").first()
+        if user is None:
+            raise CommandError("Пользователь для JWT не найден")
+
+        paths = options.get("path") or list(DEFAULT_PATHS)
+        runner = ThroughputRunner(
+            options["url"],
+            concurrency=options["concurrency"],
+            duration=options["duration"],
+            token=str(RefreshToken.for_user(user).access_token),
+        )
+        result = runner.run(paths)
+
+        report = {
+            "label": options["label"],
+            "url": options["url"],
+            "paths": paths,
+            "concurrency": options["concurrency"],
+            **result.to_dict(),
+        }
+        payload = json.dumps(report, ensure_ascii=False, indent=2)
+        if options.get("output"):
+            Path(options["output"]).write_text(payload + "\n", encoding="utf-8")
+            self.stdout.write(self.style.SUCCESS(f"Отчёт сохранён: {options['output']}"))
+        else:
+            self.stdout.write(payload)
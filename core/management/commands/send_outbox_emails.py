@@ -0,0 +1,48 @@
+"""Отправка писем из очереди EmailOutbox."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.outbox import DEFAULT_BATCH_SIZE, DEFAULT_MAX_ATTEMPTS, deliver_pending
+
+
+class Command(BaseCommand):
+    help = (
+        "Отправляет письма из очереди (ссылки для задания пароля при одобрении "
+        "заявок на регистрацию и т.п.). Запускается по расписанию; несколько "
+        "экземпляров могут работать параллельно."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Писем за одну транзакцию (по умолчанию {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=DEFAULT_MAX_ATTEMPTS,
+            help="После стольких неудачных попыток письмо помечается failed",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Максимум писем за запуск (по умолчанию — вся очередь)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1 or options["max_attempts"] < 1:
+            raise CommandError("Некорректные параметры отправки")
+
+        result = deliver_pending(
+            batch_size=options["batch_size"],
+            max_attempts=options["max_attempts"],
+            limit=options["limit"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Отправлено: {result.sent}, отложено: {result.retried}, "
+                f"ошибок: {result.failed}"
+            )
+        )
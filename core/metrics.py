@@ -0,0 +1,357 @@
+"""Реестр метрик с выдачей в текстовом формате Prometheus.
+
+Внешние зависимости не требуются. Каждый процесс хранит значения у себя
+в памяти; если задан ``settings.METRICS_MULTIPROC_DIR``, процесс
+периодически сбрасывает свой снимок в файл этого каталога, а эндпоинт
+метрик суммирует файлы всех процессов. Так счётчики видны целиком при
+нескольких воркерах gunicorn, какой бы воркер ни обработал запрос scrape.
+"""
+
+from __future__ import annotations
+
+import atexit
+from bisect import bisect_left
+import json
+import logging
+import os
+from pathlib import Path
+from threading import RLock
+import time
+from typing import Any
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+COUNTER = "counter"
+HISTOGRAM = "histogram"
+
+
+class Metric:
+    """Базовый класс метрики с набором меток."""
+
+    kind = ""
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+    ) -> None:
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: tuple[Any, ...]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"Метрика {self.name} ожидает метки {self.labelnames}, "
+                f"получено {len(labels)} значений"
+            )
+        return tuple(str(value) for value in labels)
+
+
+class Counter(Metric):
+    """Монотонно возрастающий счётчик."""
+
+    kind = COUNTER
+
+    def inc(self, *labels: Any, amount: float = 1.0) -> None:
+        """Увеличивает счётчик для набора меток."""
+        if amount < 0:
+            raise ValueError("Счётчик не может уменьшаться")
+        key = self._key(labels)
+        with self.registry.lock:
+            values = self.registry.values_for(self)
+            values[key] = values.get(key, 0.0) + amount
+        self.registry.maybe_flush()
+
+
+class Histogram(Metric):
+    """Гистограмма с фиксированными корзинами (кумулятивными при выдаче)."""
+
+    kind = HISTOGRAM
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(registry, name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: Any) -> None:
+        """Учитывает наблюдение ``value`` для набора меток."""
+        key = self._key(labels)
+        with self.registry.lock:
+            values = self.registry.values_for(self)
+            state = values.get(key)
+            if state is None:
+                # [счётчики по корзинам..., +Inf, сумма]
+                state = values[key] = [0.0] * (len(self.buckets) + 2)
+            state[bisect_left(self.buckets, value)] += 1
+            state[-1] += value
+        self.registry.maybe_flush()
+
+
+class MetricsRegistry:
+    """Реестр метрик процесса с поддержкой общего каталога для воркеров."""
+
+    def __init__(self) -> None:
+        self.lock = RLock()
+        self._metrics: dict[str, Metric] = {}
+        self._values: dict[str, dict[tuple[str, ...], Any]] = {}
+        self._pid = os.getpid()
+        self._started = time.time()
+        self._last_flush = 0.0
+        self._dirty = False
+
+    # --- регистрация -----------------------------------------------------
+
+    def counter(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = ()
+    ) -> Counter:
+        """Регистрирует (или возвращает существующий) счётчик."""
+        return self._register(Counter(self, name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Регистрирует (или возвращает существующую) гистограмму."""
+        return self._register(
+            Histogram(self, name, documentation, labelnames, buckets=buckets)
+        )
+
+    def _register(self, metric: Metric):
+        with self.lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    # --- значения процесса -------------------------------------------------
+
+    def values_for(self, metric: Metric) -> dict[tuple[str, ...], Any]:
+        """Возвращает словарь значений метрики текущего процесса.
+
+        После fork (например, gunicorn --preload) значения, унаследованные
+        от родителя, сбрасываются, чтобы не учитывать их дважды.
+        """
+        pid = os.getpid()
+        if pid != self._pid:
+            self._pid = pid
+            self._started = time.time()
+            self._values = {}
+            self._last_flush = 0.0
+        self._dirty = True
+        return self._values.setdefault(metric.name, {})
+
+    def reset(self) -> None:
+        """Сбрасывает значения текущего процесса (используется в тестах)."""
+        with self.lock:
+            self._values = {}
+            self._dirty = True
+
+    # --- многопроцессный режим ---------------------------------------------
+
+    @staticmethod
+    def multiprocess_dir() -> Path | None:
+        """Каталог для обмена значениями между воркерами (или None)."""
+        directory = getattr(settings, "METRICS_MULTIPROC_DIR", None)
+        return Path(directory) if directory else None
+
+    def _process_file(self, directory: Path) -> Path:
+        return directory / f"metrics_{self._pid}_{int(self._started)}.json"
+
+    def maybe_flush(self) -> None:
+        """Сбрасывает снимок в файл не чаще ``METRICS_FLUSH_INTERVAL`` секунд."""
+        directory = self.multiprocess_dir()
+        if directory is None:
+            return
+        interval = float(getattr(settings, "METRICS_FLUSH_INTERVAL", 1.0))
+        if time.monotonic() - self._last_flush >= interval:
+            self.flush()
+
+    def flush(self) -> None:
+        """Атомарно записывает значения процесса в общий каталог."""
+        directory = self.multiprocess_dir()
+        if directory is None:
+            return
+        with self.lock:
+            if not self._dirty:
+                return
+            payload = {
+                name: [[list(key), value] for key, value in values.items()]
+                for name, values in self._values.items()
+            }
+            self._dirty = False
+            self._last_flush = time.monotonic()
+            target = self._process_file(directory)
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp_path, target)
+        except OSError as exc:
+            logger.warning("Не удалось сохранить метрики в %s: %s", directory, exc)
+
+    def _collect_values(self) -> dict[str, dict[tuple[str, ...], Any]]:
+        directory = self.multiprocess_dir()
+        if directory is None:
+            with self.lock:
+                return {
+                    name: {key: _copy(value) for key, value in values.items()}
+                    for name, values in self._values.items()
+                }
+
+        self.flush()
+        merged: dict[str, dict[tuple[str, ...], Any]] = {}
+        for path in sorted(directory.glob("metrics_*.json")):
+            try:
+                payload = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError) as exc:
+                logger.warning("Пропущен файл метрик %s: %s", path, exc)
+                continue
+            for name, items in payload.items():
+                target = merged.setdefault(name, {})
+                for key, value in items:
+                    _merge(target, tuple(key), value)
+        return merged
+
+    # --- выдача --------------------------------------------------------------
+
+    def render(self) -> str:
+        """Формирует текст в формате Prometheus exposition 0.0.4."""
+        values = self._collect_values()
+        lines: list[str] = []
+        with self.lock:
+            metrics = list(self._metrics.values())
+        for metric in sorted(metrics, key=lambda m: m.name):
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            samples = values.get(metric.name, {})
+            for key in sorted(samples):
+                value = samples[key]
+                if isinstance(metric, Histogram):
+                    lines.extend(_histogram_lines(metric, key, value))
+                else:
+                    labels = _format_labels(metric.labelnames, key)
+                    lines.append(f"{metric.name}{labels} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _copy(value: Any) -> Any:
+    return list(value) if isinstance(value, list) else value
+
+
+def _merge(target: dict[tuple[str, ...], Any], key: tuple[str, ...], value) -> None:
+    current = target.get(key)
+    if current is None:
+        target[key] = _copy(value)
+    elif isinstance(current, list):
+        for index, item in enumerate(value):
+            current[index] += item
+    else:
+        target[key] = current + value
+
+
+def _histogram_lines(metric: Histogram, key: tuple[str, ...], state: list[float]):
+    cumulative = 0.0
+    bounds = [f"{bound:g}" for bound in metric.buckets] + ["+Inf"]
+    for bound, count in zip(bounds, state[:-1]):
+        cumulative += count
+        labels = _format_labels(metric.labelnames + ("le",), key + (bound,))
+        yield f"{metric.name}_bucket{labels} {_format_value(cumulative)}"
+    labels = _format_labels(metric.labelnames, key)
+    yield f"{metric.name}_sum{labels} {_format_value(state[-1])}"
+    yield f"{metric.name}_count{labels} {_format_value(cumulative)}"
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)
+    )
+    return "{" + pairs + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+atexit.register(registry.flush)
+
+# --- метрики приложения --------------------------------------------------------
+
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса по эндпоинтам",
+    ("view",),
+)
+http_requests_total = registry.counter(
+    "http_requests_total",
+    "Количество HTTP-запросов по эндпоинтам и кодам ответа",
+    ("view", "status"),
+)
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds",
+    "Суммарное время SQL-запросов в рамках одного HTTP-запроса",
+    ("view",),
+)
+db_queries_total = registry.counter(
+    "db_queries_total",
+    "Количество выполненных SQL-запросов по эндпоинтам",
+    ("view",),
+)
+db_connections_total = registry.counter(
+    "db_connections_total",
+    "Соединения с БД, использованные HTTP-запросами: открытые для запроса "
+    "(opened) и переиспользованные постоянные (reused)",
+    ("view", "alias", "state"),
+)
+application_status_transitions_total = registry.counter(
+    "application_status_transitions_total",
+    "Переходы статусов проектных заявок",
+    ("from_status", "to_status"),
+)
+emails_sent_total = registry.counter(
+    "emails_sent_total",
+    "Исходящие письма по результату отправки",
+    ("result",),
+)
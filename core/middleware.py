@@ -0,0 +1,319 @@
+"""Middleware инфраструктурного уровня.
+
+Все middleware поддерживают оба режима (sync_capable/async_capable): под
+ASGI Django не оборачивает их в sync_to_async, и async view (лента
+изменений, async-списки заявок) не занимают поток на время ожидания.
+"""
+
+from __future__ import annotations
+
+from contextlib import ExitStack
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+from core import db_router, metrics
+from core.instrumentation import (
+    QueryRecorder,
+    enable_context_recording,
+    get_instrumentation_settings,
+    request_stats,
+    start_context_recording,
+    stop_context_recording,
+)
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli необязателен
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+UNRESOLVED_ENDPOINT = "<unresolved>"
+
+
+def get_endpoint_name(request) -> str:
+    """Возвращает имя эндпоинта (view_name) для запроса.
+
+    Для ViewSet'ов DRF это имена вида ``project-application-list``.
+    """
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return UNRESOLVED_ENDPOINT
+    return match.view_name or match.route or UNRESOLVED_ENDPOINT
+
+
+class QueryInstrumentationMiddleware:
+    """Считает SQL-запросы и время обработки каждого HTTP-запроса.
+
+    Результаты попадают в реестр ``core.instrumentation.request_stats``
+    и в метрики ``core.metrics``; запросы, превысившие пороги из
+    ``settings.QUERY_INSTRUMENTATION``, логируются с перечнем повторяющихся SQL.
+
+    В async-режиме SQL выполняется в других потоках, поэтому рекордер
+    передаётся через контекстную переменную (core.instrumentation).
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.config = get_instrumentation_settings()
+        if not self.config.enabled:
+            raise MiddlewareNotUsed
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+            enable_context_recording()
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            open_before = {}
+            for connection in connections.all():
+                open_before[connection.alias] = connection.connection
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        duration_ms = (time.perf_counter() - started) * 1000
+
+        # Соединение закрывается только по request_finished, после middleware
+        reused = {
+            alias
+            for alias in recorder.aliases
+            if open_before.get(alias) is not None
+            and connections[alias].connection is open_before[alias]
+        }
+        self.record(request, response, recorder, duration_ms, reused)
+        return response
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        token = start_context_recording(recorder)
+        try:
+            response = await self.get_response(request)
+        finally:
+            stop_context_recording(token)
+        duration_ms = (time.perf_counter() - started) * 1000
+        reused = recorder.aliases - recorder.opened
+        self.record(request, response, recorder, duration_ms, reused)
+        return response
+
+    def record(
+        self,
+        request,
+        response,
+        recorder: QueryRecorder,
+        duration_ms: float,
+        reused: set[str],
+    ) -> None:
+        """Сохраняет статистику запроса и логирует медленные запросы."""
+        endpoint = get_endpoint_name(request)
+        duplicates = recorder.duplicates(self.config.duplicate_threshold)
+        sql_ms = recorder.duration * 1000
+        request_stats.record(endpoint, duration_ms, recorder.count, sql_ms, duplicates)
+        metrics.http_request_duration_seconds.observe(duration_ms / 1000, endpoint)
+        metrics.http_requests_total.inc(endpoint, response.status_code)
+        metrics.db_query_duration_seconds.observe(recorder.duration, endpoint)
+        if recorder.count:
+            metrics.db_queries_total.inc(endpoint, amount=recorder.count)
+        for alias in recorder.aliases:
+            metrics.db_connections_total.inc(
+                endpoint, alias, "reused" if alias in reused else "opened"
+            )
+
+        if (
+            duration_ms >= self.config.slow_request_ms
+            or recorder.count >= self.config.max_queries
+        ):
+            logger.warning(
+                "Медленный запрос %s %s (%s): %.1f мс, SQL-запросов: %d (%.1f мс), "
+                "дубликаты: %s",
+                request.method,
+                request.path,
+                endpoint,
+                duration_ms,
+                recorder.count,
+                sql_ms,
+                duplicates or "нет",
+            )
+
+
+class ReplicaRoutingMiddleware:
+    """Решает, можно ли читать с реплики в рамках запроса.
+
+    Чтение с реплики разрешается для GET/HEAD/OPTIONS, если клиент недавно
+    ничего не записывал, а view не отключил это атрибутом
+    ``use_replica = False``. Админка всегда работает с основной БД.
+    Если запрос что-то записал, клиент «прилипает» к основной БД
+    (см. core.db_router).
+    """
+
+    SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if not db_router.replica_configured():
+            raise MiddlewareNotUsed
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = db_router.begin_request(use_replica=False)
+        try:
+            response = self.get_response(request)
+        finally:
+            state = db_router.end_request(token)
+        self.stick_after_write(request, state)
+        return response
+
+    async def __acall__(self, request):
+        # Состояние в контекстной переменной видно и в потоках sync_to_async
+        token = db_router.begin_request(use_replica=False)
+        try:
+            response = await self.get_response(request)
+        finally:
+            state = db_router.end_request(token)
+        if state is not None and state.wrote:
+            await sync_to_async(self.stick_after_write)(request, state)
+        return response
+
+    @staticmethod
+    def stick_after_write(request, state: db_router.RoutingState | None) -> None:
+        """Привязывает клиента к основной БД, если запрос что-то записал."""
+        if state is not None and state.wrote:
+            client = db_router.client_key(request)
+            if client:
+                db_router.stick_to_primary(client)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in self.SAFE_METHODS:
+            return None
+        view_class = getattr(view_func, "cls", None) or getattr(
+            view_func, "view_class", None
+        )
+        if not getattr(view_class or view_func, "use_replica", True):
+            return None
+        match = request.resolver_match
+        if match is not None and match.app_name == "admin":
+            return None
+        client = db_router.client_key(request)
+        if client and db_router.is_sticky_primary(client):
+            return None
+        db_router.allow_replica_reads()
+        return None
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Кодировки из Accept-Encoding с весами q (``*`` сохраняется как есть)."""
+    encodings: dict[str, float] = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[name] = quality
+    return encodings
+
+
+class CompressionMiddleware:
+    """Сжатие ответов API: brotli (если установлен) или gzip.
+
+    Сжимаются только несжатые нестриминговые ответы с JSON или текстом
+    размером от ``RESPONSE_COMPRESSION_MIN_SIZE`` байт — мелкие ответы
+    сжимать невыгодно. Кодировка выбирается по Accept-Encoding клиента с
+    учётом весов q. Как и в GZipMiddleware Django, в gzip добавляются
+    случайные байты (защита от BREACH), а сильный ETag становится слабым.
+    """
+
+    COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript")
+    max_random_bytes = 100
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if not getattr(settings, "RESPONSE_COMPRESSION_ENABLED", True):
+            raise MiddlewareNotUsed
+        self.min_size = int(getattr(settings, "RESPONSE_COMPRESSION_MIN_SIZE", 1024))
+        self.brotli_quality = int(
+            getattr(settings, "RESPONSE_COMPRESSION_BROTLI_QUALITY", 4)
+        )
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        """Сжимает ответ, если он подходит по типу и размеру."""
+        if (
+            response.streaming
+            or response.has_header("Content-Encoding")
+            or len(response.content) < self.min_size
+            or not response.get("Content-Type", "").startswith(self.COMPRESSIBLE_TYPES)
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = self.choose_encoding(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+        if encoding is None:
+            return response
+
+        if encoding == "br":
+            compressed = brotli.compress(response.content, quality=self.brotli_quality)
+        else:
+            compressed = compress_string(
+                response.content, max_random_bytes=self.max_random_bytes
+            )
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(compressed))
+        response.headers["Content-Encoding"] = encoding
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        return response
+
+    @staticmethod
+    def choose_encoding(header: str) -> str | None:
+        """br, gzip или None — по предпочтениям клиента."""
+        accepted = parse_accept_encoding(header)
+        wildcard = accepted.get("*", 0.0)
+        candidates = ("br", "gzip") if brotli is not None else ("gzip",)
+        best, best_quality = None, 0.0
+        for name in candidates:
+            quality = accepted.get(name, wildcard)
+            if quality > best_quality:
+                best, best_quality = name, quality
+        return best
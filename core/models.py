@@ -0,0 +1,42 @@
+from django.db import models
+
+
+class EmailOutbox(models.Model):
+    """Письмо в очереди на отправку (transactional outbox).
+
+    Письма записываются в той же транзакции, что и бизнес-изменения, и
+    отправляются отдельно командой ``send_outbox_emails``. Если транзакция
+    откатилась, письма не уходят; если почта недоступна, изменения не
+    откатываются — письмо остаётся в очереди для повторной попытки.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Ожидает отправки"
+        SENT = "sent", "Отправлено"
+        FAILED = "failed", "Ошибка"
+
+    to_email = models.EmailField(verbose_name="Получатель")
+    subject = models.CharField(max_length=255, verbose_name="Тема")
+    # Тело очищается после отправки: в письмах бывают ссылки для задания пароля
+    body = models.TextField(blank=True, verbose_name="Текст")
+    status = models.CharField(
+        max_length=16,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name="Статус",
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name="Попыток")
+    last_error = models.TextField(blank=True, default="", verbose_name="Последняя ошибка")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
+    sent_at = models.DateTimeField(null=True, blank=True, verbose_name="Дата отправки")
+
+    class Meta:
+        verbose_name = "Письмо в очереди"
+        verbose_name_plural = "Очередь писем"
+        ordering = ("created_at", "id")
+        indexes = [
+            models.Index(fields=["status", "created_at"], name="core_outbox_status_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.to_email}: {self.subject} ({self.status})"
@@ -0,0 +1,132 @@
+"""OpenAPI-схема API: генерация при деплое и отдача готового артефакта.
+
+Полная интроспекция API в drf_yasg занимает заметное время, поэтому схема
+не строится на каждый запрос. Команда ``generate_openapi_schema`` при
+деплое записывает её в ``STATIC_ROOT/openapi/<версия кода>.json``, а
+:func:`openapi_schema` отдаёт этот файл. Если файла для текущей версии нет
+(локальная разработка, забытый шаг деплоя), схема строится один раз и
+хранится в памяти процесса под той же версией. Swagger UI и ReDoc получают
+схему по ``SPEC_URL`` (см. SWAGGER_SETTINGS и REDOC_SETTINGS).
+
+drf_yasg (вместе с валидатором схем) импортируется только при первом
+обращении к документации или генерации схемы, а не при загрузке URL.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.http import etag, require_GET
+from rest_framework import permissions
+
+API_TITLE = "Project Activity API"
+API_VERSION = "v1"
+API_DESCRIPTION = "Документация для API проектной деятельности студентов"
+
+_schema_cache: dict[str, bytes] = {}
+_schema_lock = Lock()
+
+
+@lru_cache(maxsize=1)
+def get_code_version() -> str:
+    """Версия кода: ``settings.CODE_VERSION`` или коммит из ``.git/HEAD``."""
+    version = getattr(settings, "CODE_VERSION", "")
+    if version:
+        return version
+    git_dir = Path(settings.BASE_DIR) / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+        if head.startswith("ref: "):
+            ref = head[5:]
+            ref_file = git_dir / ref
+            if ref_file.exists():
+                return ref_file.read_text().strip()[:12]
+            for line in (git_dir / "packed-refs").read_text().splitlines():
+                if line.endswith(" " + ref):
+                    return line.split(" ", 1)[0][:12]
+            return "unknown"
+        return head[:12]
+    except OSError:
+        return "unknown"
+
+
+def schema_file_path(version: str | None = None) -> Path:
+    """Путь к артефакту схемы для версии кода."""
+    return (
+        Path(settings.STATIC_ROOT) / "openapi" / f"{version or get_code_version()}.json"
+    )
+
+
+def get_api_info():
+    """Описание API для drf_yasg."""
+    from drf_yasg import openapi
+
+    return openapi.Info(
+        title=API_TITLE, default_version=API_VERSION, description=API_DESCRIPTION
+    )
+
+
+def generate_schema() -> bytes:
+    """Строит схему всего API в JSON."""
+    from drf_yasg.codecs import OpenAPICodecJson
+    from drf_yasg.generators import OpenAPISchemaGenerator
+
+    generator = OpenAPISchemaGenerator(get_api_info())
+    schema = generator.get_schema(request=None, public=True)
+    return OpenAPICodecJson(validators=[]).encode(schema)
+
+
+@lru_cache(maxsize=None)
+def _ui_view(renderer: str):
+    from drf_yasg.views import get_schema_view
+
+    # Только оболочка Swagger UI / ReDoc; сама схема — по SPEC_URL
+    schema_view = get_schema_view(
+        get_api_info(),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+    return schema_view.with_ui(renderer, cache_timeout=0)
+
+
+def swagger_ui(request, *args, **kwargs):
+    """GET /swagger/ — Swagger UI."""
+    return _ui_view("swagger")(request, *args, **kwargs)
+
+
+def redoc_ui(request, *args, **kwargs):
+    """GET /redoc/ — ReDoc."""
+    return _ui_view("redoc")(request, *args, **kwargs)
+
+
+def get_schema_bytes() -> bytes:
+    """Схема текущей версии: из артефакта, иначе строится один раз."""
+    version = get_code_version()
+    schema = _schema_cache.get(version)
+    if schema is not None:
+        return schema
+    with _schema_lock:
+        schema = _schema_cache.get(version)
+        if schema is None:
+            path = schema_file_path(version)
+            schema = path.read_bytes() if path.exists() else generate_schema()
+            _schema_cache.clear()
+            _schema_cache[version] = schema
+    return schema
+
+
+def clear_schema_cache() -> None:
+    """Сбрасывает схему в памяти (после генерации артефакта, в тестах)."""
+    with _schema_lock:
+        _schema_cache.clear()
+
+
+@require_GET
+@etag(lambda request: f'"{get_code_version()}"')
+def openapi_schema(request):
+    """GET /swagger.json — OpenAPI-схема API."""
+    return HttpResponse(get_schema_bytes(), content_type="application/json")
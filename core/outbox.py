@@ -0,0 +1,148 @@
+"""Очередь исходящих писем (transactional outbox).
+
+Сервисы вызывают :func:`enqueue_emails` внутри своей транзакции — письма
+сохраняются вместе с бизнес-изменениями одним ``bulk_create``. Доставку
+выполняет :func:`deliver_pending` (команда ``send_outbox_emails``, запуск
+по таймеру systemd ``project_activity_outbox.timer``): пачка писем
+блокируется ``SELECT ... FOR UPDATE SKIP LOCKED``, поэтому несколько
+параллельных отправителей не пошлют письмо дважды. Текст письма очищается,
+как только письмо отправлено или окончательно не доставлено.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import logging
+
+from django.conf import settings
+from django.core import mail
+from django.db import transaction
+from django.utils import timezone
+
+from core.models import EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_ATTEMPTS = 5
+
+
+@dataclass(frozen=True)
+class OutgoingEmail:
+    """Письмо для постановки в очередь."""
+
+    to_email: str
+    subject: str
+    body: str
+
+
+@dataclass
+class DeliveryResult:
+    """Итог прогона отправки."""
+
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+def enqueue_emails(emails: Iterable[OutgoingEmail]) -> list[EmailOutbox]:
+    """Ставит письма в очередь одной вставкой."""
+    return EmailOutbox.objects.bulk_create(
+        [
+            EmailOutbox(to_email=e.to_email, subject=e.subject[:255], body=e.body)
+            for e in emails
+        ],
+        batch_size=500,
+    )
+
+
+def deliver_pending(
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    limit: int | None = None,
+) -> DeliveryResult:
+    """Отправляет письма из очереди пачками через одно SMTP-соединение.
+
+    Args:
+        batch_size: Сколько писем блокировать и отправлять за раз
+        max_attempts: После стольких неудач письмо получает статус failed
+        limit: Максимум писем за прогон (None — пока очередь не опустеет)
+
+    Returns:
+        DeliveryResult со счётчиками отправленных, отложенных и проваленных
+    """
+    result = DeliveryResult()
+    # Отложенные письма в этом прогоне повторно не берём
+    seen: set[int] = set()
+    while limit is None or len(seen) < limit:
+        size = batch_size if limit is None else min(batch_size, limit - len(seen))
+        batch_result, ids = _deliver_batch(size, max_attempts, seen)
+        if not ids:
+            break
+        seen.update(ids)
+        result.sent += batch_result.sent
+        result.retried += batch_result.retried
+        result.failed += batch_result.failed
+    return result
+
+
+@transaction.atomic
+def _deliver_batch(
+    size: int, max_attempts: int, exclude_ids: set[int]
+) -> tuple[DeliveryResult, list[int]]:
+    batch = list(
+        EmailOutbox.objects.select_for_update(skip_locked=True)
+        .filter(status=EmailOutbox.Status.PENDING, attempts__lt=max_attempts)
+        .exclude(pk__in=exclude_ids)
+        .order_by("created_at", "id")[:size]
+    )
+    result = DeliveryResult()
+    if not batch:
+        return result, []
+
+    now = timezone.now()
+    from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None)
+    connection = mail.get_connection(fail_silently=False)
+    try:
+        connection.open()
+        connection_error = None
+    except Exception as exc:  # noqa: BLE001 - сервер недоступен
+        connection_error = exc
+
+    for item in batch:
+        item.attempts += 1
+        error = connection_error
+        if error is None:
+            try:
+                mail.EmailMessage(
+                    subject=item.subject,
+                    body=item.body,
+                    from_email=from_email,
+                    to=[item.to_email],
+                    connection=connection,
+                ).send()
+            except Exception as exc:  # noqa: BLE001 - любая ошибка доставки
+                error = exc
+        if error is not None:
+            logger.warning("Не удалось отправить письмо %s: %s", item.pk, error)
+            item.last_error = str(error)
+            if item.attempts >= max_attempts:
+                item.status = EmailOutbox.Status.FAILED
+                item.body = ""
+                result.failed += 1
+            else:
+                result.retried += 1
+            continue
+        item.status = EmailOutbox.Status.SENT
+        item.sent_at = now
+        item.body = ""
+        item.last_error = ""
+        result.sent += 1
+
+    if connection_error is None:
+        connection.close()
+    EmailOutbox.objects.bulk_update(
+        batch, ["status", "attempts", "last_error", "sent_at", "body"]
+    )
+    return result, [item.pk for item in batch]
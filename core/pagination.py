@@ -0,0 +1,93 @@
+"""Общие классы пагинации API и админки."""
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Model
+from django.utils.functional import cached_property
+from rest_framework.pagination import CursorPagination
+
+
+class CappedCursorPagination(CursorPagination):
+    """Курсорная пагинация с ограниченным размером страницы.
+
+    В отличие от постраничной не выполняет COUNT(*) и не деградирует на
+    дальних страницах: следующая страница выбирается по индексу от курсора.
+    Порядок должен быть уникальным, поэтому в конце стоит первичный ключ.
+    """
+
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = ("-created_at", "-id")
+
+    def get_ordering(self, request, queryset, view):
+        """Порядок из ``cursor_ordering`` представления, если он задан."""
+        ordering = getattr(view, "cursor_ordering", None)
+        if ordering:
+            return tuple(ordering)
+        return super().get_ordering(request, queryset, view)
+
+
+# Параметр запроса, возвращающий прежний ответ — весь список без пагинации
+LEGACY_LIST_PARAM = "legacy"
+
+
+def is_legacy_list_request(request) -> bool:
+    """Запрошен ли прежний формат списка (``?legacy=true``)."""
+    value = request.query_params.get(LEGACY_LIST_PARAM, "")
+    return value.lower() in {"1", "true", "yes"}
+
+
+class LegacyCompatibleCursorPagination(CappedCursorPagination):
+    """Курсорная пагинация с флагом совместимости.
+
+    По умолчанию ответ — ``{"next", "previous", "results"}``. С
+    ``?legacy=true`` пагинация отключается и возвращается прежний массив:
+    флаг оставлен для клиентов, ещё не перешедших на курсоры.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if is_legacy_list_request(request):
+            return None
+        return super().paginate_queryset(queryset, request, view)
+
+
+def estimate_table_rows(model: type[Model], using: str = "default") -> int | None:
+    """Оценка числа строк таблицы из статистики планировщика PostgreSQL.
+
+    Возвращает None для других СУБД и для таблиц без собранной статистики.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+            [connection.ops.quote_name(model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+    """Пагинатор админки, не считающий COUNT(*) по большой таблице целиком.
+
+    Для списка без фильтров и поиска берётся оценка из статистики СУБД,
+    если она не меньше ADMIN_ESTIMATED_COUNT_THRESHOLD строк: на больших
+    таблицах точный COUNT(*) в PostgreSQL — полный проход по индексу.
+    Отфильтрованные списки и небольшие таблицы считаются точно.
+    """
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        query = getattr(queryset, "query", None)
+        if query is not None and not query.where:
+            estimate = estimate_table_rows(queryset.model, queryset.db)
+            threshold = getattr(settings, "ADMIN_ESTIMATED_COUNT_THRESHOLD", 10000)
+            if estimate is not None and estimate >= threshold:
+                return estimate
+        return super().count
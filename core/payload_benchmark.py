@@ -0,0 +1,103 @@
+"""Бенчмарк размера ответов и времени сериализации JSON.
+
+Для каждого сценария чтения из :mod:`core.benchmark` выполняется один
+запрос, после чего данные ответа многократно рендерятся стандартным
+``JSONRenderer`` DRF и :class:`core.renderers.FastJSONRenderer`. Размер
+тела сравнивается без сжатия, с gzip (как в ``CompressionMiddleware``) и с
+brotli, если он установлен.
+"""
+
+from __future__ import annotations
+
+import gzip
+import statistics
+import time
+from typing import Any
+
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.benchmark import SCENARIOS, BenchmarkError, percentile
+from core.renderers import FastJSONRenderer, orjson
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli необязателен
+    brotli = None
+
+# Сценарии с записью не подходят: нужен только ответ
+READ_SCENARIOS = ("list", "coordination", "retrieve", "department-plans", "tags")
+
+
+def _render_timings(renderer, data, repeat: int) -> tuple[bytes, list[float]]:
+    timings = []
+    body = b""
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = renderer.render(data)
+        timings.append((time.perf_counter() - started) * 1000)
+    return body, timings
+
+
+class PayloadBenchmarkRunner:
+    """Замеряет размер ответов и время их сериализации."""
+
+    def __init__(self, repeat: int = 20, brotli_quality: int = 4) -> None:
+        self.repeat = repeat
+        self.brotli_quality = brotli_quality
+
+    def run(self, names: list[str] | None = None) -> dict[str, Any]:
+        """Выполняет сценарии и возвращает отчёт.
+
+        Raises:
+            BenchmarkError: Если сценарий неизвестен или для него нет данных
+        """
+        names = names or list(READ_SCENARIOS)
+        unknown = set(names) - set(READ_SCENARIOS)
+        if unknown:
+            raise BenchmarkError(f"Неизвестные сценарии: {', '.join(sorted(unknown))}")
+
+        report: dict[str, Any] = {
+            "repeat": self.repeat,
+            "orjson": orjson is not None,
+            "brotli": brotli is not None,
+            "scenarios": {},
+        }
+        with transaction.atomic():
+            for name in names:
+                report["scenarios"][name] = self._run_scenario(name)
+            transaction.set_rollback(True)
+        return report
+
+    def _run_scenario(self, name: str) -> dict[str, Any]:
+        scenario = SCENARIOS[name](1)
+        client = APIClient()
+        token = RefreshToken.for_user(scenario.user).access_token
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        response = client.get(next(scenario.paths))
+        if response.status_code != 200:
+            raise BenchmarkError(
+                f"Сценарий {name}: ответ {response.status_code}, а не 200"
+            )
+
+        body, stdlib_ms = _render_timings(JSONRenderer(), response.data, self.repeat)
+        fast_body, fast_ms = _render_timings(
+            FastJSONRenderer(), response.data, self.repeat
+        )
+        result: dict[str, Any] = {
+            "raw_bytes": len(body),
+            "fast_raw_bytes": len(fast_body),
+            "gzip_bytes": len(gzip.compress(body, compresslevel=6)),
+            "br_bytes": (
+                len(brotli.compress(body, quality=self.brotli_quality))
+                if brotli is not None
+                else None
+            ),
+            "render_stdlib_p50_ms": round(percentile(stdlib_ms, 50), 3),
+            "render_fast_p50_ms": round(percentile(fast_ms, 50), 3),
+            "render_stdlib_mean_ms": round(statistics.fmean(stdlib_ms), 3),
+            "render_fast_mean_ms": round(statistics.fmean(fast_ms), 3),
+        }
+        return result
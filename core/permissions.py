@@ -0,0 +1,47 @@
+"""Permissions для служебных эндпоинтов."""
+
+from __future__ import annotations
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+from core.authentication import METRICS_TOKEN_AUTH
+
+
+class MetricsPermission(BasePermission):
+    """Доступ к метрикам: токен сборщика, разрешённый IP или is_staff.
+
+    Токен проверяет :class:`core.authentication.MetricsTokenAuthentication`.
+
+    Адрес из ``METRICS_ALLOWED_IPS`` учитывается только для прямых
+    запросов: если есть ``X-Forwarded-For``, запрос пришёл через прокси и
+    ``REMOTE_ADDR`` — адрес самого прокси (часто 127.0.0.1).
+    """
+
+    message = "Недостаточно прав для просмотра метрик"
+
+    def has_permission(self, request: Request, view: APIView) -> bool:
+        """Проверяет токен, IP-адрес клиента и права пользователя.
+
+        Args:
+            request: текущий запрос
+            view: представление, совершающее проверку
+
+        Returns:
+            bool: True, если доступ разрешён.
+        """
+        if request.auth == METRICS_TOKEN_AUTH:
+            return True
+
+        remote_addr = request.META.get("REMOTE_ADDR")
+        if (
+            remote_addr
+            and "HTTP_X_FORWARDED_FOR" not in request.META
+            and remote_addr in getattr(settings, "METRICS_ALLOWED_IPS", [])
+        ):
+            return True
+
+        user = request.user if request.user.is_authenticated else None
+        return bool(user and user.is_staff)
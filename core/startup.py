@@ -0,0 +1,141 @@
+"""Профилирование запуска процесса Django.
+
+Замер выполняется в отдельном интерпретаторе: ``django.setup()`` и
+загрузка всех URL, как при старте воркера gunicorn. С ``-X importtime``
+Python сообщает время импорта каждого модуля; без него замер общего
+времени точнее (сама трассировка добавляет накладные расходы).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from django.conf import settings
+
+# Модули, которые не должны загружаться при старте воркера
+HEAVY_MODULES = ("pandas", "openpyxl", "numpy", "drf_yasg.codecs")
+
+_STARTUP_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import django
+django.setup()
+setup_done = time.perf_counter()
+from django.urls import get_resolver
+get_resolver().url_patterns
+finished = time.perf_counter()
+print(json.dumps({
+    "setup_s": setup_done - started,
+    "urls_s": finished - setup_done,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+class StartupProfileError(Exception):
+    """Не удалось запустить замер."""
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """Строка отчёта ``-X importtime`` (время в микросекундах)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Результат замера запуска."""
+
+    setup_s: float
+    urls_s: float
+    modules: list[str]
+    imports: list[ImportTiming] = field(default_factory=list)
+
+    @property
+    def total_s(self) -> float:
+        return self.setup_s + self.urls_s
+
+    def loaded(self, module: str) -> bool:
+        """Загружен ли модуль (или пакет) при старте."""
+        prefix = module + "."
+        return any(name == module or name.startswith(prefix) for name in self.modules)
+
+    def top_imports(self, limit: int = 20, by: str = "cumulative") -> list[ImportTiming]:
+        """Самые долгие импорты по собственному или суммарному времени."""
+        key = "self_us" if by == "self" else "cumulative_us"
+        return sorted(self.imports, key=lambda item: getattr(item, key), reverse=True)[
+            :limit
+        ]
+
+    def packages(self, limit: int = 20) -> list[tuple[str, int]]:
+        """Собственное время импорта, просуммированное по пакетам верхнего уровня."""
+        totals: dict[str, int] = defaultdict(int)
+        for item in self.imports:
+            totals[item.module.split(".", 1)[0]] += item.self_us
+        return sorted(totals.items(), key=lambda pair: pair[1], reverse=True)[:limit]
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Разбирает вывод ``python -X importtime`` (stderr)."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # заголовок таблицы
+        name = parts[2].rstrip()
+        stripped = name.lstrip()
+        timings.append(
+            ImportTiming(
+                module=stripped,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def profile_startup(importtime: bool = False, timeout: float = 120) -> StartupProfile:
+    """Запускает отдельный интерпретатор и замеряет старт Django.
+
+    Args:
+        importtime: Собрать время импорта по модулям (``-X importtime``)
+        timeout: Таймаут дочернего процесса, секунды
+
+    Raises:
+        StartupProfileError: Процесс завершился с ошибкой
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", _STARTUP_SCRIPT]
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE}
+    completed = subprocess.run(
+        command,
+        cwd=Path(settings.BASE_DIR),
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if completed.returncode != 0:
+        raise StartupProfileError(completed.stderr.strip()[-2000:])
+    data = json.loads(completed.stdout.strip().splitlines()[-1])
+    return StartupProfile(
+        setup_s=data["setup_s"],
+        urls_s=data["urls_s"],
+        modules=data["modules"],
+        imports=parse_importtime(completed.stderr) if importtime else [],
+    )
@@ -0,0 +1,115 @@
+"""Замер пропускной способности запущенного сервера по HTTP.
+
+В отличие от :mod:`core.benchmark` (тестовый клиент, один поток) здесь
+запросы идут по сети к реальному серверу из нескольких параллельных
+клиентов. Так сравниваются профили запуска: sync, gthread и ASGI
+(см. config/gunicorn.conf.py). Используется только стандартная библиотека.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import cycle
+import statistics
+import threading
+import time
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from core.benchmark import percentile
+
+
+@dataclass
+class ThroughputResult:
+    """Итог прогона одного набора путей."""
+
+    requests: int = 0
+    errors: int = 0
+    elapsed_s: float = 0.0
+    durations_ms: list[float] = field(default_factory=list)
+    status_codes: dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        durations = self.durations_ms
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "elapsed_s": round(self.elapsed_s, 3),
+            "rps": round(self.requests / self.elapsed_s, 2) if self.elapsed_s else 0.0,
+            "p50_ms": round(percentile(durations, 50), 3),
+            "p95_ms": round(percentile(durations, 95), 3),
+            "max_ms": round(max(durations, default=0.0), 3),
+            "mean_ms": round(statistics.fmean(durations), 3) if durations else 0.0,
+            "status_codes": self.status_codes,
+        }
+
+
+class ThroughputRunner:
+    """Параллельно запрашивает пути в течение ``duration`` секунд.
+
+    Args:
+        base_url: Адрес сервера, например ``http://127.0.0.1:8000``
+        concurrency: Число одновременных клиентов
+        duration: Длительность прогона, секунды
+        token: JWT для заголовка Authorization (необязательно)
+        timeout: Таймаут одного запроса, секунды
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        concurrency: int = 10,
+        duration: float = 10.0,
+        token: str | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = concurrency
+        self.duration = duration
+        self.timeout = timeout
+        self.headers = {"Accept": "application/json"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+
+    def run(self, paths: list[str]) -> ThroughputResult:
+        """Выполняет прогон; пути запрашиваются по кругу."""
+        result = ThroughputResult()
+        lock = threading.Lock()
+        path_iter = cycle(paths)
+        deadline = time.monotonic() + self.duration
+
+        def next_path() -> str:
+            with lock:
+                return next(path_iter)
+
+        def worker() -> None:
+            while time.monotonic() < deadline:
+                status, elapsed_ms = self._request(next_path())
+                with lock:
+                    result.requests += 1
+                    result.durations_ms.append(elapsed_ms)
+                    result.status_codes[status] = result.status_codes.get(status, 0) + 1
+                    if not status.startswith("2"):
+                        result.errors += 1
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for _ in range(self.concurrency):
+                pool.submit(worker)
+        result.elapsed_s = time.monotonic() - started
+        return result
+
+    def _request(self, path: str) -> tuple[str, float]:
+        request = Request(self.base_url + path, headers=self.headers)
+        started = time.perf_counter()
+        try:
+            with urlopen(request, timeout=self.timeout) as response:
+                response.read()
+                status = str(response.status)
+        except HTTPError as e:
+            status = str(e.code)
+        except (URLError, OSError):
+            status = "error"
+        return status, (time.perf_counter() - started) * 1000
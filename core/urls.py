@@ -0,0 +1,8 @@
+from django.urls import path
+
+from core.views import MetricsView, RequestStatsView
+
+urlpatterns = [
+    path("metrics/", MetricsView.as_view(), name="metrics"),
+    path("request-stats/", RequestStatsView.as_view(), name="request-stats"),
+]
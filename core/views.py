@@ -0,0 +1,51 @@
+"""Служебные эндпоинты инфраструктуры (статистика запросов, метрики)."""
+
+from django.http import HttpResponse
+from rest_framework import permissions, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from accounts.authentication import CachedJWTAuthentication
+from core.authentication import MetricsTokenAuthentication
+from core.instrumentation import request_stats
+from core.metrics import registry
+from core.permissions import MetricsPermission
+
+
+class RequestStatsView(APIView):
+    """Статистика SQL-запросов и времени ответа по эндпоинтам.
+
+    Данные хранятся в памяти процесса, поэтому при нескольких воркерах
+    gunicorn каждый воркер отдаёт собственную статистику.
+    Доступно только сотрудникам (is_staff).
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request: Request) -> Response:
+        """Возвращает накопленную статистику по эндпоинтам."""
+        return Response({"endpoints": request_stats.snapshot()})
+
+    def delete(self, request: Request) -> Response:
+        """Сбрасывает накопленную статистику."""
+        request_stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class MetricsView(APIView):
+    """Метрики приложения в текстовом формате Prometheus.
+
+    Доступно по токену ``settings.METRICS_TOKEN``, с адресов из
+    ``settings.METRICS_ALLOWED_IPS`` (без прокси) либо сотрудникам.
+    """
+
+    authentication_classes = [MetricsTokenAuthentication, CachedJWTAuthentication]
+    permission_classes = [MetricsPermission]
+
+    def get(self, request: Request) -> HttpResponse:
+        """Возвращает текущие значения всех метрик."""
+        return HttpResponse(
+            registry.render(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
@@ -100,6 +100,10 @@ EMAIL_BACKEND=django.core.mail.backends.filebased.EmailBackend
 
 # Frontend URL
 FRONT_END=http://localhost:3000
+
+# Общий кеш для всех воркеров gunicorn (инвалидация кеша, привязка к основной БД)
+CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+CACHE_LOCATION=$PROJECT_DIR/cache
 EOF
 
 log_info ".env файл создан"
@@ -151,6 +155,7 @@ log_info "Миграции применены"
 # 6. Сбор статических файлов
 log_info "Сбор статических файлов..."
 python manage.py collectstatic --noinput
+python manage.py generate_openapi_schema
 log_info "Статические файлы собраны"
 
 # 7. Создание systemd service файла
@@ -170,9 +175,7 @@ Group=nnd
 WorkingDirectory=$PROJECT_DIR
 Environment="PATH=$PROJECT_DIR/venv/bin"
 ExecStart=$PROJECT_DIR/venv/bin/gunicorn \\
-    --workers 3 \\
-    --bind 0.0.0.0:8000 \\
-    --timeout 120 \\
+    -c config/gunicorn.conf.py \\
     --access-logfile $PROJECT_DIR/logs/gunicorn_access.log \\
     --error-logfile $PROJECT_DIR/logs/gunicorn_error.log \\
     config.wsgi:application
@@ -191,12 +194,44 @@ rm "$TEMP_SERVICE_FILE"
 
 log_info "Systemd service файл создан: $SERVICE_FILE"
 
+# Отправка писем из очереди (send_outbox_emails) по таймеру раз в минуту
+log_info "Создание systemd timer для отправки писем..."
+OUTBOX_SERVICE_FILE="/etc/systemd/system/project_activity_outbox.service"
+OUTBOX_TIMER_FILE="/etc/systemd/system/project_activity_outbox.timer"
+
+TEMP_SERVICE_FILE=$(mktemp)
+cat > "$TEMP_SERVICE_FILE" << EOF
+[Unit]
+Description=Project Activity Server: отправка писем из очереди
+After=network.target postgresql.service
+
+[Service]
+Type=oneshot
+User=nnd
+Group=nnd
+WorkingDirectory=$PROJECT_DIR
+Environment="PATH=$PROJECT_DIR/venv/bin"
+ExecStart=$PROJECT_DIR/venv/bin/python manage.py send_outbox_emails
+EOF
+sudo cp "$TEMP_SERVICE_FILE" "$OUTBOX_SERVICE_FILE"
+sudo chmod 644 "$OUTBOX_SERVICE_FILE"
+rm "$TEMP_SERVICE_FILE"
+
+sudo cp "$PROJECT_DIR/project_activity_outbox.timer" "$OUTBOX_TIMER_FILE"
+sudo chmod 644 "$OUTBOX_TIMER_FILE"
+
+log_info "Systemd timer создан: $OUTBOX_TIMER_FILE"
+
 # Создание директории для логов
 log_info "Создание директории для логов..."
 mkdir -p "$PROJECT_DIR/logs"
 chmod 755 "$PROJECT_DIR/logs"
 log_info "Директория для логов создана"
 
+# Каталог общего файлового кеша (CACHE_LOCATION в .env)
+mkdir -p "$PROJECT_DIR/cache"
+chmod 700 "$PROJECT_DIR/cache"
+
 # 8. Перезагрузка systemd и запуск сервиса
 log_info "Перезагрузка systemd daemon..."
 sudo systemctl daemon-reload
@@ -205,6 +240,9 @@ log_info "Запуск сервиса project_activity_server..."
 sudo systemctl enable project_activity_server.service
 sudo systemctl restart project_activity_server.service
 
+log_info "Запуск таймера отправки писем..."
+sudo systemctl enable --now project_activity_outbox.timer
+
 # Проверка статуса сервиса
 sleep 2
 if sudo systemctl is-active --quiet project_activity_server.service; then
@@ -1,5 +1,8 @@
 from django.contrib import admin
 
+from core.pagination import EstimatedCountPaginator
+
+from .cache import invalidate_tags
 from .models import (
     ApplicationInvolvedDepartment,
     ApplicationInvolvedUser,
@@ -33,8 +36,19 @@ class ProjectApplicationStatusLogAdmin(admin.ModelAdmin):
         "to_status",
         "action_type",
     )
-    search_fields = ("application__title", "actor__username")
+    search_fields = ("application__title", "actor__email")
     list_filter = ("to_status", "from_status", "action_type")
+    # User.__str__ выводит роль
+    list_select_related = ("application", "actor__role", "from_status", "to_status")
+    raw_id_fields = (
+        "application",
+        "actor",
+        "involved_user",
+        "involved_department",
+        "previous_status_log",
+    )
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     verbose_name = "Лог изменения статуса заявки"
     verbose_name_plural = "Логи изменения статусов заявок"
 
@@ -42,8 +56,12 @@ class ProjectApplicationStatusLogAdmin(admin.ModelAdmin):
 @admin.register(ProjectApplicationComment)
 class ProjectApplicationCommentAdmin(admin.ModelAdmin):
     list_display = ("application", "author", "created_at", "field", "text")
-    search_fields = ("text", "author__username", "field")
+    search_fields = ("text", "author__email", "field")
     list_filter = ("created_at",)
+    list_select_related = ("application", "author__role")
+    raw_id_fields = ("application", "author")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     verbose_name = "Комментарий к заявке"
     verbose_name_plural = "Комментарии к заявкам"
 
@@ -64,6 +82,22 @@ class TagAdmin(admin.ModelAdmin):
     filter_horizontal = ("departments",)
     ordering = ("category", "name")
 
+    def get_queryset(self, request):
+        # Tag.__str__ перечисляет подразделения (выбор тегов, подтверждение удаления)
+        return super().get_queryset(request).prefetch_related("departments")
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        invalidate_tags()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_tags()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        invalidate_tags()
+
 
 @admin.register(ProjectApplication)
 class ProjectApplicationAdmin(admin.ModelAdmin):
@@ -115,6 +149,16 @@ class ProjectApplicationAdmin(admin.ModelAdmin):
     readonly_fields = ("creation_date",)
     filter_horizontal = ("target_institutes", "tags")
     inlines = [ApplicationInvolvedUserInline, ApplicationInvolvedDepartmentInline]
+    list_select_related = ("status", "semester")
+    raw_id_fields = ("author",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def formfield_for_manytomany(self, db_field, request, **kwargs):
+        if db_field.name == "tags":
+            # Подписи тегов (Tag.__str__) включают подразделения
+            kwargs["queryset"] = Tag.objects.prefetch_related("departments")
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
 
     fieldsets = (
         (
@@ -183,6 +227,8 @@ class ProjectApplicationAdmin(admin.ModelAdmin):
 class DepartmentPlanAdmin(admin.ModelAdmin):
     list_display = ("department", "semester", "plan")
     list_filter = ("semester", "department")
+    list_select_related = ("department", "semester")
+    autocomplete_fields = ("department",)
     search_fields = ("department__name", "semester__name")
     ordering = ("semester", "department")
     verbose_name = "План подразделения"
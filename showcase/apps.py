@@ -8,5 +8,6 @@ class ShowcaseConfig(AppConfig):
     def ready(self):
         # Сигналы Django удалены в пользу сервисной архитектуры
         # Логика работы со статусами теперь выполняется через StatusManager
-        # в сервисах showcase.services.status
-        pass
+        # в сервисах showcase.services.status.
+        # Остались только сигналы поддержки Tag.departments_key
+        from showcase import signals  # noqa: F401
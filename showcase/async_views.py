@@ -0,0 +1,126 @@
+"""Async view только для чтения: список и карточка заявок, лента изменений.
+
+Отдают те же данные, что и ProjectApplicationViewSet (list/retrieve).
+Синхронная работа с ORM выполняется через ``sync_to_async`` в общем потоке
+(thread_sensitive=True): только там Django закрывает устаревшие и
+оборванные соединения (close_old_connections по request_started и
+request_finished), а соединения потоков пула не закрывались бы никогда.
+При запуске через ASGI (config.asgi) лента изменений ждёт новых записей
+через ``asyncio.sleep`` и на время ожидания поток не занимает. Под WSGI эти
+view тоже работают — Django выполняет их синхронно.
+"""
+
+from __future__ import annotations
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import APIException, NotAuthenticated
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.request import Request
+
+from accounts.authentication import authenticate_async
+from accounts.models import User
+from showcase.entities.ProjectApplication import ProjectApplicationViewSet
+from showcase.services.application_service import ProjectApplicationService
+from showcase.services.change_feed_service import DEFAULT_LIMIT, ChangeFeedService
+
+JSON_PARAMS = {"ensure_ascii": False}
+
+
+def _json(data, status: int = 200) -> JsonResponse:
+    return JsonResponse(data, status=status, safe=False, json_dumps_params=JSON_PARAMS)
+
+
+async def _authenticate(request) -> tuple[User | None, JsonResponse | None]:
+    """Пользователь по JWT либо готовый ответ с ошибкой."""
+    try:
+        user = await authenticate_async(request)
+    except APIException as e:
+        return None, _json({"detail": str(e.detail)}, status=e.status_code)
+    if user is None:
+        error = NotAuthenticated()
+        return None, _json({"detail": str(error.detail)}, status=error.status_code)
+    return user, None
+
+
+def _list_payload(request, user: User) -> dict:
+    service = ProjectApplicationService()
+    drf_request = Request(request)
+    # Те же фильтры и ?ordering=, что у list во ViewSet (ошибки — ValueError)
+    view = ProjectApplicationViewSet(request=drf_request, action="list")
+    queryset = view._filter_list_queryset(service.get_user_applications_queryset(user))
+    paginator = PageNumberPagination()
+    page = paginator.paginate_queryset(queryset, drf_request)
+    data = [service.get_application_list_dto(app).to_dict() for app in page]
+    return paginator.get_paginated_response(data).data
+
+
+def _retrieve_payload(pk: int, user: User) -> dict:
+    service = ProjectApplicationService()
+    application = service.get_application(pk, user)
+    data = service.get_application_dto(application).to_dict()
+    try:
+        data.update(service.get_available_actions(pk, user).to_dict())
+    except Exception:
+        data["available_actions"] = []
+    return data
+
+
+@require_GET
+async def project_application_list(request):
+    """GET /api/showcase/async/project-applications/ — как list во ViewSet."""
+    user, error = await _authenticate(request)
+    if error:
+        return error
+    try:
+        payload = await sync_to_async(_list_payload)(request, user)
+    except ValueError as e:
+        return _json({"error": str(e)}, status=400)
+    except PermissionError as e:
+        return _json({"error": str(e)}, status=403)
+    return _json(payload)
+
+
+@require_GET
+async def project_application_detail(request, pk: int):
+    """GET /api/showcase/async/project-applications/{id}/ — как retrieve."""
+    user, error = await _authenticate(request)
+    if error:
+        return error
+    try:
+        payload = await sync_to_async(_retrieve_payload)(pk, user)
+    except PermissionError as e:
+        return _json({"error": str(e)}, status=403)
+    except Exception as e:
+        return _json({"error": f"Заявка не найдена ({e})"}, status=404)
+    return _json(payload)
+
+
+@require_GET
+async def change_feed(request):
+    """GET /api/showcase/changes/?after=<id>&limit=<n>&wait=<сек>
+
+    Возвращает записи журнала заявок с id больше ``after``. При ``wait > 0``
+    и отсутствии новых записей ждёт их (не дольше CHANGE_FEED_MAX_WAIT).
+    Следующий запрос передаёт ``after=last_id`` из ответа.
+    """
+    user, error = await _authenticate(request)
+    if error:
+        return error
+    try:
+        after = int(request.GET.get("after", 0))
+        limit = int(request.GET.get("limit", DEFAULT_LIMIT))
+        wait = float(request.GET.get("wait", 0))
+    except ValueError:
+        return _json({"error": "after, limit и wait должны быть числами"}, status=400)
+    if after < 0 or limit < 1:
+        return _json({"error": "after >= 0, limit >= 1"}, status=400)
+
+    changes = await ChangeFeedService().wait_for_changes(user, after, limit, wait)
+    return _json(
+        {
+            "results": changes,
+            "last_id": changes[-1]["id"] if changes else after,
+        }
+    )
@@ -0,0 +1,106 @@
+"""Кеш данных справочника тегов.
+
+Все ключи содержат общую версию справочника. Любое изменение тегов или их
+связей с подразделениями увеличивает версию через :func:`invalidate_tags`,
+после чего старые записи перестают читаться и истекают по TTL.
+Сигналы не используются: инвалидацию вызывают репозиторий, сервис и
+команды импорта.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from accounts.cache import bump_version
+from core.cache import cache_ttl
+from showcase.models import Tag
+
+TAGS_VERSION_KEY = "showcase:tags:version"
+DEPARTMENT_HAS_TAGS_KEY = "showcase:tags:{version}:has_tags:{department_ids}"
+TAG_CATALOGUE_KEY = "showcase:tags:{version}:catalogue:{scope}"
+
+
+@dataclass(frozen=True)
+class TagCatalogue:
+    """Сериализованный список тегов и его ETag."""
+
+    data: list[dict]
+    etag: str
+
+
+def get_tag_cache_ttl() -> int:
+    """TTL записей кеша тегов в секундах (0 — кеш отключён)."""
+    return cache_ttl(int(getattr(settings, "TAG_CACHE_TTL", 300)))
+
+
+def get_tags_version() -> int:
+    """Текущая версия справочника тегов."""
+    return cache.get(TAGS_VERSION_KEY, 0)
+
+
+def invalidate_tags() -> None:
+    """Инвалидирует все кешированные данные тегов.
+
+    Внутри транзакции версия увеличивается ещё раз после фиксации: иначе
+    параллельный запрос успел бы закешировать данные до коммита.
+    """
+    bump_version(TAGS_VERSION_KEY)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: bump_version(TAGS_VERSION_KEY))
+
+
+def department_has_tags(department_ids: Iterable[int]) -> bool:
+    """Есть ли теги, связанные хотя бы с одним из подразделений."""
+    ids = sorted(set(department_ids))
+    ttl = get_tag_cache_ttl()
+    if ttl <= 0:
+        return Tag.objects.filter(departments__in=ids).exists()
+
+    key = DEPARTMENT_HAS_TAGS_KEY.format(
+        version=get_tags_version(), department_ids=",".join(map(str, ids))
+    )
+    value = cache.get(key)
+    if value is None:
+        value = Tag.objects.filter(departments__in=ids).exists()
+        cache.set(key, value, ttl)
+    return value
+
+
+def _catalogue_etag(data: list[dict]) -> str:
+    payload = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def get_tag_catalogue(
+    scope: tuple, build: Callable[[], list[dict]]
+) -> TagCatalogue:
+    """Справочник тегов для области видимости (см. TagDomain.get_visibility_scope).
+
+    Args:
+        scope: Область видимости пользователя
+        build: Функция, строящая сериализованный список при промахе кеша
+
+    Returns:
+        TagCatalogue: данные и ETag
+    """
+    ttl = get_tag_cache_ttl()
+    key = TAG_CATALOGUE_KEY.format(
+        version=get_tags_version(), scope=":".join(str(part) for part in scope)
+    )
+    if ttl > 0:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+
+    data = [dict(item) for item in build()]
+    catalogue = TagCatalogue(data=data, etag=_catalogue_etag(data))
+    if ttl > 0:
+        cache.set(key, catalogue, ttl)
+    return catalogue
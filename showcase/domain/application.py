@@ -10,6 +10,15 @@ from showcase.dto.validation import ValidationResult
 class ProjectApplicationDomain:
     """Чистая бизнес-логика - только функции, никаких эффектов"""
 
+    # Роли, которым доступны все заявки
+    FULL_ACCESS_ROLES = (
+        "admin",
+        "moderator",
+        "cpds",
+        "department_validator",
+        "institute_validator",
+    )
+
     @staticmethod
     def validate_create(dto: ProjectApplicationCreateDTO) -> ValidationResult:
         """Валидация бизнес-правил для создания заявки.
@@ -307,18 +316,21 @@ class ProjectApplicationDomain:
             return True
 
         # Бизнес-правило: админы, модераторы и валидаторы имеют доступ ко всем заявкам
-        if user_role in [
-            "admin",
-            "moderator",
-            "cpds",
-            "department_validator",
-            "institute_validator",
-        ]:
+        if ProjectApplicationDomain.can_user_access_all_applications(user_role):
             return True
 
         # Бизнес-правило: обычные пользователи видят только свои заявки
         return False
 
+    @staticmethod
+    def can_user_access_all_applications(user_role: str) -> bool:
+        """Доступны ли роли все заявки, а не только собственные.
+
+        Чистая функция - то же правило, что в can_user_access_application,
+        для построения выборок (лента изменений и т.п.).
+        """
+        return user_role in ProjectApplicationDomain.FULL_ACCESS_ROLES
+
     @staticmethod
     def should_require_consultation(dto: ProjectApplicationCreateDTO) -> bool:
         """Определение необходимости консультации на основе данных заявки.
@@ -61,6 +61,35 @@ class TagDomain:
                 # Если нет подразделения, возвращаем пустой queryset
                 return queryset.none()
 
+    @staticmethod
+    def get_visibility_scope(user: User) -> tuple[str, int | None, int | None]:
+        """Возвращает область видимости тегов пользователя.
+
+        Результат get_filtered_queryset зависит только от этой области, поэтому
+        она используется как ключ кеша справочника тегов.
+
+        Args:
+            user: Пользователь
+
+        Returns:
+            Кортеж (класс роли, ID подразделения, ID родительского подразделения)
+        """
+        if not user or not user.is_authenticated:
+            return "base", None, None
+
+        role_code = user.role.code if user.role else None
+
+        if role_code == "cpds":
+            return "base", None, None
+
+        if role_code == "admin" or user.is_staff:
+            return "all", None, None
+
+        if not user.department:
+            return "none", None, None
+
+        return "department", user.department.id, user.department.parent_id
+
     @staticmethod
     def can_create_tag(
         user: User, department_ids: list[int] | None
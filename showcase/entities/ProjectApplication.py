@@ -7,19 +7,23 @@
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
+from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import permissions, serializers, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
 from rest_framework.exceptions import ValidationError as DRFValidationError
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from accounts.models import Semester
+from core.pagination import LegacyCompatibleCursorPagination
 from showcase.dto.application import (
     ProjectApplicationCreateDTO,
     ProjectApplicationUpdateDTO,
     serialize_comment_author,
 )
+from showcase.filters import ProjectApplicationFilter, ProjectApplicationOrderingFilter
 from showcase.models import ProjectApplication
 from showcase.services.application_service import ProjectApplicationService
 from showcase.services.comment_service import CommentService
@@ -298,10 +302,29 @@ class ProjectApplicationViewSet(viewsets.ModelViewSet):
     """Упрощенный ViewSet - только обработка HTTP запросов.
 
     Вся бизнес-логика вынесена в ApplicationService.
+
+    Списочные действия (by_status, recent, my_applications, coordination,
+    external) отдаются курсорной пагинацией; ``?legacy=true`` возвращает
+    прежний массив без пагинации. Все списки принимают фильтры
+    ProjectApplicationFilter и ``?ordering=`` по полям из ordering_fields
+    (для курсорных списков — из cursor_ordering_fields).
     """
 
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = PageNumberPagination
+    filter_backends = [DjangoFilterBackend, ProjectApplicationOrderingFilter]
+    filterset_class = ProjectApplicationFilter
+    ordering_fields = ("creation_date", "title", "company", "print_number", "id")
+    ordering = ("-creation_date", "-id")
+    # Курсорные списки сортируются только по непустым почти уникальным полям
+    cursor_actions = (
+        "by_status",
+        "recent",
+        "my_applications",
+        "coordination",
+        "external",
+    )
+    cursor_ordering_fields = ("creation_date", "id")
     queryset = ProjectApplication.objects.all()  # Добавляем queryset для совместимости
     serializer_class = ProjectApplicationListSerializer
 
@@ -374,25 +397,41 @@ class ProjectApplicationViewSet(viewsets.ModelViewSet):
         except PermissionError:
             return ProjectApplication.objects.none()
 
-    def _resolve_semester_filter_pk(self, request) -> int | None:
-        """PK семестра из ?semester_id= (id | next | actual) или None, если параметра нет."""
-        if "semester_id" not in request.query_params:
-            return None
-        return Semester.resolve_list_semester_id(
-            request.query_params.get("semester_id")
-        )
-
-    def _filter_queryset_by_semester(self, queryset, request):
-        semester_pk = self._resolve_semester_filter_pk(request)
-        if semester_pk is None:
-            return queryset
-        return queryset.filter(semester_id=semester_pk)
-
-    def _filter_applications_by_semester(self, applications, request):
-        semester_pk = self._resolve_semester_filter_pk(request)
-        if semester_pk is None:
-            return applications
-        return [app for app in applications if app.semester_id == semester_pk]
+    def _filter_list_queryset(self, queryset):
+        """Фильтры и сортировка из query-параметров (ошибки — ValueError)."""
+        try:
+            return self.filter_queryset(queryset)
+        except DRFValidationError as exc:
+            detail = exc.detail
+            if isinstance(detail, dict):
+                message = "; ".join(
+                    f"{field}: {' '.join(str(e) for e in errors)}"
+                    for field, errors in detail.items()
+                )
+            else:
+                message = str(detail)
+            raise ValueError(message) from exc
+
+    def _paginated_list_response(self, request, queryset, limit: int | None = None):
+        """Страница заявок по курсору или, с ``?legacy=true``, весь список.
+
+        Args:
+            limit: Размер страницы по умолчанию (в legacy-режиме — число заявок)
+        """
+        paginator = LegacyCompatibleCursorPagination()
+        if limit is not None:
+            paginator.page_size = limit
+        page = paginator.paginate_queryset(queryset, request, view=self)
+        applications = page
+        if page is None:
+            applications = queryset if limit is None else queryset[:limit]
+        data = [
+            self.service.get_application_list_dto(app).to_dict()
+            for app in applications
+        ]
+        if page is None:
+            return Response(data)
+        return paginator.get_paginated_response(data)
 
     def list(self, request):
         """GET /api/project-applications/
@@ -402,7 +441,7 @@ class ProjectApplicationViewSet(viewsets.ModelViewSet):
         """
         try:
             # Получаем QuerySet
-            queryset = self._filter_queryset_by_semester(self.get_queryset(), request)
+            queryset = self._filter_list_queryset(self.get_queryset())
 
             # Применяем пагинацию
             page = self.paginate_queryset(queryset)
@@ -777,20 +816,20 @@ class ProjectApplicationViewSet(viewsets.ModelViewSet):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            applications = self._filter_applications_by_semester(
-                self.service.get_applications_by_status(status_code, request.user),
-                request,
+            queryset = self._filter_list_queryset(
+                self.service.get_applications_by_status_queryset(
+                    status_code, request.user
+                ),
             )
-            list_dtos = [
-                self.service.get_application_list_dto(app) for app in applications
-            ]
-
-            return Response([dto.to_dict() for dto in list_dtos])
+            return self._paginated_list_response(request, queryset)
 
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except PermissionError as e:
             return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except APIException:
+            # Ошибки DRF (например, NotFound при неверном курсоре) — как есть
+            raise
         except Exception as e:
             return Response(
                 {"error": get_error_message(e)},
@@ -801,23 +840,26 @@ class ProjectApplicationViewSet(viewsets.ModelViewSet):
     def recent(self, request):
         """GET /api/project-applications/recent/
         Получение последних заявок (только для админов/модераторов)
+
+        Query: limit — размер страницы (не больше max_page_size пагинации).
         """
         try:
             limit = int(request.query_params.get("limit", 10))
-            applications = self._filter_applications_by_semester(
-                self.service.get_recent_applications(limit, request.user),
-                request,
+            if limit < 1:
+                raise ValueError("Параметр limit должен быть положительным")
+            limit = min(limit, LegacyCompatibleCursorPagination.max_page_size)
+            queryset = self._filter_list_queryset(
+                self.service.get_recent_applications_queryset(request.user),
             )
-            list_dtos = [
-                self.service.get_application_list_dto(app) for app in applications
-            ]
-
-            return Response([dto.to_dict() for dto in list_dtos])
+            return self._paginated_list_response(request, queryset, limit=limit)
 
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except PermissionError as e:
             return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except APIException:
+            # Ошибки DRF (например, NotFound при неверном курсоре) — как есть
+            raise
         except Exception as e:
             return Response(
                 {"error": get_error_message(e)},
@@ -833,18 +875,16 @@ class ProjectApplicationViewSet(viewsets.ModelViewSet):
             return Response([])
 
         try:
-            # Получаем все заявки пользователя без пагинации
-            queryset = self._filter_queryset_by_semester(self.get_queryset(), request)
-            applications = list(queryset)
-            list_dtos = [
-                self.service.get_application_list_dto(app) for app in applications
-            ]
-            return Response([dto.to_dict() for dto in list_dtos])
+            queryset = self._filter_list_queryset(self.get_queryset())
+            return self._paginated_list_response(request, queryset)
 
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except PermissionError as e:
             return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except APIException:
+            # Ошибки DRF (например, NotFound при неверном курсоре) — как есть
+            raise
         except Exception as e:
             return Response(
                 {"error": get_error_message(e)},
@@ -861,23 +901,19 @@ class ProjectApplicationViewSet(viewsets.ModelViewSet):
             return Response([])
 
         try:
-            # Получаем заявки через сервис с фильтрацией по причастности
-            applications = self._filter_applications_by_semester(
-                self.service.get_user_coordination_applications(request.user),
-                request,
+            # Один запрос с фильтрацией по причастности и числом комментариев
+            queryset = self._filter_list_queryset(
+                self.service.get_user_coordination_applications_queryset(request.user),
             )
-
-            # Преобразуем в DTO для списка
-            list_dtos = [
-                self.service.get_application_list_dto(app) for app in applications
-            ]
-
-            return Response([dto.to_dict() for dto in list_dtos])
+            return self._paginated_list_response(request, queryset)
 
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         except PermissionError as e:
             return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
+        except APIException:
+            # Ошибки DRF (например, NotFound при неверном курсоре) — как есть
+            raise
         except Exception as e:
             return Response(
                 {"error": get_error_message(e)},
@@ -1052,23 +1088,21 @@ class ProjectApplicationViewSet(viewsets.ModelViewSet):
             # Читаем опциональный фильтр по статусу
             status_code = request.query_params.get("status")
 
-            # Получаем внешние заявки (без пагинации)
-            applications = self._filter_applications_by_semester(
-                self.service.get_external_applications(
+            queryset = self._filter_list_queryset(
+                self.service.get_external_applications_queryset(
                     request.user, status_code=status_code
                 ),
-                request,
             )
-            list_dtos = [
-                self.service.get_application_list_dto(app) for app in applications
-            ]
-            return Response([dto.to_dict() for dto in list_dtos])
+            return self._paginated_list_response(request, queryset)
 
         except PermissionError as e:
             return Response({"error": str(e)}, status=status.HTTP_403_FORBIDDEN)
         except ValueError as e:
             # Ошибки валидации параметров (статус, semester_id и т.д.)
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except APIException:
+            # Ошибки DRF (например, NotFound при неверном курсоре) — как есть
+            raise
         except Exception as e:
             return Response(
                 {"error": get_error_message(e)},
@@ -1,3 +1,5 @@
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
 from rest_framework import decorators, serializers, status, viewsets
 from rest_framework.permissions import AllowAny
 from rest_framework.request import Request
@@ -91,10 +93,29 @@ class TagViewSet(viewsets.ModelViewSet):
         return service.list_tags(self.request.user)
 
     def list(self, request: Request, *args, **kwargs) -> Response:
-        """GET /api/showcase/tags/ - список тегов с фильтрацией по ролям."""
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        """GET /api/showcase/tags/ - список тегов с фильтрацией по ролям.
+
+        Список кешируется по области видимости пользователя и отдаётся с ETag;
+        при совпадении If-None-Match возвращается 304 без тела.
+        """
+        service = TagService()
+        catalogue = service.get_tag_catalogue(
+            request.user,
+            lambda queryset: self.get_serializer(queryset, many=True).data,
+        )
+        etag = quote_etag(catalogue.etag)
+        client_etags = {
+            value.removeprefix("W/")
+            for value in parse_etags(request.headers.get("If-None-Match", ""))
+        }
+        if "*" in client_etags or etag in client_etags:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(catalogue.data)
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        patch_vary_headers(response, ["Authorization"])
+        return response
 
     def retrieve(self, request: Request, *args, **kwargs) -> Response:
         """GET /api/showcase/tags/{id}/ - получение тега с проверкой доступа."""
@@ -0,0 +1,103 @@
+"""Фильтры и сортировка списков проектных заявок."""
+
+from django.db.models import QuerySet
+import django_filters
+from rest_framework.filters import OrderingFilter
+
+from accounts.models import Semester
+from showcase.models import ApplicationInvolvedDepartment, ProjectApplication
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    """Список строковых значений через запятую: ``?status=a,b``."""
+
+
+class ProjectApplicationFilter(django_filters.FilterSet):
+    """Фильтры заявок, выполняемые в SQL.
+
+    Связи «многие ко многим» и причастность проверяются подзапросами
+    (``pk IN (...)``), поэтому строки не дублируются и DISTINCT не нужен.
+    """
+
+    status = CharInFilter(field_name="status_id")
+    semester_id = django_filters.CharFilter(method="filter_semester")
+    main_department = django_filters.NumberFilter(field_name="main_department_id")
+    involved_department = django_filters.NumberFilter(
+        method="filter_involved_department"
+    )
+    tag = django_filters.NumberFilter(method="filter_tag")
+    target_institute = django_filters.CharFilter(method="filter_target_institute")
+    is_external = django_filters.BooleanFilter()
+    has_unseen_changes = django_filters.BooleanFilter()
+    # ?creation_date_after=2025-01-01&creation_date_before=2025-06-30
+    creation_date = django_filters.DateFromToRangeFilter()
+
+    class Meta:
+        model = ProjectApplication
+        fields = (
+            "status",
+            "semester_id",
+            "main_department",
+            "involved_department",
+            "tag",
+            "target_institute",
+            "is_external",
+            "has_unseen_changes",
+            "creation_date",
+        )
+
+    def filter_semester(self, queryset: QuerySet, name: str, value: str) -> QuerySet:
+        """Семестр по id, ``next`` или ``actual`` (resolve_list_semester_id)."""
+        return queryset.filter(semester_id=Semester.resolve_list_semester_id(value))
+
+    def filter_involved_department(
+        self, queryset: QuerySet, name: str, value: int
+    ) -> QuerySet:
+        return queryset.filter(
+            pk__in=ApplicationInvolvedDepartment.objects.filter(
+                department_id=value
+            ).values("application_id")
+        )
+
+    def filter_tag(self, queryset: QuerySet, name: str, value: int) -> QuerySet:
+        through = ProjectApplication.tags.through
+        return queryset.filter(
+            pk__in=through.objects.filter(tag_id=value).values("projectapplication_id")
+        )
+
+    def filter_target_institute(
+        self, queryset: QuerySet, name: str, value: str
+    ) -> QuerySet:
+        through = ProjectApplication.target_institutes.through
+        return queryset.filter(
+            pk__in=through.objects.filter(institute_id=value).values(
+                "projectapplication_id"
+            )
+        )
+
+
+class ProjectApplicationOrderingFilter(OrderingFilter):
+    """``?ordering=`` по белому списку полей представления.
+
+    В конец добавляется ``id`` в направлении первого поля: курсорной
+    пагинации нужен однозначный порядок при равных значениях. В действиях
+    из ``view.cursor_actions`` допустимы только ``view.cursor_ordering_fields``:
+    позиция курсора строится по значению первого поля, и NULL или повторяющиеся
+    пустые строки в нём ломают переход между страницами.
+    """
+
+    def get_valid_fields(self, queryset, view, context=None):
+        valid_fields = super().get_valid_fields(queryset, view, context or {})
+        if getattr(view, "action", None) in getattr(view, "cursor_actions", ()):
+            allowed = set(view.cursor_ordering_fields)
+            valid_fields = [item for item in valid_fields if item[0] in allowed]
+        return valid_fields
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        ordering = list(ordering)
+        if not any(field.lstrip("-") in {"id", "pk"} for field in ordering):
+            ordering.append("-id" if ordering[0].startswith("-") else "id")
+        return ordering
@@ -1,9 +1,9 @@
 import os
 from typing import Iterable
 
-import pandas as pd
 from django.core.management.base import BaseCommand
 
+from core.bulk_import import write_excel
 from showcase.models import ApplicationStatus
 
 
@@ -32,7 +32,7 @@ class Command(BaseCommand):
             self.stdout.write(self.style.WARNING("Статусов в базе не найдено."))
 
         file_path = os.path.join(os.path.dirname(__file__), "statuses.xlsx")
-        pd.DataFrame(data).to_excel(file_path, index=False)
+        write_excel(file_path, data)
 
         self.stdout.write(
             self.style.SUCCESS(
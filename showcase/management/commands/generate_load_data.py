@@ -0,0 +1,513 @@
+"""Генератор синтетических данных для нагрузочного тестирования."""
+
+from __future__ import annotations
+
+import random
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from accounts.models import (
+    ACTIVE_SEMESTER_SETTING_CODE,
+    NEXT_SEMESTER_SETTING_CODE,
+    AcademicYear,
+    Department,
+    Role,
+    Semester,
+    Settings,
+    User,
+)
+from showcase.models import (
+    ApplicationInvolvedDepartment,
+    ApplicationInvolvedUser,
+    ApplicationStatus,
+    DepartmentPlan,
+    Institute,
+    ProjectApplication,
+    ProjectApplicationComment,
+    ProjectApplicationStatusLog,
+    Tag,
+)
+
+# Маркеры сгенерированных данных (по ним работает --clear)
+EMAIL_DOMAIN = "load.example.com"
+DEPARTMENT_PREFIX = "[LOAD]"
+INSTITUTE_PREFIX = "LOAD-"
+DEFAULT_PASSWORD = "load-password"
+
+ROLE_CODES = (
+    "user",
+    "department_validator",
+    "institute_validator",
+    "cpds",
+    "admin",
+    "mentor",
+)
+
+# Распределение статусов заявок (код -> вес)
+STATUS_WEIGHTS = {
+    "created": 5,
+    "await_department": 15,
+    "await_institute": 15,
+    "await_cpds": 20,
+    "returned_department": 3,
+    "returned_institute": 3,
+    "returned_cpds": 3,
+    "approved": 25,
+    "rejected": 6,
+    "rejected_department": 2,
+    "rejected_institute": 2,
+    "rejected_cpds": 1,
+}
+
+TAG_CATEGORIES = ("Технологии", "Отрасль", "Компетенции")
+COMMENT_FIELDS = ("title", "goal", "barrier", "company", "context")
+
+
+class Command(BaseCommand):
+    help = (
+        "Генерирует синтетические данные для нагрузочного тестирования: "
+        "иерархию подразделений, пользователей по ролям, заявки с логами, "
+        "комментариями, причастными и тегами. Данные помечаются и могут быть "
+        "удалены опцией --clear."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--institutes",
+            type=int,
+            default=8,
+            help="Количество институтов (подразделений верхнего уровня)",
+        )
+        parser.add_argument(
+            "--departments-per-institute",
+            type=int,
+            default=6,
+            help="Количество кафедр в каждом институте",
+        )
+        parser.add_argument(
+            "--users-per-role",
+            type=int,
+            default=20,
+            help="Количество пользователей каждой роли",
+        )
+        parser.add_argument(
+            "--applications",
+            type=int,
+            default=20000,
+            help="Количество заявок",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=2000,
+            help="Размер пакета bulk_create",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=42,
+            help="Зерно генератора случайных чисел (для воспроизводимости)",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Удалить ранее сгенерированные данные и выйти",
+        )
+
+    def handle(self, *args, **options):
+        if options["clear"]:
+            self._clear()
+            return
+
+        if options["applications"] < 0 or options["users_per_role"] < 1:
+            raise CommandError("Некорректные размеры генерации")
+
+        self.rng = random.Random(options["seed"])
+        self.batch_size = options["batch_size"]
+
+        with transaction.atomic():
+            statuses = self._ensure_statuses()
+            roles = self._ensure_roles()
+            semesters = self._ensure_semesters()
+            institutes, departments = self._create_departments(
+                options["institutes"], options["departments_per_institute"]
+            )
+            users = self._create_users(roles, departments, options["users_per_role"])
+            tags_by_department = self._create_tags(institutes, departments)
+            self._create_plans(departments, semesters)
+            created = self._create_applications(
+                options["applications"],
+                statuses,
+                semesters,
+                institutes,
+                departments,
+                users,
+                tags_by_department,
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Готово: институтов {len(institutes)}, кафедр {len(departments)}, "
+                f"пользователей {sum(len(v) for v in users.values())}, "
+                f"заявок {created}. Пароль пользователей: {DEFAULT_PASSWORD}"
+            )
+        )
+
+    # --- справочники ----------------------------------------------------------
+
+    def _ensure_statuses(self) -> dict[str, ApplicationStatus]:
+        existing = {s.code: s for s in ApplicationStatus.objects.all()}
+        missing = [
+            ApplicationStatus(code=code, name=code, position=100 + index)
+            for index, code in enumerate(STATUS_WEIGHTS)
+            if code not in existing
+        ]
+        if missing:
+            ApplicationStatus.objects.bulk_create(missing)
+            existing.update({s.code: s for s in missing})
+        return existing
+
+    def _ensure_roles(self) -> dict[str, Role]:
+        existing = {r.code: r for r in Role.objects.filter(code__in=ROLE_CODES)}
+        missing = [
+            Role(code=code, name=code) for code in ROLE_CODES if code not in existing
+        ]
+        if missing:
+            Role.objects.bulk_create(missing)
+            existing.update({r.code: r for r in missing})
+        return existing
+
+    def _ensure_semesters(self) -> list[Semester]:
+        semesters = list(Semester.objects.all())
+        if not semesters:
+            year = timezone.now().year
+            academic_year, _ = AcademicYear.objects.get_or_create(
+                code=f"{year}-{year + 1}",
+                defaults={"name": f"{year}/{year + 1} учебный год"},
+            )
+            semesters = [
+                Semester.objects.create(
+                    code=f"{year}-autumn",
+                    name="Осенний семестр",
+                    position=1,
+                    academic_year=academic_year,
+                ),
+                Semester.objects.create(
+                    code=f"{year + 1}-spring",
+                    name="Весенний семестр",
+                    position=2,
+                    academic_year=academic_year,
+                ),
+            ]
+        for setting_code, semester in (
+            (ACTIVE_SEMESTER_SETTING_CODE, semesters[0]),
+            (NEXT_SEMESTER_SETTING_CODE, semesters[-1]),
+        ):
+            Settings.objects.get_or_create(
+                code=setting_code, defaults={"value": semester.code}
+            )
+        return semesters
+
+    # --- структура ------------------------------------------------------------
+
+    def _create_departments(
+        self, institutes_count: int, per_institute: int
+    ) -> tuple[list[Institute], list[Department]]:
+        parents = Department.objects.bulk_create(
+            [
+                Department(
+                    name=f"{DEPARTMENT_PREFIX} Институт {i + 1}",
+                    short_name=f"LI{i + 1}",
+                    can_save_project_applications=False,
+                )
+                for i in range(institutes_count)
+            ]
+        )
+        children = Department.objects.bulk_create(
+            [
+                Department(
+                    name=f"{DEPARTMENT_PREFIX} Кафедра {i + 1}.{j + 1}",
+                    short_name=f"LK{i + 1}.{j + 1}",
+                    parent=parent,
+                    can_save_project_applications=True,
+                )
+                for i, parent in enumerate(parents)
+                for j in range(per_institute)
+            ]
+        )
+        max_position = Institute.objects.aggregate(m=Max("position"))["m"] or 0
+        institutes = Institute.objects.bulk_create(
+            [
+                Institute(
+                    code=f"{INSTITUTE_PREFIX}{i + 1}",
+                    name=f"Нагрузочный институт {i + 1}",
+                    position=max_position + i + 1,
+                    department=parent,
+                )
+                for i, parent in enumerate(parents)
+            ]
+        )
+        return institutes, children
+
+    def _create_users(
+        self,
+        roles: dict[str, Role],
+        departments: list[Department],
+        per_role: int,
+    ) -> dict[str, list[User]]:
+        # Хешируем пароль один раз: хеширование на каждого пользователя
+        # заняло бы большую часть времени генерации
+        password = make_password(DEFAULT_PASSWORD)
+        stamp = timezone.now().strftime("%Y%m%d%H%M%S")
+        parents = {d.parent_id: d.parent for d in departments}
+        objects: list[User] = []
+        for role_code in ROLE_CODES:
+            for index in range(per_role):
+                if role_code == "institute_validator":
+                    department = self.rng.choice(list(parents.values()))
+                elif role_code in ("cpds", "admin"):
+                    department = None
+                else:
+                    department = self.rng.choice(departments)
+                objects.append(
+                    User(
+                        email=f"{role_code}.{index + 1}.{stamp}@{EMAIL_DOMAIN}",
+                        password=password,
+                        first_name="Нагрузка",
+                        last_name=f"{role_code.title()} {index + 1}",
+                        role=roles[role_code],
+                        department=department,
+                        is_staff=role_code == "admin",
+                    )
+                )
+        created = User.objects.bulk_create(objects, batch_size=self.batch_size)
+        users: dict[str, list[User]] = {}
+        for user in created:
+            users.setdefault(user.role_id, []).append(user)
+        return users
+
+    def _create_tags(
+        self, institutes: list[Institute], departments: list[Department]
+    ) -> dict[int, list[Tag]]:
+        through = Tag.departments.through
+        tags: list[Tag] = []
+        owners: list[Department] = []
+        for department in [i.department for i in institutes] + departments:
+            for category in TAG_CATEGORIES:
+                for n in range(3):
+                    tags.append(
+                        Tag(
+                            name=f"{category} {department.short_name}-{n + 1}",
+                            category=category,
+                            departments_key=Tag.build_departments_key(
+                                [department.id]
+                            ),
+                        )
+                    )
+                    owners.append(department)
+        tags = Tag.objects.bulk_create(tags, batch_size=self.batch_size)
+        through.objects.bulk_create(
+            [
+                through(tag_id=tag.id, department_id=owner.id)
+                for tag, owner in zip(tags, owners)
+            ],
+            batch_size=self.batch_size,
+        )
+        by_department: dict[int, list[Tag]] = {}
+        for tag, owner in zip(tags, owners):
+            by_department.setdefault(owner.id, []).append(tag)
+        return by_department
+
+    def _create_plans(
+        self, departments: list[Department], semesters: list[Semester]
+    ) -> None:
+        DepartmentPlan.objects.bulk_create(
+            [
+                DepartmentPlan(
+                    semester=semester,
+                    department=department,
+                    plan=self.rng.randint(5, 50),
+                )
+                for semester in semesters
+                for department in departments
+            ],
+            ignore_conflicts=True,
+        )
+
+    # --- заявки ---------------------------------------------------------------
+
+    def _create_applications(
+        self,
+        count: int,
+        statuses: dict[str, ApplicationStatus],
+        semesters: list[Semester],
+        institutes: list[Institute],
+        departments: list[Department],
+        users: dict[str, list[User]],
+        tags_by_department: dict[int, list[Tag]],
+    ) -> int:
+        year = timezone.now().year
+        last_number = (
+            ProjectApplication.objects.filter(application_year=year).aggregate(
+                m=Max("year_sequence_number")
+            )["m"]
+            or 0
+        )
+        status_codes = [code for code in STATUS_WEIGHTS if code in statuses]
+        weights = [STATUS_WEIGHTS[code] for code in status_codes]
+        authors = users["user"] + users["mentor"] + users["department_validator"]
+        reviewers = (
+            users["department_validator"] + users["institute_validator"] + users["cpds"]
+        )
+
+        created = 0
+        for offset in range(0, count, self.batch_size):
+            size = min(self.batch_size, count - offset)
+            applications = []
+            for index in range(size):
+                number = last_number + offset + index + 1
+                author = self.rng.choice(authors)
+                department = author.department or self.rng.choice(departments)
+                applications.append(
+                    ProjectApplication(
+                        title=f"Нагрузочная заявка {number}",
+                        company=f"Компания {self.rng.randint(1, 500)}",
+                        company_contacts="contact@example.com",
+                        author=author,
+                        author_lastname=author.last_name,
+                        author_firstname=author.first_name,
+                        author_email=author.email,
+                        author_phone="+7-900-000-00-00",
+                        project_level="local",
+                        problem_holder="Держатель проблемы",
+                        goal="Цель проекта " * 5,
+                        barrier="Барьер " * 5,
+                        main_department=department,
+                        semester=self.rng.choice(semesters),
+                        status=statuses[self.rng.choices(status_codes, weights)[0]],
+                        is_external=self.rng.random() < 0.1,
+                        has_unseen_changes=self.rng.random() < 0.2,
+                        application_year=year,
+                        year_sequence_number=number,
+                        print_number=f"{str(year)[-2:]}-{number:05d}",
+                    )
+                )
+            applications = ProjectApplication.objects.bulk_create(applications)
+            self._create_relations(
+                applications,
+                statuses,
+                institutes,
+                reviewers,
+                tags_by_department,
+            )
+            created += len(applications)
+            self.stdout.write(f"Создано заявок: {created}/{count}")
+        return created
+
+    def _create_relations(
+        self,
+        applications: list[ProjectApplication],
+        statuses: dict[str, ApplicationStatus],
+        institutes: list[Institute],
+        reviewers: list[User],
+        tags_by_department: dict[int, list[Tag]],
+    ) -> None:
+        target_through = ProjectApplication.target_institutes.through
+        tags_through = ProjectApplication.tags.through
+        created_status = statuses["created"]
+
+        logs, comments, involved_users, involved_departments = [], [], [], []
+        target_links, tag_links = [], []
+        for application in applications:
+            department = application.main_department
+            logs.append(
+                ProjectApplicationStatusLog(
+                    application=application,
+                    action_type="status_change",
+                    actor=application.author,
+                    from_status=None,
+                    to_status=created_status,
+                )
+            )
+            if application.status_id != created_status.code:
+                logs.append(
+                    ProjectApplicationStatusLog(
+                        application=application,
+                        action_type="status_change",
+                        actor=self.rng.choice(reviewers),
+                        from_status=created_status,
+                        to_status=application.status,
+                    )
+                )
+            for _ in range(self.rng.choice((0, 0, 1, 2))):
+                comments.append(
+                    ProjectApplicationComment(
+                        application=application,
+                        author=self.rng.choice(reviewers),
+                        field=self.rng.choice(COMMENT_FIELDS),
+                        text="Просьба уточнить формулировку",
+                    )
+                )
+            involved_users.append(
+                ApplicationInvolvedUser(
+                    application=application,
+                    user=application.author,
+                    added_by=application.author,
+                )
+            )
+            for dept_id in {department.id, department.parent_id} - {None}:
+                involved_departments.append(
+                    ApplicationInvolvedDepartment(
+                        application=application,
+                        department_id=dept_id,
+                        added_by=application.author,
+                    )
+                )
+            for institute in self.rng.sample(institutes, min(2, len(institutes))):
+                target_links.append(
+                    target_through(
+                        projectapplication_id=application.id,
+                        institute_id=institute.code,
+                    )
+                )
+            candidates = tags_by_department.get(department.id, [])
+            for tag in self.rng.sample(candidates, min(len(candidates), 3)):
+                tag_links.append(
+                    tags_through(projectapplication_id=application.id, tag_id=tag.id)
+                )
+
+        for model, objects in (
+            (ProjectApplicationStatusLog, logs),
+            (ProjectApplicationComment, comments),
+            (ApplicationInvolvedUser, involved_users),
+            (ApplicationInvolvedDepartment, involved_departments),
+            (target_through, target_links),
+            (tags_through, tag_links),
+        ):
+            model.objects.bulk_create(objects, batch_size=self.batch_size)
+
+    # --- очистка --------------------------------------------------------------
+
+    @transaction.atomic
+    def _clear(self) -> None:
+        users = User.objects.filter(email__endswith=f"@{EMAIL_DOMAIN}")
+        departments = Department.objects.filter(name__startswith=DEPARTMENT_PREFIX)
+
+        applications, _ = ProjectApplication.objects.filter(author__in=users).delete()
+        tags, _ = Tag.objects.filter(
+            id__in=Tag.objects.filter(departments__in=departments).values("id")
+        ).delete()
+        Institute.objects.filter(code__startswith=INSTITUTE_PREFIX).delete()
+        users_deleted, _ = users.delete()
+        departments.delete()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Удалено объектов: заявки и связанные {applications}, "
+                f"теги {tags}, пользователи {users_deleted}"
+            )
+        )
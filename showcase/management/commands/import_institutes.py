@@ -1,12 +1,28 @@
-import os
+from dataclasses import dataclass
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
-import pandas as pd
 
+from accounts.cache import invalidate_department_institutes
+from core.bulk_import import (
+    BulkUpsert,
+    ImportDataError,
+    clean_str,
+    import_transaction,
+    parse_bool,
+    read_table,
+    resolve_command_file,
+)
 from showcase.models import Institute
 
 
+@dataclass(frozen=True)
+class InstituteRecord:
+    code: str
+    name: str
+    position: int
+    is_active: bool
+
+
 class Command(BaseCommand):
     help = "Импорт справочника институтов из Excel файла"
 
@@ -17,49 +33,39 @@ class Command(BaseCommand):
             default="institutes.csv",
             help="Путь к CSV файлу с данными институтов",
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Показать изменения без записи в БД",
+        )
 
     def handle(self, *args, **options):
-        file_path = options["file"]
-
-        # Если путь относительный, ищем файл в папке commands
-        if not os.path.isabs(file_path):
-            commands_dir = os.path.dirname(os.path.abspath(__file__))
-            file_path = os.path.join(commands_dir, file_path)
-
-        if not os.path.exists(file_path):
-            self.stdout.write(self.style.ERROR(f"Файл {file_path} не найден"))
-            return
+        file_path = resolve_command_file(__file__, options["file"])
 
         try:
-            # Читаем CSV файл
-            df = pd.read_csv(file_path)
-
-            with transaction.atomic():
-                # Очищаем существующие данные
-                Institute.objects.all().delete()
-
-                # Создаем новые записи
-                created_count = 0
-                for _, row in df.iterrows():
-                    institute, created = Institute.objects.get_or_create(
-                        code=row["code"],
-                        defaults={
-                            "name": row["name"],
-                            "position": int(row["position"]),
-                            "is_active": True,
-                        },
-                    )
-                    if created:
-                        created_count += 1
-                        self.stdout.write(f"Создан институт: {institute}")
-                    else:
-                        self.stdout.write(f"Институт уже существует: {institute}")
-
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Импорт завершен. Создано {created_count} институтов."
-                    )
+            records = [
+                InstituteRecord(
+                    code=clean_str(row["code"]),
+                    name=clean_str(row["name"]),
+                    position=int(row["position"]),
+                    is_active=parse_bool(row.get("is_active"), default=True),
                 )
-
-        except Exception as e:
+                for row in read_table(file_path, ("code", "name", "position"))
+            ]
+            # Связь с подразделением задаётся отдельно и при импорте сохраняется
+            with import_transaction(options["dry_run"]):
+                result = BulkUpsert(
+                    Institute, "code", ["name", "position", "is_active"]
+                ).run(records, delete_missing=True)
+                invalidate_department_institutes()
+        except FileNotFoundError:
+            self.stdout.write(self.style.ERROR(f"Файл {file_path} не найден"))
+            return
+        except (ImportDataError, TypeError, ValueError) as e:
             self.stdout.write(self.style.ERROR(f"Ошибка при импорте: {str(e)}"))
+            return
+
+        prefix = "Пробный запуск. " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(f"{prefix}Импорт завершен. {result.summary()}")
+        )
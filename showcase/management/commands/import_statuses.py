@@ -1,34 +1,62 @@
+from dataclasses import dataclass
 import os
 
-from django.core.management.base import BaseCommand
-import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
 
+from core.bulk_import import (
+    BulkUpsert,
+    ImportDataError,
+    clean_str,
+    import_transaction,
+    parse_bool,
+    read_table,
+)
 from showcase.models import ApplicationStatus
 
 
+@dataclass(frozen=True)
+class StatusRecord:
+    code: str
+    name: str
+    position: int
+    is_active: bool
+
+
 class Command(BaseCommand):
     help = "Импорт статусов заявок из Excel-файла statuses.xlsx (рядом с этим файлом)"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Показать изменения без записи в БД",
+        )
+
     def handle(self, *args, **options):
         file_path = os.path.join(os.path.dirname(__file__), "statuses.xlsx")
         if not os.path.exists(file_path):
             self.stderr.write(self.style.ERROR(f"Файл {file_path} не найден."))
             return
-        df = pd.read_excel(file_path)
-        count = 0
-        for _, row in df.iterrows():
-            code = str(row["code"]).strip()
-            name = str(row["name"]).strip()
-            position = int(row["position"])
-            is_active = bool(row["is_active"])
-            obj, created = ApplicationStatus.objects.update_or_create(
-                code=code,
-                defaults={
-                    "name": name,
-                    "position": position,
-                    "is_active": is_active,
-                },
-            )
-            count += 1
-            self.stdout.write(f"{'Создан' if created else 'Обновлён'}: {obj}")
-        self.stdout.write(self.style.SUCCESS(f"Импортировано статусов: {count}"))
+        try:
+            records = [
+                StatusRecord(
+                    code=clean_str(row["code"]),
+                    name=clean_str(row["name"]),
+                    position=int(row["position"]),
+                    is_active=parse_bool(row["is_active"]),
+                )
+                for row in read_table(
+                    file_path, ("code", "name", "position", "is_active")
+                )
+            ]
+            with import_transaction(options["dry_run"]):
+                result = BulkUpsert(
+                    ApplicationStatus, "code", ["name", "position", "is_active"]
+                ).run(records)
+        except (ImportDataError, TypeError, ValueError) as exc:
+            raise CommandError(str(exc)) from exc
+
+        prefix = "Пробный запуск. " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(f"{prefix}Импорт статусов завершён. {result.summary()}")
+        )
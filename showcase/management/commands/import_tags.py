@@ -1,15 +1,164 @@
-import os
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Optional
 
 from django.core.management.base import BaseCommand
-from django.db import connection, transaction
-import pandas as pd
+from django.db import connection
 
 from accounts.models import Department
+from core.bulk_import import (
+    DEFAULT_BATCH_SIZE,
+    ImportDataError,
+    build_lookup,
+    clean_str,
+    import_transaction,
+    read_table,
+    resolve_command_file,
+)
+from showcase.cache import invalidate_tags
 from showcase.models import ProjectApplication, Tag
 
 
+@dataclass(frozen=True)
+class TagRecord:
+    name: str
+    category: str
+    department_id: Optional[int]
+
+    @property
+    def departments_key(self) -> str:
+        ids = [] if self.department_id is None else [self.department_id]
+        return Tag.build_departments_key(ids)
+
+    @property
+    def key(self) -> tuple:
+        return (self.name, self.departments_key)
+
+
+@dataclass
+class TagSyncPlan:
+    """Изменения справочника тегов в режиме sync."""
+
+    to_create: list[TagRecord] = field(default_factory=list)
+    # Существующий тег -> запись из файла, которой он должен соответствовать
+    to_update: list[tuple[Tag, TagRecord]] = field(default_factory=list)
+    unchanged: int = 0
+    to_delete: list[int] = field(default_factory=list)
+
+
+def plan_tag_sync(records: list[TagRecord]) -> TagSyncPlan:
+    """Сопоставляет записи файла с тегами в БД.
+
+    Тег однозначно определяется названием и набором подразделений
+    (Tag.departments_key). Сначала ищется точное совпадение по этому ключу
+    среди всех тегов, затем среди оставшихся базовых тегов — совпадение по
+    названию и категории, затем только по названию. Совпавшие теги
+    обновляются на месте, поэтому их связи с заявками сохраняются.
+    Небазовый тег, совпавший с записью файла, становится базовым.
+    Базовые теги без пары удаляются.
+    """
+    tags = list(
+        Tag.objects.only("id", "name", "category", "is_base", "departments_key")
+    )
+    by_key = {(tag.name, tag.departments_key): tag for tag in tags}
+
+    plan = TagSyncPlan()
+    matched: set[int] = set()
+    pending: list[TagRecord] = []
+
+    # 1. Точное совпадение (название, подразделения)
+    for record in records:
+        tag = by_key.get(record.key)
+        if tag is None:
+            pending.append(record)
+            continue
+        matched.add(tag.pk)
+        if tag.is_base and tag.category == record.category:
+            plan.unchanged += 1
+        else:
+            plan.to_update.append((tag, record))
+
+    leftovers = [tag for tag in tags if tag.is_base and tag.pk not in matched]
+
+    # 2-3. Совпадение по (название, категория), затем по названию
+    for key_of in (lambda r: (r.name, r.category), lambda r: r.name):
+        index: dict = defaultdict(list)
+        for tag in leftovers:
+            index[key_of(tag)].append(tag)
+        still_pending = []
+        for record in pending:
+            candidates = index.get(key_of(record))
+            if candidates:
+                tag = candidates.pop(0)
+                leftovers.remove(tag)
+                plan.to_update.append((tag, record))
+            else:
+                still_pending.append(record)
+        pending = still_pending
+
+    plan.to_create = pending
+    plan.to_delete = [tag.pk for tag in leftovers]
+    return plan
+
+
+def apply_tag_sync(plan: TagSyncPlan) -> None:
+    """Применяет план bulk-операциями.
+
+    Удаление выполняется первым, чтобы освободить ключи
+    (название, подразделения) для обновляемых и создаваемых тегов.
+    """
+    Through = Tag.departments.through
+
+    if plan.to_delete:
+        Tag.objects.filter(pk__in=plan.to_delete).delete()
+
+    pairs = []
+    if plan.to_update:
+        updated_tags = []
+        for tag, record in plan.to_update:
+            tag.name = record.name
+            tag.category = record.category
+            tag.is_base = True
+            tag.departments_key = record.departments_key
+            updated_tags.append(tag)
+        Tag.objects.bulk_update(
+            updated_tags,
+            ["name", "category", "is_base", "departments_key"],
+            batch_size=DEFAULT_BATCH_SIZE,
+        )
+        Through.objects.filter(tag_id__in=[t.pk for t in updated_tags]).delete()
+        pairs.extend(plan.to_update)
+
+    created = Tag.objects.bulk_create(
+        [
+            Tag(
+                name=r.name,
+                category=r.category,
+                is_base=True,
+                departments_key=r.departments_key,
+            )
+            for r in plan.to_create
+        ],
+        batch_size=DEFAULT_BATCH_SIZE,
+    )
+    pairs.extend(zip(created, plan.to_create))
+
+    Through.objects.bulk_create(
+        [
+            Through(tag_id=tag.pk, department_id=record.department_id)
+            for tag, record in pairs
+            if record.department_id is not None
+        ],
+        batch_size=DEFAULT_BATCH_SIZE,
+    )
+
+
 class Command(BaseCommand):
-    help = "Импорт справочника тегов из CSV файла"
+    help = (
+        "Импорт справочника тегов из CSV файла. В режиме sync (по умолчанию) "
+        "базовые теги синхронизируются с файлом без потери связей с заявками; "
+        "в режиме replace все теги удаляются и создаются заново."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -18,89 +167,137 @@ class Command(BaseCommand):
             default="tags.csv",
             help="Путь к CSV файлу с данными тегов",
         )
+        parser.add_argument(
+            "--mode",
+            choices=["sync", "replace"],
+            default="sync",
+            help="sync — инкрементальная синхронизация, replace — полная замена",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Показать изменения без записи в БД",
+        )
 
     def handle(self, *args, **options):
-        file_path = options["file"]
-
-        # Если путь относительный, ищем файл в папке commands
-        if not os.path.isabs(file_path):
-            commands_dir = os.path.dirname(os.path.abspath(__file__))
-            file_path = os.path.join(commands_dir, file_path)
+        file_path = resolve_command_file(__file__, options["file"])
+        dry_run = options["dry_run"]
 
-        if not os.path.exists(file_path):
+        try:
+            rows = read_table(file_path, ("name", "category"))
+        except FileNotFoundError:
             self.stdout.write(self.style.ERROR(f"Файл {file_path} не найден"))
             return
+        except ImportDataError as e:
+            self.stdout.write(self.style.ERROR(f"Ошибка при импорте: {str(e)}"))
+            return
 
-        try:
-            # Читаем CSV файл
-            df = pd.read_csv(file_path)
+        records = self._build_records(rows)
+        prefix = "Пробный запуск. " if dry_run else ""
+
+        if options["mode"] == "replace":
+            self._replace(records, dry_run)
+            return
+
+        with import_transaction(dry_run):
+            plan = plan_tag_sync(records)
+            apply_tag_sync(plan)
+            invalidate_tags()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}Синхронизация завершена. Создано: {len(plan.to_create)}, "
+                f"обновлено: {len(plan.to_update)}, без изменений: {plan.unchanged}, "
+                f"удалено: {len(plan.to_delete)}."
+            )
+        )
 
-            with transaction.atomic():
-                # Очищаем все связи тегов с проектными заявками
-                self.stdout.write("Отцепление тегов от проектных заявок...")
-                ProjectApplication.tags.through.objects.all().delete()
+    def _replace(self, records, dry_run):
+        """Удаляет все теги и связи с заявками и создаёт теги заново."""
+        with import_transaction(dry_run):
+            # Очищаем все связи тегов с проектными заявками
+            self.stdout.write("Отцепление тегов от проектных заявок...")
+            ProjectApplication.tags.through.objects.all().delete()
 
-                # Удаляем все теги
-                deleted_count = Tag.objects.count()
-                Tag.objects.all().delete()
-                self.stdout.write(f"Удалено {deleted_count} тегов")
+            # Удаляем все теги
+            deleted_count = Tag.objects.count()
+            Tag.objects.all().delete()
+            self.stdout.write(f"Удалено {deleted_count} тегов")
 
-                # Сбрасываем счетчик ID
+            # Счётчик последовательности в PostgreSQL не откатывается
+            if not dry_run:
                 self._reset_id_sequence()
 
-                # Создаем новые записи
-                created_count = 0
-                updated_count = 0
-                for _, row in df.iterrows():
-                    # Обработка departments (может быть ID или название)
-                    departments = []
-                    if "department" in row and pd.notna(row["department"]):
-                        department_value = row["department"]
-                        # Пытаемся найти по ID (если это число)
-                        department = None
-                        try:
-                            department_id = int(department_value)
-                            department = Department.objects.filter(
-                                pk=department_id
-                            ).first()
-                        except (ValueError, TypeError):
-                            pass
-
-                        # Если не нашли по ID, ищем по названию
-                        if department is None:
-                            department = Department.objects.filter(
-                                name=department_value
-                            ).first()
-
-                        if department is None:
-                            self.stdout.write(
-                                self.style.WARNING(
-                                    f"Подразделение '{department_value}' не найдено для тега '{row['name']}'"
-                                )
-                            )
-                        else:
-                            departments = [department]
-
-                    # Создаем новый тег (все теги были удалены, поэтому всегда создаем новый)
-                    tag = Tag.objects.create(
-                        name=row["name"],
-                        category=row["category"],
+            tags = Tag.objects.bulk_create(
+                [
+                    Tag(
+                        name=r.name,
+                        category=r.category,
                         is_base=True,
+                        departments_key=r.departments_key,
                     )
-                    if departments:
-                        tag.departments.set(departments)
-                    created_count += 1
-                    self.stdout.write(f"Создан тег: {tag}")
+                    for r in records
+                ],
+                batch_size=DEFAULT_BATCH_SIZE,
+            )
+            Through = Tag.departments.through
+            Through.objects.bulk_create(
+                [
+                    Through(tag_id=tag.pk, department_id=r.department_id)
+                    for tag, r in zip(tags, records)
+                    if r.department_id is not None
+                ],
+                batch_size=DEFAULT_BATCH_SIZE,
+            )
+            invalidate_tags()
+
+        prefix = "Пробный запуск. " if dry_run else ""
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix}Импорт завершен. Создано {len(tags)} тегов, "
+                f"удалено {deleted_count}."
+            )
+        )
 
+    def _build_records(self, rows):
+        """Типизирует строки и разрешает подразделения по ID или названию."""
+        by_id = {str(pk): pk for pk in Department.objects.values_list("pk", flat=True)}
+        by_name = build_lookup(Department.objects.all(), "name")
+
+        records = []
+        seen = set()
+        for row in rows:
+            name = clean_str(row["name"])
+            department_value = row.get("department")
+            department_id = None
+            if department_value is not None:
+                key = clean_str(department_value)
+                if isinstance(department_value, float) and department_value.is_integer():
+                    key = str(int(department_value))
+                department_id = by_id.get(key) or by_name.get(key)
+                if department_id is None:
+                    self.stdout.write(
+                        self.style.WARNING(
+                            f"Подразделение '{department_value}' не найдено "
+                            f"для тега '{name}'"
+                        )
+                    )
+            record = TagRecord(
+                name=name,
+                category=clean_str(row["category"]),
+                department_id=department_id,
+            )
+            # Название и набор подразделений уникальны (см. Tag.departments_key)
+            if record.key in seen:
                 self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Импорт завершен. Создано {created_count} тегов, "
-                        f"обновлено {updated_count} тегов."
+                    self.style.WARNING(
+                        f"Тег '{name}' повторяется в файле, строка пропущена"
                     )
                 )
-
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f"Ошибка при импорте: {str(e)}"))
+                continue
+            seen.add(record.key)
+            records.append(record)
+        return records
 
     def _reset_id_sequence(self):
         """Сбрасывает счетчик ID для таблицы тегов."""
@@ -1,10 +1,26 @@
-import os
+from dataclasses import dataclass
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
-import pandas as pd
 
+from accounts.cache import invalidate_all_principals
 from accounts.models import Role as AccountRole
+from core.bulk_import import (
+    BulkUpsert,
+    ImportDataError,
+    clean_str,
+    import_transaction,
+    parse_bool,
+    read_table,
+    resolve_command_file,
+)
+
+
+@dataclass(frozen=True)
+class UserRoleRecord:
+    code: str
+    name: str
+    requires_department: bool
+    is_active: bool = True
 
 
 class Command(BaseCommand):
@@ -17,49 +33,47 @@ class Command(BaseCommand):
             default="user_roles.csv",
             help="Путь к CSV файлу с данными ролей пользователей",
         )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Показать изменения без записи в БД",
+        )
 
     def handle(self, *args, **options):
-        file_path = options["file"]
-
-        # Если путь относительный, ищем файл в папке commands
-        if not os.path.isabs(file_path):
-            commands_dir = os.path.dirname(os.path.abspath(__file__))
-            file_path = os.path.join(commands_dir, file_path)
-
-        if not os.path.exists(file_path):
-            self.stdout.write(self.style.ERROR(f"Файл {file_path} не найден"))
-            return
+        file_path = resolve_command_file(__file__, options["file"])
 
         try:
-            # Читаем CSV файл
-            df = pd.read_csv(file_path)
-
-            with transaction.atomic():
-                # Очищаем существующие данные в accounts.Role
-                AccountRole.objects.all().delete()
-
-                # Создаем новые записи
-                created_count = 0
-                for _, row in df.iterrows():
-                    account_role, created = AccountRole.objects.get_or_create(
-                        code=row["code"],
-                        defaults={
-                            "name": row["name"],
-                            "requires_department": bool(row["requires_department"]),
-                            "is_active": True,
-                        },
-                    )
-                    if created:
-                        created_count += 1
-                        self.stdout.write(f"Создана роль: {account_role}")
-                    else:
-                        self.stdout.write(f"Роль уже существует: {account_role}")
-
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f"Импорт завершен. Создано {created_count} ролей."
-                    )
+            records = [
+                UserRoleRecord(
+                    code=clean_str(row["code"]),
+                    name=clean_str(row["name"]),
+                    requires_department=parse_bool(row["requires_department"]),
                 )
-
-        except Exception as e:
+                for row in read_table(
+                    file_path, ("code", "name", "requires_department")
+                )
+            ]
+            # Роли обновляются на месте, чтобы не терять связь с пользователями
+            with import_transaction(options["dry_run"]):
+                result = BulkUpsert(
+                    AccountRole,
+                    "code",
+                    ["name", "requires_department", "is_active"],
+                ).run(records, delete_missing=True)
+        except FileNotFoundError:
+            self.stdout.write(self.style.ERROR(f"Файл {file_path} не найден"))
+            return
+        except ImportDataError as e:
             self.stdout.write(self.style.ERROR(f"Ошибка при импорте: {str(e)}"))
+            return
+
+        if not options["dry_run"]:
+            invalidate_all_principals()
+        for code in result.protected:
+            self.stdout.write(
+                self.style.WARNING(f"Роль '{code}' используется и не удалена")
+            )
+        prefix = "Пробный запуск. " if options["dry_run"] else ""
+        self.stdout.write(
+            self.style.SUCCESS(f"{prefix}Импорт завершен. {result.summary()}")
+        )
@@ -0,0 +1,82 @@
+from collections import defaultdict
+import hashlib
+
+from django.db import migrations, models
+
+
+def build_key(department_ids):
+    ids = sorted(set(department_ids))
+    if not ids:
+        return ""
+    return hashlib.sha1(",".join(map(str, ids)).encode()).hexdigest()
+
+
+def backfill_and_merge(apps, schema_editor):
+    """Заполняет departments_key и объединяет теги-дубликаты.
+
+    Дубликатами считаются теги с одинаковым названием и набором подразделений.
+    Остаётся базовый тег (или самый ранний), связи заявок с остальными
+    переносятся на него.
+    """
+    Tag = apps.get_model("showcase", "Tag")
+    ProjectApplication = apps.get_model("showcase", "ProjectApplication")
+    Through = Tag.departments.through
+    AppTags = ProjectApplication.tags.through
+
+    departments_by_tag = defaultdict(list)
+    for tag_id, department_id in Through.objects.values_list(
+        "tag_id", "department_id"
+    ):
+        departments_by_tag[tag_id].append(department_id)
+
+    groups = defaultdict(list)
+    for tag in Tag.objects.order_by("id"):
+        tag.departments_key = build_key(departments_by_tag[tag.pk])
+        groups[(tag.name, tag.departments_key)].append(tag)
+
+    keep_tags = []
+    remap = {}
+    for tags in groups.values():
+        keep = next((tag for tag in tags if tag.is_base), tags[0])
+        keep_tags.append(keep)
+        for tag in tags:
+            if tag.pk != keep.pk:
+                remap[tag.pk] = keep.pk
+
+    if remap:
+        links = AppTags.objects.filter(tag_id__in=list(remap)).values_list(
+            "projectapplication_id", "tag_id"
+        )
+        AppTags.objects.bulk_create(
+            [
+                AppTags(projectapplication_id=application_id, tag_id=remap[tag_id])
+                for application_id, tag_id in links
+            ],
+            ignore_conflicts=True,
+        )
+        Tag.objects.filter(pk__in=list(remap)).delete()
+
+    Tag.objects.bulk_update(keep_tags, ["departments_key"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("showcase", "0028_projectapplication_has_unseen_changes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tag",
+            name="departments_key",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Хеш отсортированных ID подразделений; пусто для общих тегов",
+                max_length=40,
+                verbose_name="Ключ набора подразделений",
+            ),
+        ),
+        migrations.RunPython(backfill_and_merge, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("showcase", "0029_tag_departments_key"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="tag",
+            constraint=models.UniqueConstraint(
+                fields=("name", "departments_key"),
+                name="showcase_tag_unique_name_departments",
+            ),
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0017_semester_remove_is_active_code_index"),
+        ("showcase", "0030_tag_unique_name_departments"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="projectapplication",
+            index=models.Index(
+                fields=["-creation_date", "-id"],
+                name="showcase_pa_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectapplication",
+            index=models.Index(
+                fields=["status", "-creation_date", "-id"],
+                name="showcase_pa_status_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectapplication",
+            index=models.Index(
+                fields=["semester", "status", "-creation_date", "-id"],
+                name="showcase_pa_sem_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectapplication",
+            index=models.Index(
+                fields=["main_department", "-creation_date", "-id"],
+                name="showcase_pa_dept_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectapplication",
+            index=models.Index(
+                fields=["is_external", "status", "-creation_date", "-id"],
+                name="showcase_pa_ext_status_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="projectapplication",
+            index=models.Index(
+                fields=["author", "-creation_date", "-id"],
+                name="showcase_pa_author_date_idx",
+            ),
+        ),
+    ]
@@ -1,3 +1,6 @@
+from collections import defaultdict
+import hashlib
+
 from django.conf import settings
 from django.core.validators import MinValueValidator
 from django.db import models
@@ -73,11 +76,90 @@ class Tag(models.Model):
         related_name="tags",
         verbose_name="Подразделения",
     )
+    departments_key = models.CharField(
+        max_length=40,
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="Ключ набора подразделений",
+        help_text="Хеш отсортированных ID подразделений; пусто для общих тегов",
+    )
 
     class Meta:
         verbose_name = "Тег"
         verbose_name_plural = "Теги"
         ordering = ["category", "name"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["name", "departments_key"],
+                name="showcase_tag_unique_name_departments",
+            ),
+        ]
+
+    @staticmethod
+    def build_departments_key(department_ids) -> str:
+        """Канонический ключ набора подразделений (порядок и повторы не важны)."""
+        ids = sorted({int(pk) for pk in department_ids})
+        if not ids:
+            return ""
+        return hashlib.sha1(",".join(map(str, ids)).encode()).hexdigest()
+
+    @classmethod
+    def refresh_departments_keys(cls, tag_ids, merge_duplicates=False) -> None:
+        """Пересчитывает departments_key по текущим связям тегов.
+
+        С ``merge_duplicates=True`` тег, ключ которого совпал с уже
+        существующим тегом того же названия, сливается с ним (см. merge_into)
+        вместо нарушения уникального индекса.
+        """
+        tag_ids = list(tag_ids)
+        if not tag_ids:
+            return
+        departments_by_tag = defaultdict(list)
+        for tag_id, department_id in cls.departments.through.objects.filter(
+            tag_id__in=tag_ids
+        ).values_list("tag_id", "department_id"):
+            departments_by_tag[tag_id].append(department_id)
+
+        changed = []
+        for tag in cls.objects.filter(pk__in=tag_ids).only(
+            "id", "name", "is_base", "departments_key"
+        ):
+            key = cls.build_departments_key(departments_by_tag[tag.pk])
+            if tag.departments_key != key:
+                tag.departments_key = key
+                changed.append(tag)
+        if merge_duplicates and changed:
+            existing = {
+                (tag.name, tag.departments_key): tag
+                for tag in cls.objects.filter(
+                    name__in={tag.name for tag in changed},
+                    departments_key__in={tag.departments_key for tag in changed},
+                ).exclude(pk__in=[tag.pk for tag in changed])
+            }
+            remaining = []
+            for tag in changed:
+                target = existing.get((tag.name, tag.departments_key))
+                if target is None:
+                    remaining.append(tag)
+                else:
+                    tag.merge_into(target)
+            changed = remaining
+        cls.objects.bulk_update(changed, ["departments_key"])
+
+    def merge_into(self, target: "Tag") -> None:
+        """Переносит заявки тега на target и удаляет тег.
+
+        Базовый признак сохраняется: если хотя бы один из тегов был базовым,
+        target становится базовым.
+        """
+        target.projectapplication_set.add(
+            *self.projectapplication_set.values_list("pk", flat=True)
+        )
+        if self.is_base and not target.is_base:
+            target.is_base = True
+            target.save(update_fields=["is_base"])
+        self.delete()
 
     def __str__(self):
         dept_names = ", ".join([dept.name for dept in self.departments.all()])
@@ -228,6 +310,32 @@ class ProjectApplication(models.Model):
         verbose_name_plural = "Проектные заявки"
         ordering = ["-creation_date"]
         unique_together = [("application_year", "year_sequence_number")]
+        # Частые сочетания фильтров списков с сортировкой по дате (showcase.filters)
+        indexes = [
+            models.Index(
+                fields=["-creation_date", "-id"], name="showcase_pa_created_idx"
+            ),
+            models.Index(
+                fields=["status", "-creation_date", "-id"],
+                name="showcase_pa_status_date_idx",
+            ),
+            models.Index(
+                fields=["semester", "status", "-creation_date", "-id"],
+                name="showcase_pa_sem_status_idx",
+            ),
+            models.Index(
+                fields=["main_department", "-creation_date", "-id"],
+                name="showcase_pa_dept_date_idx",
+            ),
+            models.Index(
+                fields=["is_external", "status", "-creation_date", "-id"],
+                name="showcase_pa_ext_status_idx",
+            ),
+            models.Index(
+                fields=["author", "-creation_date", "-id"],
+                name="showcase_pa_author_date_idx",
+            ),
+        ]
 
     def __str__(self):
         if self.title:
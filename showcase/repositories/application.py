@@ -4,7 +4,8 @@
 """
 
 from django.contrib.auth import get_user_model
-from django.db.models import Max
+from django.db.models import Count, IntegerField, Max, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from accounts.models import Department, Semester
@@ -12,7 +13,15 @@ from showcase.dto.application import (
     ProjectApplicationCreateDTO,
     ProjectApplicationUpdateDTO,
 )
-from showcase.models import ApplicationStatus, Institute, ProjectApplication, Tag
+from showcase.models import (
+    ApplicationInvolvedDepartment,
+    ApplicationInvolvedUser,
+    ApplicationStatus,
+    Institute,
+    ProjectApplication,
+    ProjectApplicationComment,
+    Tag,
+)
 
 User = get_user_model()
 
@@ -177,60 +186,59 @@ class ProjectApplicationRepository:
             .order_by("-creation_date")
         )
 
-    def filter_coordination_by_user(self, user: User) -> list[ProjectApplication]:
-        """Получение заявок для координации пользователя.
-        Заявки, где пользователь причастен и статус не approved/rejected.
-        """
-        from django.db.models import Count
-
-        return list(
-            ProjectApplication.objects.filter(involved_users__user=user)
-            .exclude(status__code__in=["approved", "rejected"])
-            .select_related("status", "author", "main_department", "semester")
-            .prefetch_related("target_institutes")
-            .annotate(comments_count=Count("comments"))
-            .distinct()
-            .order_by("-creation_date")
-        )
-
-    def filter_coordination_by_user_queryset(self, user: User):
-        """Получение QuerySet заявок для координации пользователя для пагинации."""
-        from django.db.models import Count
+    def coordination_queryset(
+        self,
+        user: User,
+        department: Department | None = None,
+        include_status: str | None = None,
+    ):
+        """Единый QuerySet заявок для координации.
+
+        Объединяет в одном SQL-запросе заявки, где пользователь причастен
+        (кроме approved/rejected), заявки причастного подразделения и заявки
+        в статусе ``include_status``. Вхождение проверяется подзапросами по
+        таблицам причастности, поэтому DISTINCT не нужен, а число
+        комментариев считается коррелированным подзапросом без JOIN.
 
-        return (
-            ProjectApplication.objects.filter(involved_users__user=user)
-            .exclude(status__code__in=["approved", "rejected"])
-            .select_related("status", "author", "main_department", "semester")
-            .prefetch_related("target_institutes")
-            .annotate(comments_count=Count("comments"))
-            .distinct()
-            .order_by("-creation_date")
-        )
+        Args:
+            user: Пользователь
+            department: Подразделение валидатора (или None)
+            include_status: Код статуса, заявки в котором видны всегда
 
-    def filter_coordination_by_department(self, department) -> list[ProjectApplication]:
-        """Получение заявок для координации по причастному подразделению.
-        Заявки, где подразделение причастно и статус не approved/rejected.
+        Returns:
+            QuerySet: заявки, упорядоченные от новых к старым
         """
-        return list(
-            ProjectApplication.objects.filter(
-                involved_departments__department=department
+        condition = Q(
+            pk__in=ApplicationInvolvedUser.objects.filter(user=user).values(
+                "application_id"
             )
-            .select_related("status", "author", "main_department", "semester")
-            .prefetch_related("target_institutes", "tags")
-            .distinct()
-            .order_by("-creation_date")
+        ) & ~Q(status__code__in=["approved", "rejected"])
+        if department is not None:
+            condition |= Q(
+                pk__in=ApplicationInvolvedDepartment.objects.filter(
+                    department=department
+                ).values("application_id")
+            )
+        if include_status:
+            condition |= Q(status__code=include_status)
+
+        comments_count = (
+            ProjectApplicationComment.objects.filter(application=OuterRef("pk"))
+            .order_by()
+            .values("application")
+            .annotate(total=Count("id"))
+            .values("total")
         )
-
-    def filter_by_status(self, status_code: str) -> list[ProjectApplication]:
-        """Получение заявок по статусу.
-
-        Для административных операций.
-        """
-        return list(
-            ProjectApplication.objects.filter(status__code=status_code)
+        return (
+            ProjectApplication.objects.filter(condition)
             .select_related("status", "author", "main_department", "semester")
-            .prefetch_related("target_institutes", "tags")
-            .order_by("-creation_date")
+            .prefetch_related("target_institutes")
+            .annotate(
+                comments_count=Coalesce(
+                    Subquery(comments_count, output_field=IntegerField()), 0
+                )
+            )
+            .order_by("-creation_date", "-id")
         )
 
     def filter_by_status_queryset(self, status_code: str):
@@ -398,19 +406,6 @@ class ProjectApplicationRepository:
         )
         return int(updated)
 
-    def get_recent_applications(self, limit: int = 10) -> list[ProjectApplication]:
-        """Получение последних заявок.
-
-        Для дашборда и новостей.
-        """
-        return list(
-            ProjectApplication.objects.select_related(
-                "status", "author", "main_department", "semester"
-            )
-            .prefetch_related("target_institutes")
-            .order_by("-creation_date")[:limit]
-        )
-
     def get_all_applications_queryset(self):
         """Получение QuerySet всех заявок для пагинации.
 
@@ -6,9 +6,10 @@
 from typing import TYPE_CHECKING
 
 from django.core.exceptions import ObjectDoesNotExist
-from django.db import IntegrityError
+from django.db import IntegrityError, transaction
 
 from accounts.models import Department
+from showcase.cache import invalidate_tags
 from showcase.dto.tag import TagCreateDTO, TagUpdateDTO
 from showcase.models import Tag
 
@@ -43,36 +44,32 @@ class TagRepository:
             except ObjectDoesNotExist as err:
                 raise ValueError("Подразделения не найдены") from err
 
-        # Проверка на дубликат по (name, departments)
-        # Проверяем, что нет тега с таким же name и таким же набором departments
-        new_dept_ids = set(dto.department_ids) if dto.department_ids else set()
-        existing_tags = Tag.objects.filter(name=dto.name).prefetch_related(
-            "departments"
-        )
-        for existing_tag in existing_tags:
-            existing_dept_ids = set(
-                existing_tag.departments.values_list("id", flat=True)
+        # Проверка на дубликат по (name, departments): один запрос по
+        # уникальному индексу (name, departments_key)
+        departments_key = Tag.build_departments_key(dto.department_ids or [])
+        if Tag.objects.filter(name=dto.name, departments_key=departments_key).exists():
+            raise ValueError(
+                "Тег с таким названием и таким набором подразделений уже существует"
             )
-            if existing_dept_ids == new_dept_ids:
-                raise ValueError(
-                    "Тег с таким названием и таким набором подразделений уже существует"
-                )
 
         try:
             create_kwargs = {
                 "name": dto.name,
                 "category": dto.category,
+                "departments_key": departments_key,
             }
             # Устанавливаем is_base, если оно указано в DTO
             if dto.is_base is not None:
                 create_kwargs["is_base"] = dto.is_base
 
-            tag = Tag.objects.create(**create_kwargs)
-            if departments:
-                tag.departments.set(departments)
+            with transaction.atomic():
+                tag = Tag.objects.create(**create_kwargs)
+                if departments:
+                    tag.departments.set(departments)
         except IntegrityError as err:
             raise ValueError("Ошибка при создании тега") from err
 
+        invalidate_tags()
         return tag
 
     def get_by_id(self, tag_id: int) -> Tag:
@@ -110,9 +107,7 @@ class TagRepository:
 
         # Если department_ids не указаны, оставляем текущие departments
         if new_department_ids is None:
-            # Загружаем текущие departments для проверки уникальности
-            tag.departments.all()
-            new_dept_ids = set(tag.departments.values_list("id", flat=True))
+            departments_key = tag.departments_key
         else:
             # Получаем новые подразделения
             try:
@@ -121,24 +116,12 @@ class TagRepository:
                     found_ids = {dept.id for dept in departments}
                     missing_ids = set(new_department_ids) - found_ids
                     raise ValueError(f"Подразделения с id {missing_ids} не найдены")
-                new_dept_ids = set(new_department_ids)
             except ObjectDoesNotExist as err:
                 raise ValueError("Подразделения не найдены") from err
+            departments_key = Tag.build_departments_key(new_department_ids)
 
         # Проверка на дубликат по (name, departments), исключая текущий тег
-        existing_tags = (
-            Tag.objects.filter(name=new_name)
-            .exclude(pk=tag.pk)
-            .prefetch_related("departments")
-        )
-        for existing_tag in existing_tags:
-            existing_dept_ids = set(
-                existing_tag.departments.values_list("id", flat=True)
-            )
-            if existing_dept_ids == new_dept_ids:
-                raise ValueError(
-                    "Тег с таким названием и таким набором подразделений уже существует"
-                )
+        self._ensure_unique(new_name, departments_key, exclude_pk=tag.pk)
 
         # Применяем изменения к объекту
         update_fields = []
@@ -151,20 +134,55 @@ class TagRepository:
             tag.category = dto.category
             update_fields.append("category")
 
+        if tag.departments_key != departments_key:
+            tag.departments_key = departments_key
+            update_fields.append("departments_key")
+
         try:
-            if update_fields:
-                tag.save(update_fields=update_fields)
-            else:
-                tag.save()
-
-            # Обновляем ManyToMany связь departments
-            if new_department_ids is not None:
-                tag.departments.set(departments)
+            with transaction.atomic():
+                if update_fields:
+                    tag.save(update_fields=update_fields)
+                else:
+                    tag.save()
+
+                # Обновляем ManyToMany связь departments
+                if new_department_ids is not None:
+                    tag.departments.set(departments)
         except IntegrityError as err:
             raise ValueError("Ошибка при обновлении тега") from err
 
+        invalidate_tags()
         return tag
 
+    def ensure_departments_available(self, tag: Tag, department_ids) -> None:
+        """Проверяет, что тег можно перевести на новый набор подразделений.
+
+        Ключ набора пересчитывается сигналом после изменения связей, поэтому
+        дубликат нужно отсечь заранее — иначе уникальный индекс
+        (name, departments_key) упадёт с IntegrityError.
+
+        Args:
+            tag: Тег, у которого меняются подразделения
+            department_ids: Итоговый набор ID подразделений
+
+        Raises:
+            ValueError: Если тег с таким названием и набором уже существует
+        """
+        self._ensure_unique(
+            tag.name, Tag.build_departments_key(department_ids), exclude_pk=tag.pk
+        )
+
+    @staticmethod
+    def _ensure_unique(name: str, departments_key: str, exclude_pk: int) -> None:
+        if (
+            Tag.objects.filter(name=name, departments_key=departments_key)
+            .exclude(pk=exclude_pk)
+            .exists()
+        ):
+            raise ValueError(
+                "Тег с таким названием и таким набором подразделений уже существует"
+            )
+
     def delete(self, tag: Tag) -> bool:
         """Удаление тега.
 
@@ -176,8 +194,33 @@ class TagRepository:
         """
         tag_id = tag.id
         tag.delete()
+        invalidate_tags()
         return not Tag.objects.filter(pk=tag_id).exists()
 
+    def assign_base_tags(self, department_id: int) -> int:
+        """Привязывает все базовые теги к подразделению одной вставкой.
+
+        Уже существующие связи пропускаются.
+
+        Args:
+            department_id: ID подразделения
+
+        Returns:
+            Количество базовых тегов
+        """
+        Through = Tag.departments.through
+        links = [
+            Through(tag_id=tag_id, department_id=department_id)
+            for tag_id in Tag.objects.filter(is_base=True).values_list(
+                "pk", flat=True
+            )
+        ]
+        Through.objects.bulk_create(links, ignore_conflicts=True)
+        # bulk_create не отправляет m2m_changed — пересчитываем ключи явно
+        Tag.refresh_departments_keys(link.tag_id for link in links)
+        invalidate_tags()
+        return len(links)
+
     def get_all(self) -> "QuerySet[Tag]":
         """Получение всех тегов с оптимизацией запросов.
 
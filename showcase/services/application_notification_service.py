@@ -8,6 +8,7 @@ from django.conf import settings
 from django.core import mail
 from django.template.loader import render_to_string
 
+from core.metrics import emails_sent_total
 from showcase.models import ApplicationStatus, ProjectApplication
 
 logger = logging.getLogger(__name__)
@@ -154,9 +155,12 @@ class ApplicationNotificationService:
                 fail_silently=False,
             )
         except Exception as exc:
+            emails_sent_total.inc("failure")
             logger.warning(
                 "Не удалось отправить письмо на %s: %s",
                 recipient,
                 exc,
                 exc_info=True,
             )
+        else:
+            emails_sent_total.inc("success")
@@ -689,12 +689,22 @@ class ProjectApplicationService:
     def get_user_coordination_applications(self, user: User):
         """Бизнес-операция: получение заявок для координации пользователя.
 
+        Список из :meth:`get_user_coordination_applications_queryset`.
+        """
+        return list(self.get_user_coordination_applications_queryset(user))
+
+    def get_user_coordination_applications_queryset(self, user: User):
+        """Бизнес-операция: QuerySet заявок для координации пользователя.
+
         Для обычных пользователей:
         - Заявки, где пользователь причастен .
 
         Для валидаторов (department_validator, institute_validator):
         - Заявки, где пользователь причастен
         - ПЛЮС заявки, где причастно подразделение пользователя
+
+        Для cpds дополнительно — все заявки в статусе await_cpds, даже если
+        пользователь не причастен.
         """
         # 1. Проверка прав (Domain)
         user_role = user.role.code if user.role else "user"
@@ -702,34 +712,15 @@ class ProjectApplicationService:
         if not can_list:
             raise PermissionError(error)
 
-        # 2. Для большинства ролей получаем заявки в работе (Repository)
-        applications = self.repository.filter_coordination_by_user(user)
-
-        # 3. Если пользователь - валидатор (department_validator или institute_validator или cpds),
-        #    добавляем заявки, где причастно его подразделение
+        # 2. Условия видимости по роли; выборка — одним запросом (Repository)
+        department = None
         if user_role in ["department_validator", "institute_validator", "cpds"]:
-            if hasattr(user, "department") and user.department:
-                department_applications = (
-                    self.repository.filter_coordination_by_department(user.department)
-                )
-                # Объединяем и убираем дубликаты
-                application_ids = {app.id for app in applications}
-                for app in department_applications:
-                    if app.id not in application_ids:
-                        applications.append(app)
-                        application_ids.add(app.id)
-
-        # 4. Для роли cpds дополнительно добавляем все заявки со статусом await_cpds,
-        #    даже если пользователь не причастен
-        if user_role == "cpds":
-            await_cpds_apps = self.repository.filter_by_status("await_cpds")
-            application_ids = {app.id for app in applications}
-            for app in await_cpds_apps:
-                if app.id not in application_ids:
-                    applications.append(app)
-                    application_ids.add(app.id)
-
-        return applications
+            department = getattr(user, "department", None)
+        return self.repository.coordination_queryset(
+            user,
+            department=department,
+            include_status="await_cpds" if user_role == "cpds" else None,
+        )
 
     def get_application_dto(self, application) -> ProjectApplicationReadDTO:
         """Преобразование модели в DTO для чтения."""
@@ -741,25 +732,23 @@ class ProjectApplicationService:
 
     def get_applications_by_status(self, status_code: str, user: User):
         """Бизнес-операция: получение заявок по статусу."""
-        # 1. Проверка прав (Domain)
+        return list(self.get_applications_by_status_queryset(status_code, user))
+
+    def get_applications_by_status_queryset(self, status_code: str, user: User):
+        """Бизнес-операция: QuerySet заявок по статусу для пагинации."""
         if user.role and user.role.code not in ["admin", "moderator"]:
             raise PermissionError("Недостаточно прав для просмотра заявок по статусу")
+        return self.repository.filter_by_status_queryset(status_code)
 
-        # 2. Получаем заявки (Repository)
-        applications = self.repository.filter_by_status(status_code)
-
-        return applications
-
-    def get_recent_applications(self, limit: int = 10, user: User = None):
-        """Бизнес-операция: получение последних заявок."""
-        # 1. Проверка прав (Domain)
+    def get_recent_applications_queryset(self, user: User = None):
+        """Бизнес-операция: QuerySet последних заявок для пагинации."""
         if user and user.role and user.role.code not in ["admin", "moderator"]:
             raise PermissionError("Недостаточно прав для просмотра последних заявок")
+        return self.repository.get_all_applications_queryset()
 
-        # 2. Получаем заявки (Repository)
-        applications = self.repository.get_recent_applications(limit)
-
-        return applications
+    def get_recent_applications(self, limit: int = 10, user: User = None):
+        """Бизнес-операция: получение последних заявок."""
+        return list(self.get_recent_applications_queryset(user)[:limit])
 
     def get_all_applications_queryset(self, user: User):
         """Бизнес-операция: получение QuerySet всех заявок для пагинации."""
@@ -0,0 +1,94 @@
+"""Лента изменений заявок для long-polling клиентов.
+
+Лента строится по журналу ProjectApplicationStatusLog: клиент передаёт
+последний полученный ``id`` записи и получает более новые. Если новых
+записей нет, запрос может подождать их до ``wait`` секунд — ожидание
+выполняется в async view и не занимает поток воркера.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from django.conf import settings
+
+from accounts.models import User
+from showcase.domain.application import ProjectApplicationDomain
+from showcase.models import ProjectApplicationStatusLog
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 500
+
+
+def get_max_wait() -> float:
+    """Максимальное время ожидания новых записей, секунды."""
+    return float(getattr(settings, "CHANGE_FEED_MAX_WAIT", 25))
+
+
+def get_poll_interval() -> float:
+    """Интервал опроса журнала во время ожидания, секунды."""
+    return float(getattr(settings, "CHANGE_FEED_POLL_INTERVAL", 1.0))
+
+
+class ChangeFeedService:
+    """Выборка записей журнала заявок, видимых пользователю."""
+
+    def visible_logs(self, user: User):
+        """QuerySet записей журнала по заявкам, доступным пользователю.
+
+        Правило то же, что при просмотре заявки
+        (ProjectApplicationDomain.can_user_access_application): роли с
+        доступом ко всем заявкам видят весь журнал, остальные — только по
+        своим заявкам.
+        """
+        logs = ProjectApplicationStatusLog.objects.all()
+        role = user.role_id or "user"
+        if not ProjectApplicationDomain.can_user_access_all_applications(role):
+            logs = logs.filter(application__author=user)
+        return logs
+
+    async def fetch(
+        self, user: User, after: int, limit: int = DEFAULT_LIMIT
+    ) -> list[dict[str, Any]]:
+        """Записи с id больше ``after`` в порядке возрастания id."""
+        rows = (
+            self.visible_logs(user)
+            .filter(id__gt=after)
+            .order_by("id")
+            .values(
+                "id",
+                "application_id",
+                "action_type",
+                "from_status_id",
+                "to_status_id",
+                "actor_id",
+                "changed_at",
+            )[: min(limit, MAX_LIMIT)]
+        )
+        return [self._to_dict(row) async for row in rows]
+
+    async def wait_for_changes(
+        self, user: User, after: int, limit: int = DEFAULT_LIMIT, wait: float = 0
+    ) -> list[dict[str, Any]]:
+        """Как :meth:`fetch`, но при пустом результате ждёт до ``wait`` секунд."""
+        deadline = time.monotonic() + min(max(wait, 0), get_max_wait())
+        while True:
+            changes = await self.fetch(user, after, limit)
+            remaining = deadline - time.monotonic()
+            if changes or remaining <= 0:
+                return changes
+            await asyncio.sleep(min(get_poll_interval(), remaining))
+
+    @staticmethod
+    def _to_dict(row: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "id": row["id"],
+            "application_id": row["application_id"],
+            "action_type": row["action_type"],
+            "from_status": row["from_status_id"],
+            "to_status": row["to_status_id"],
+            "actor_id": row["actor_id"],
+            "changed_at": row["changed_at"].isoformat(),
+        }
@@ -10,6 +10,7 @@ from django.contrib.auth import get_user_model
 from django.db import transaction
 
 from accounts.models import Department
+from core.metrics import application_status_transitions_total
 from showcase.models import (
     ApplicationStatus,
     ProjectApplication,
@@ -68,6 +69,12 @@ class ApplicationLoggingService:
             previous_status_log=previous_log,
         )
 
+        # Метрику учитываем только после фиксации транзакции
+        transition = (from_status.pk if from_status else "none", to_status.pk)
+        transaction.on_commit(
+            lambda: application_status_transitions_total.inc(*transition)
+        )
+
         status_changed = from_status is None or from_status.pk != to_status.pk
         actor_is_author = (
             actor is not None
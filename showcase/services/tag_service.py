@@ -3,6 +3,7 @@
 Координирует Domain, Repository и DTO.
 """
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Optional
 
 from django.contrib.auth import get_user_model
@@ -10,6 +11,13 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 
 from accounts.models import Department
+from accounts.utils import get_user_department_with_parent
+from showcase.cache import (
+    TagCatalogue,
+    department_has_tags,
+    get_tag_catalogue,
+    invalidate_tags,
+)
 from showcase.domain.tag import TagDomain
 from showcase.dto.tag import TagCreateDTO, TagUpdateDTO
 from showcase.models import Tag
@@ -148,46 +156,21 @@ class TagService:
         Returns:
             QuerySet отфильтрованных тегов
         """
-        # Оптимизация: для всех пользователей с подразделением загружаем его с parent одним запросом
-        department = None
-        if user.is_authenticated and user.department:
-            try:
-                department = Department.objects.select_related("parent").get(
-                    pk=user.department.id
-                )
-                # Обновляем user.department для использования в domain
-                user.department = department
-            except Department.DoesNotExist:
-                pass
+        # Подразделение с parent: без запроса, если уже загружено при аутентификации
+        department = get_user_department_with_parent(user)
 
         # Для institute_validator: если у подразделения и родительского нет тегов,
         # автоматически сопоставляем все базовые теги с подразделением
-        if department:
-            # Проверяем, есть ли у подразделения или родительского связанные теги
+        role_code = user.role.code if getattr(user, "role", None) else None
+        if department and role_code == "institute_validator":
             department_ids = [department.id]
             if department.parent:
                 department_ids.append(department.parent.id)
 
-            # Используем exists() для более эффективной проверки
-            department_tags_exist = Tag.objects.filter(
-                departments__in=department_ids
-            ).exists()
-
-            # Автоматическое сопоставление только для institute_validator
-            if (
-                not department_tags_exist
-                and hasattr(user, "role")
-                and user.role
-                and user.role.code == "institute_validator"
-            ):
-                with transaction.atomic():
-                    # Сопоставляем все базовые теги с подразделением пользователя
-                    # Используем prefetch_related для оптимизации
-                    base_tags = Tag.objects.filter(is_base=True).prefetch_related(
-                        "departments"
-                    )
-                    for tag in base_tags:
-                        tag.departments.add(department)
+            # Флаг наличия тегов кешируется, поэтому обычный запрос списка
+            # не выполняет дополнительную проверку в БД
+            if not department_has_tags(department_ids):
+                self.repository.assign_base_tags(department.id)
 
         # Получаем базовый queryset через репозиторий
         queryset = self.repository.get_all()
@@ -195,6 +178,25 @@ class TagService:
         # Фильтруем через domain
         return self.domain.get_filtered_queryset(user, queryset)
 
+    def get_tag_catalogue(
+        self, user: User, serialize: Callable[["QuerySet[Tag]"], list[dict]]
+    ) -> TagCatalogue:
+        """Бизнес-операция: кешированный список тегов пользователя.
+
+        Список зависит только от области видимости (роль, подразделение и
+        родительское подразделение), поэтому кешируется для неё целиком.
+
+        Args:
+            user: Пользователь для фильтрации
+            serialize: Функция сериализации queryset тегов
+
+        Returns:
+            TagCatalogue: сериализованный список и его ETag
+        """
+        queryset = self.list_tags(user)
+        scope = self.domain.get_visibility_scope(user)
+        return get_tag_catalogue(scope, lambda: serialize(queryset))
+
     def get_tag(self, tag_id: int, user: User) -> Tag:
         """Бизнес-операция: получение тега по ID с проверкой доступа.
 
@@ -237,7 +239,8 @@ class TagService:
             Обновленный тег
 
         Raises:
-            ValueError: Если нет прав, тег/подразделение не найдены или данные некорректны
+            ValueError: Если нет прав, тег/подразделение не найдены, данные
+                некорректны или тег с таким набором подразделений уже существует
         """
         # Получаем тег
         try:
@@ -262,8 +265,14 @@ class TagService:
         if tag.departments.filter(pk=department_id).exists():
             raise ValueError("Подразделение уже присоединено к этому тегу")
 
+        department_ids = [dept.pk for dept in tag.departments.all()]
+        self.repository.ensure_departments_available(
+            tag, [*department_ids, department_id]
+        )
+
         # Присоединяем подразделение
         tag.departments.add(department)
+        invalidate_tags()
 
         # Обновляем тег из БД для возврата актуальных данных
         return self.repository.get_by_id(tag_id)
@@ -286,7 +295,8 @@ class TagService:
             Обновленный тег или None, if тег был удален
 
         Raises:
-            ValueError: Если нет прав, тег/подразделение не найдены или данные некорректны
+            ValueError: Если нет прав, тег/подразделение не найдены, данные
+                некорректны или тег с оставшимся набором подразделений уже существует
         """
         # Получаем тег
         try:
@@ -311,16 +321,21 @@ class TagService:
         if not tag.departments.filter(pk=department_id).exists():
             raise ValueError("Подразделение не присоединено к этому тегу")
 
-        # Отцепляем подразделение
-        tag.departments.remove(department)
-
-        # Проверяем, остались ли подразделения у тега
-        remaining_departments_count = tag.departments.count()
+        remaining_ids = [
+            dept.pk for dept in tag.departments.all() if dept.pk != department_id
+        ]
 
-        # If тег не базовый и подразделений не осталось - удаляем тег
-        if not tag.is_base and remaining_departments_count == 0:
+        # If тег не базовый и подразделений не останется - удаляем тег сразу:
+        # его пустой ключ может совпасть с общим тегом того же названия
+        if not tag.is_base and not remaining_ids:
             self.repository.delete(tag)
             return None
 
+        self.repository.ensure_departments_available(tag, remaining_ids)
+
+        # Отцепляем подразделение
+        tag.departments.remove(department)
+        invalidate_tags()
+
         # Обновляем тег из БД для возврата актуальных данных
         return self.repository.get_by_id(tag_id)
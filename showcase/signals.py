@@ -12,3 +12,58 @@
 # from showcase.services.status import StatusServiceFactory
 # status_manager = StatusServiceFactory.create_status_manager()
 # status_manager.change_status(application, new_status, actor, comments)
+#
+# Исключение — Tag.departments_key: ключ участвует в уникальном индексе,
+# поэтому пересчитывается при любом изменении связей тегов с подразделениями
+# (включая админку и удаление подразделений), а не только из сервисов.
+# При удалении подразделения тег, совпавший с существующим по названию и
+# оставшемуся набору подразделений, сливается с ним (Tag.merge_into): удаление
+# подразделения не должно блокироваться тегами.
+#
+# Институты входят в карту институтов подразделений (accounts.cache), поэтому
+# их изменение сбрасывает её версию.
+
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from accounts.cache import invalidate_department_institutes
+from accounts.models import Department
+from showcase.cache import invalidate_tags
+from showcase.models import Institute, Tag
+
+
+@receiver(m2m_changed, sender=Tag.departments.through)
+def refresh_tag_departments_key(sender, instance, action, reverse, pk_set, **kwargs):
+    """Пересчитывает ключ набора подразделений у затронутых тегов."""
+    if not reverse:
+        if action in {"post_add", "post_remove", "post_clear"}:
+            Tag.refresh_departments_keys([instance.pk])
+        return
+
+    # Изменение со стороны подразделения: pk_set содержит ID тегов
+    if action == "pre_clear":
+        instance._cleared_tag_ids = list(instance.tags.values_list("pk", flat=True))
+    elif action == "post_clear":
+        Tag.refresh_departments_keys(getattr(instance, "_cleared_tag_ids", []))
+    elif action in {"post_add", "post_remove"}:
+        Tag.refresh_departments_keys(pk_set or [])
+
+
+@receiver(pre_delete, sender=Department)
+def remember_department_tags(sender, instance, **kwargs):
+    """Запоминает теги подразделения: связи удалятся каскадно без m2m_changed."""
+    instance._tag_ids = list(instance.tags.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=Department)
+def refresh_deleted_department_tags(sender, instance, **kwargs):
+    tag_ids = getattr(instance, "_tag_ids", [])
+    Tag.refresh_departments_keys(tag_ids, merge_duplicates=True)
+    if tag_ids:
+        invalidate_tags()
+
+
+@receiver(post_save, sender=Institute)
+@receiver(post_delete, sender=Institute)
+def invalidate_institutes_map(sender, **kwargs):
+    invalidate_department_institutes()
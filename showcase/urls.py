@@ -1,5 +1,7 @@
+from django.urls import path
 from rest_framework.routers import DefaultRouter
 
+from showcase import async_views
 from showcase.entities.ApplicationStatus import ApplicationStatusViewSet
 from showcase.entities.DepartmentPlan import DepartmentPlanViewSet
 from showcase.entities.Institute import InstituteViewSet
@@ -29,4 +31,18 @@ router.register(r"semesters", SemesterViewSet, basename="semester")
 
 router.register(r"department-plans", DepartmentPlanViewSet, basename="department-plan")
 
-urlpatterns = router.urls
+urlpatterns = [
+    # Async view только для чтения (эффективны при запуске через ASGI)
+    path(
+        "async/project-applications/",
+        async_views.project_application_list,
+        name="project-application-async-list",
+    ),
+    path(
+        "async/project-applications/<int:pk>/",
+        async_views.project_application_detail,
+        name="project-application-async-detail",
+    ),
+    path("changes/", async_views.change_feed, name="change-feed"),
+    *router.urls,
+]
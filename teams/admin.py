@@ -31,11 +31,13 @@ class StudyGroupAdmin(admin.ModelAdmin):
         "institute__name",
     )
     autocomplete_fields = ("direction", "institute")
+    list_select_related = ("direction", "institute")
 
 
 class TeamMemberInline(admin.TabularInline):
     model = TeamMember
     extra = 0
+    raw_id_fields = ("user",)
 
 
 @admin.register(Team)
@@ -44,6 +46,9 @@ class TeamAdmin(admin.ModelAdmin):
     search_fields = ("name", "leader__email", "leader__last_name")
     list_filter = ("created_at",)
     inlines = [TeamMemberInline]
+    list_select_related = ("leader__role", "project_application")
+    raw_id_fields = ("leader", "project_application")
+    autocomplete_fields = ("study_group",)
 
 
 @admin.register(TeamMember)
@@ -51,3 +56,5 @@ class TeamMemberAdmin(admin.ModelAdmin):
     list_display = ("id", "team", "user", "role", "joined_at")
     list_filter = ("role",)
     search_fields = ("team__name", "user__email", "user__last_name")
+    list_select_related = ("team", "user__role")
+    raw_id_fields = ("team", "user")
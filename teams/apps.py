@@ -5,3 +5,7 @@ class TeamsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "teams"
     verbose_name = "Команды"
+
+    def ready(self):
+        # Инвалидация карты направлений институтов (teams.cache)
+        from teams import signals  # noqa: F401
@@ -0,0 +1,102 @@
+"""Кеш карты доступа к институтам и направлениям.
+
+Фильтрация направлений и учебных групп для institute_validator опирается
+на две связи: подразделение → институты и институт → направления (через
+учебные группы). Первая связь берётся из кеша accounts
+(:func:`accounts.cache.get_department_institute_map`), вторая собирается
+одним запросом и кешируется под версионированным ключом. Изменение учебных
+групп увеличивает версию через :func:`invalidate_institute_access`
+(сигналы teams.signals и команда импорта).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from accounts.cache import (
+    DepartmentInstituteMap,
+    bump_version,
+    get_department_institute_map,
+)
+from core.cache import cache_ttl
+from teams.models import StudyGroup
+
+INSTITUTE_ACCESS_VERSION_KEY = "teams:institute_access:version"
+INSTITUTE_ACCESS_MAP_KEY = "teams:institute_access:{version}:directions"
+
+
+@dataclass(frozen=True)
+class InstituteAccessMap:
+    """Предвычисленные связи подразделений, институтов и направлений."""
+
+    departments: DepartmentInstituteMap
+    institute_directions: dict[str, tuple[str, ...]]
+
+    def institute_codes_for_department(self, department_id: int | None) -> list[str]:
+        """Институты подразделения и его родителя."""
+        return self.departments.institute_codes_for_department(department_id)
+
+    def direction_codes_for_institutes(self, institute_codes: Iterable[str]) -> list[str]:
+        """Направления, по которым есть группы в указанных институтах."""
+        codes: set[str] = set()
+        for institute_code in institute_codes:
+            codes.update(self.institute_directions.get(institute_code, ()))
+        return sorted(codes)
+
+
+def get_institute_access_ttl() -> int:
+    """TTL карты направлений институтов в секундах (0 — кеш отключён)."""
+    return cache_ttl(int(getattr(settings, "INSTITUTE_ACCESS_CACHE_TTL", 300)))
+
+
+def build_institute_directions() -> dict[str, tuple[str, ...]]:
+    """Направления институтов по учебным группам одним запросом."""
+    institute_directions: dict[str, list[str]] = defaultdict(list)
+    for institute_code, direction_code in (
+        StudyGroup.objects.order_by()
+        .values_list("institute_id", "direction_id")
+        .distinct()
+    ):
+        institute_directions[institute_code].append(direction_code)
+    return {key: tuple(sorted(value)) for key, value in institute_directions.items()}
+
+
+def get_institute_directions() -> dict[str, tuple[str, ...]]:
+    """Направления институтов из кеша; при промахе собираются и сохраняются."""
+    ttl = get_institute_access_ttl()
+    if ttl <= 0:
+        return build_institute_directions()
+
+    key = INSTITUTE_ACCESS_MAP_KEY.format(
+        version=cache.get(INSTITUTE_ACCESS_VERSION_KEY, 0)
+    )
+    directions = cache.get(key)
+    if directions is None:
+        directions = build_institute_directions()
+        cache.set(key, directions, ttl)
+    return directions
+
+
+def get_institute_access_map() -> InstituteAccessMap:
+    """Карта доступа из кешированных частей accounts и teams."""
+    return InstituteAccessMap(
+        departments=get_department_institute_map(),
+        institute_directions=get_institute_directions(),
+    )
+
+
+def invalidate_institute_access() -> None:
+    """Инвалидирует направления институтов.
+
+    Внутри транзакции версия увеличивается ещё раз после фиксации, чтобы
+    параллельный запрос не закешировал данные до коммита.
+    """
+    bump_version(INSTITUTE_ACCESS_VERSION_KEY)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: bump_version(INSTITUTE_ACCESS_VERSION_KEY))
@@ -3,8 +3,11 @@
 from django.db.models import QuerySet
 
 from accounts.models import User
-from teams.domain.institute_access import get_user_institute_codes
-from teams.models import Direction, StudyGroup
+from teams.domain.institute_access import (
+    get_user_direction_codes,
+    get_user_institute_codes,
+)
+from teams.models import Direction
 
 
 class DirectionDomain:
@@ -23,15 +26,9 @@ class DirectionDomain:
         role_code = user.role.code if user.role else None
 
         if role_code == "institute_validator":
-            institute_codes = get_user_institute_codes(user)
-            if not institute_codes:
+            direction_codes = get_user_direction_codes(user)
+            if not direction_codes:
                 return queryset.none()
-
-            direction_codes = (
-                StudyGroup.objects.filter(institute_id__in=institute_codes)
-                .values_list("direction_id", flat=True)
-                .distinct()
-            )
             return queryset.filter(code__in=direction_codes)
 
         return queryset
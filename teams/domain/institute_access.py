@@ -1,25 +1,24 @@
 """Общая логика доступа к институтам по подразделению пользователя."""
 
 from accounts.models import User
-from showcase.models import Institute
+from teams.cache import get_institute_access_map
 
 
 def get_user_institute_codes(user: User) -> list[str]:
-    """Коды активных институтов, связанных с подразделением пользователя."""
+    """Коды активных институтов, связанных с подразделением пользователя.
+
+    Учитываются подразделение пользователя и его родитель. Данные берутся
+    из кешированной карты доступа — без запросов к БД.
+    """
     if not user.department_id:
         return []
+    return get_institute_access_map().institute_codes_for_department(
+        user.department_id
+    )
 
-    department_ids = [user.department_id]
-    parent_id = getattr(user.department, "parent_id", None)
-    if parent_id is None and hasattr(user.department, "parent"):
-        parent = user.department.parent
-        parent_id = parent.id if parent else None
-    if parent_id:
-        department_ids.append(parent_id)
 
-    return list(
-        Institute.objects.filter(
-            department_id__in=department_ids,
-            is_active=True,
-        ).values_list("code", flat=True)
-    )
+def get_user_direction_codes(user: User) -> list[str]:
+    """Коды направлений, по которым есть группы в институтах пользователя."""
+    access_map = get_institute_access_map()
+    institute_codes = access_map.institute_codes_for_department(user.department_id)
+    return access_map.direction_codes_for_institutes(institute_codes)
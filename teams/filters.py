@@ -0,0 +1,24 @@
+"""Фильтры списков приложения teams."""
+
+from django.db.models import QuerySet
+import django_filters
+
+from teams.models import Team
+from teams.repositories.team import TeamRepository
+
+
+class TeamFilter(django_filters.FilterSet):
+    """Фильтры команд: по проектной заявке, руководителю и участнику."""
+
+    project_application = django_filters.NumberFilter(
+        field_name="project_application_id"
+    )
+    leader = django_filters.NumberFilter(field_name="leader_id")
+    member = django_filters.NumberFilter(method="filter_member")
+
+    class Meta:
+        model = Team
+        fields = ("project_application", "leader", "member")
+
+    def filter_member(self, queryset: QuerySet, name: str, value: int) -> QuerySet:
+        return TeamRepository().filter_by_member(queryset, value)
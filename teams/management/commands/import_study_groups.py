@@ -1,15 +1,27 @@
-"""Идемпотентный импорт учебных групп из CSV."""
+"""Идемпотентный импорт учебных групп из CSV.
 
+Файлы читаются построчно и обрабатываются пачками: каждая пачка
+сопоставляется с базой по коду группы одним запросом и записывается
+через ``bulk_create`` / ``bulk_update``. Институты и направления
+проверяются по множествам кодов, загруженным один раз до импорта.
+"""
+
+from collections.abc import Iterable, Iterator
 import csv
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 
 from django.apps import apps
 from django.core.management.base import BaseCommand, CommandError
 
+from core.bulk_import import BulkUpsert, ImportResult, import_transaction
 from showcase.models import Institute
+from teams.cache import invalidate_institute_access
 from teams.models import Direction, StudyGroup
 
 DEFAULT_FILENAME = "ief_study_groups.csv"
+DEFAULT_BATCH_SIZE = 1000
 REQUIRED_COLUMNS = (
     "Институт",
     "Название группы",
@@ -17,12 +29,24 @@ REQUIRED_COLUMNS = (
     "Код",
     "Направление обучения",
 )
+UPDATE_FIELDS = ("name", "institute_id", "direction_id", "course_number", "is_end")
+
+
+@dataclass(frozen=True)
+class StudyGroupRecord:
+    code: str
+    name: str
+    institute_id: str
+    direction_id: str
+    course_number: int
+    is_end: bool = False
 
 
 class Command(BaseCommand):
     help = (
         "Импорт учебных групп из CSV. "
         "Колонки: Институт, Название группы, Курс, Код, Направление обучения. "
+        "Можно передать несколько файлов (группы любых институтов). "
         "По умолчанию: teams/data/ief_study_groups.csv"
     )
 
@@ -30,61 +54,97 @@ class Command(BaseCommand):
         parser.add_argument(
             "--file",
             type=str,
-            help="Путь к CSV (иначе teams/data/ief_study_groups.csv)",
+            action="append",
+            help=(
+                "Путь к CSV (иначе teams/data/ief_study_groups.csv); "
+                "флаг можно повторять"
+            ),
         )
         parser.add_argument(
             "--clear",
             action="store_true",
-            help="Удалить группы институтов из CSV перед импортом",
+            help="Удалить группы институтов из CSV, которых нет в файлах",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Размер пачки (по умолчанию {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Показать изменения без записи в БД",
         )
 
     def handle(self, *args, **options):
-        path = self._resolve_path(options.get("file"))
-        if not path.is_file():
-            raise CommandError(f"Файл не найден: {path}")
-
-        rows = self._read_rows(path)
-        if options["clear"]:
-            codes = {r["institute_code"] for r in rows}
-            deleted, _ = StudyGroup.objects.filter(institute_id__in=codes).delete()
-            self.stdout.write(f"Удалено групп: {deleted}")
-
-        created = 0
-        updated = 0
-        for r in rows:
-            _, was_created = StudyGroup.objects.update_or_create(
-                code=r["code"],
-                defaults={
-                    "name": r["name"],
-                    "institute_id": r["institute_code"],
-                    "direction_id": r["direction_code"],
-                    "course_number": r["course_number"],
-                    "is_end": False,
-                },
-            )
-            if was_created:
-                created += 1
-            else:
-                updated += 1
-
+        paths = self._resolve_paths(options.get("file"))
+        for path in paths:
+            if not path.is_file():
+                raise CommandError(f"Файл не найден: {path}")
+
+        self._institutes = set(Institute.objects.values_list("code", flat=True))
+        self._directions = set(Direction.objects.values_list("code", flat=True))
+        self._seen_codes: set[str] = set()
+        self._seen_institutes: set[str] = set()
+
+        engine = BulkUpsert(
+            StudyGroup, "code", UPDATE_FIELDS, batch_size=options["batch_size"]
+        )
+        total = ImportResult()
+        with import_transaction(options["dry_run"]):
+            for path in paths:
+                records = self._read_records(path)
+                for chunk in self._chunks(records, options["batch_size"]):
+                    plan = engine.plan(
+                        chunk,
+                        queryset=StudyGroup.objects.filter(
+                            code__in=[r.code for r in chunk]
+                        ),
+                    )
+                    result = engine.apply(plan)
+                    total.created += result.created
+                    total.updated += result.updated
+                    total.unchanged += result.unchanged
+
+            if options["clear"]:
+                total.deleted, _ = (
+                    StudyGroup.objects.filter(institute_id__in=self._seen_institutes)
+                    .exclude(code__in=self._seen_codes)
+                    .delete()
+                )
+            invalidate_institute_access()
+
+        prefix = "Пробный запуск. " if options["dry_run"] else ""
         self.stdout.write(
-            self.style.SUCCESS(f"Готово: создано {created}, обновлено {updated}")
+            self.style.SUCCESS(
+                f"{prefix}Готово: создано {total.created}, обновлено {total.updated}, "
+                f"без изменений {total.unchanged}, удалено {total.deleted}"
+            )
         )
 
-    def _read_rows(self, path: Path) -> list[dict]:
-        parsed: list[dict] = []
+    @staticmethod
+    def _chunks(
+        records: Iterable[StudyGroupRecord], size: int
+    ) -> Iterator[list[StudyGroupRecord]]:
+        iterator = iter(records)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
+
+    def _read_records(self, path: Path) -> Iterator[StudyGroupRecord]:
         with path.open(encoding="utf-8-sig", newline="") as f:
             reader = csv.DictReader(f)
             if reader.fieldnames is None:
-                raise CommandError("CSV без заголовка")
+                raise CommandError(f"{path.name}: CSV без заголовка")
             missing = set(REQUIRED_COLUMNS) - set(reader.fieldnames)
             if missing:
-                raise CommandError("Нет колонок: " + ", ".join(sorted(missing)))
+                raise CommandError(
+                    f"{path.name}: нет колонок: " + ", ".join(sorted(missing))
+                )
             for line_no, row in enumerate(reader, start=2):
-                parsed.append(self._parse_row(line_no, row))
-        return parsed
+                yield self._parse_row(f"{path.name}, строка {line_no}", row)
 
-    def _parse_row(self, line_no: int, row: dict[str, str]) -> dict:
+    def _parse_row(self, where: str, row: dict[str, str]) -> StudyGroupRecord:
         institute_code = (row.get("Институт") or "").strip()
         name = (row.get("Название группы") or "").strip()
         course_raw = (row.get("Курс") or "").strip()
@@ -93,39 +153,39 @@ class Command(BaseCommand):
 
         if not institute_code or not name or not course_raw or not code:
             raise CommandError(
-                f"Строка {line_no}: пустые Институт, Название группы, Курс или Код"
+                f"{where}: пустые Институт, Название группы, Курс или Код"
             )
         if not direction_code:
-            raise CommandError(f"Строка {line_no}: не указано направление обучения")
+            raise CommandError(f"{where}: не указано направление обучения")
         try:
             course_number = int(course_raw)
         except ValueError as exc:
-            raise CommandError(
-                f"Строка {line_no}: курс «{course_raw}» не число"
-            ) from exc
+            raise CommandError(f"{where}: курс «{course_raw}» не число") from exc
         if course_number < 1:
-            raise CommandError(f"Строка {line_no}: курс должен быть >= 1")
+            raise CommandError(f"{where}: курс должен быть >= 1")
 
-        if not Institute.objects.filter(code=institute_code).exists():
-            raise CommandError(
-                f"Строка {line_no}: институт «{institute_code}» не найден"
-            )
-        if not Direction.objects.filter(code=direction_code).exists():
+        if institute_code not in self._institutes:
+            raise CommandError(f"{where}: институт «{institute_code}» не найден")
+        if direction_code not in self._directions:
             raise CommandError(
-                f"Строка {line_no}: направление «{direction_code}» не найдено "
+                f"{where}: направление «{direction_code}» не найдено "
                 "(сначала import_directions)"
             )
+        if code in self._seen_codes:
+            raise CommandError(f"{where}: код группы «{code}» повторяется")
+        self._seen_codes.add(code)
+        self._seen_institutes.add(institute_code)
+
+        return StudyGroupRecord(
+            code=code,
+            name=name,
+            institute_id=institute_code,
+            direction_id=direction_code,
+            course_number=course_number,
+        )
 
-        return {
-            "institute_code": institute_code,
-            "name": name,
-            "course_number": course_number,
-            "code": code,
-            "direction_code": direction_code,
-        }
-
-    def _resolve_path(self, file_arg: str | None) -> Path:
-        if file_arg:
-            return Path(file_arg).resolve()
+    def _resolve_paths(self, file_args: list[str] | None) -> list[Path]:
+        if file_args:
+            return [Path(file_arg).resolve() for file_arg in file_args]
         base = Path(apps.get_app_config("teams").path) / "data"
-        return base / DEFAULT_FILENAME
+        return [base / DEFAULT_FILENAME]
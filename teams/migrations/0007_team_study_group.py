@@ -0,0 +1,24 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("teams", "0006_direction_code_primary_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="team",
+            name="study_group",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="teams",
+                to="teams.studygroup",
+                verbose_name="Учебная группа",
+            ),
+        ),
+    ]
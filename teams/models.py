@@ -91,6 +91,14 @@ class Team(models.Model):
         related_name="teams",
         verbose_name="Проектная заявка",
     )
+    study_group = models.ForeignKey(
+        StudyGroup,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="teams",
+        verbose_name="Учебная группа",
+    )
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата изменения")
 
@@ -0,0 +1,60 @@
+"""Репозиторий для команд и их участников."""
+
+from collections.abc import Iterable
+
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Exists, OuterRef, QuerySet
+
+from teams.models import Team, TeamMember
+
+User = get_user_model()
+
+
+class TeamRepository:
+    """Доступ к данным Team и TeamMember."""
+
+    def get_list_queryset(self) -> QuerySet[Team]:
+        """Команды для списка: руководитель и число участников без загрузки состава."""
+        return Team.objects.select_related("leader").annotate(
+            members_count=Count("members")
+        )
+
+    def get_detail_queryset(self) -> QuerySet[Team]:
+        """Команды с полным составом."""
+        return (
+            Team.objects.select_related("leader")
+            .prefetch_related("members__user")
+            .annotate(members_count=Count("members"))
+        )
+
+    def filter_by_member(self, queryset: QuerySet[Team], user_id: int) -> QuerySet[Team]:
+        """Команды, где состоит пользователь.
+
+        EXISTS вместо JOIN: не размножает строки и не искажает members_count.
+        """
+        return queryset.filter(
+            Exists(TeamMember.objects.filter(team_id=OuterRef("pk"), user_id=user_id))
+        )
+
+    def get_member_roles(self, team: Team, user_ids: Iterable[int]) -> dict[int, str]:
+        """Роли уже состоящих в команде пользователей из списка."""
+        return dict(
+            TeamMember.objects.filter(team=team, user_id__in=list(user_ids)).values_list(
+                "user_id", "role"
+            )
+        )
+
+    def get_existing_user_ids(self, user_ids: Iterable[int]) -> set[int]:
+        return set(User.objects.filter(pk__in=list(user_ids)).values_list("pk", flat=True))
+
+    def bulk_add_members(self, team: Team, user_ids: Iterable[int], role: str) -> None:
+        TeamMember.objects.bulk_create(
+            [TeamMember(team=team, user_id=user_id, role=role) for user_id in user_ids],
+            ignore_conflicts=True,
+        )
+
+    def bulk_remove_members(self, team: Team, user_ids: Iterable[int]) -> int:
+        deleted, _ = TeamMember.objects.filter(
+            team=team, user_id__in=list(user_ids)
+        ).delete()
+        return deleted
@@ -44,6 +44,7 @@ class TeamSerializer(serializers.ModelSerializer):
         required=False,
     )
     members = TeamMemberSerializer(many=True, read_only=True)
+    members_count = serializers.SerializerMethodField()
     project_application_id = serializers.PrimaryKeyRelatedField(
         queryset=ProjectApplication.objects.all(),
         source="project_application",
@@ -61,7 +62,44 @@ class TeamSerializer(serializers.ModelSerializer):
             "leader_id",
             "project_application_id",
             "members",
+            "members_count",
             "created_at",
             "updated_at",
         )
         read_only_fields = ("id", "created_at", "updated_at")
+
+    def get_members_count(self, obj: Team) -> int:
+        # В списках значение аннотировано запросом; после создания — считаем
+        count = getattr(obj, "members_count", None)
+        return obj.members.count() if count is None else count
+
+
+class TeamListSerializer(TeamSerializer):
+    """Команда в списке: без состава, только число участников."""
+
+    class Meta(TeamSerializer.Meta):
+        fields = tuple(f for f in TeamSerializer.Meta.fields if f != "members")
+
+
+class TeamMembersBulkSerializer(serializers.Serializer):
+    """Пакетное добавление или удаление участников."""
+
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=1000,
+    )
+    role = serializers.ChoiceField(
+        choices=TeamMember.Role.choices,
+        default=TeamMember.Role.MEMBER,
+    )
+
+
+class TeamFormationSerializer(serializers.Serializer):
+    """Параметры пакетного формирования команд."""
+
+    semester_id = serializers.CharField(help_text="ID семестра, next или actual")
+    teams_per_application = serializers.IntegerField(
+        min_value=1, max_value=50, default=1
+    )
+    dry_run = serializers.BooleanField(default=True)
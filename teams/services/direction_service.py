@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 
-from accounts.models import Department
 from teams.domain.direction import DirectionDomain
 from teams.models import Direction
 from teams.repositories.direction import DirectionRepository
@@ -25,15 +24,6 @@ class DirectionService:
 
     def list_directions(self, user: User) -> "QuerySet[Direction]":
         """Список направлений с фильтрацией по роли."""
-        if user.is_authenticated and user.department_id:
-            try:
-                department = Department.objects.select_related("parent").get(
-                    pk=user.department_id
-                )
-                user.department = department
-            except Department.DoesNotExist:
-                pass
-
         queryset = self.repository.get_all()
         return self.domain.get_filtered_queryset(user, queryset)
 
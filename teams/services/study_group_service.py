@@ -5,7 +5,6 @@ from typing import TYPE_CHECKING
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
 
-from accounts.models import Department
 from teams.domain.study_group import StudyGroupDomain
 from teams.models import StudyGroup
 from teams.repositories.study_group import StudyGroupRepository
@@ -24,15 +23,6 @@ class StudyGroupService:
         self.domain = StudyGroupDomain()
 
     def list_study_groups(self, user: User) -> "QuerySet[StudyGroup]":
-        if user.is_authenticated and user.department_id:
-            try:
-                department = Department.objects.select_related("parent").get(
-                    pk=user.department_id
-                )
-                user.department = department
-            except Department.DoesNotExist:
-                pass
-
         queryset = self.repository.get_all()
         return self.domain.get_filtered_queryset(user, queryset)
 
@@ -0,0 +1,185 @@
+"""Сервис пакетного формирования команд по одобренным заявкам семестра."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from accounts.models import User
+from showcase.models import ProjectApplication, Tag
+from teams.domain.team_formation import (
+    AllocationResult,
+    ApplicationDemand,
+    GroupSupply,
+    TeamFormationDomain,
+)
+from teams.models import StudyGroup, Team, TeamMember
+
+APPROVED_STATUS_CODE = "approved"
+BATCH_SIZE = 500
+
+
+class TeamFormationService:
+    """Загрузка исходных данных, распределение и создание команд.
+
+    Все данные читаются несколькими запросами values_list, алгоритм
+    работает в памяти (см. TeamFormationDomain), а команды создаются
+    двумя bulk_create — независимо от числа заявок и групп.
+    """
+
+    def __init__(self):
+        self.domain = TeamFormationDomain()
+
+    def preview(self, semester_id: int, teams_per_application: int = 1) -> dict:
+        """Распределение без записи в БД."""
+        applications, groups = self._load(semester_id, teams_per_application)
+        allocation = self.domain.allocate(
+            list(applications.values()), list(groups.values())
+        )
+        return self._to_dict(semester_id, allocation, applications, groups)
+
+    @transaction.atomic
+    def form(
+        self, semester_id: int, leader: User, teams_per_application: int = 1
+    ) -> dict:
+        """Распределяет группы и создаёт команды.
+
+        Заявки, у которых уже есть команды, и группы, уже назначенные на
+        проекты этого семестра, пропускаются, поэтому повторный вызов
+        создаёт команды только для новых заявок.
+
+        Args:
+            semester_id: ID семестра
+            leader: Руководитель создаваемых команд (позже можно сменить)
+            teams_per_application: Сколько групп назначать на одну заявку
+        """
+        applications, groups = self._load(
+            semester_id, teams_per_application, lock=True
+        )
+        allocation = self.domain.allocate(
+            list(applications.values()), list(groups.values())
+        )
+
+        teams = Team.objects.bulk_create(
+            [
+                Team(
+                    name=self._team_name(
+                        applications[item.application_id], groups[item.group_id]
+                    ),
+                    leader=leader,
+                    project_application_id=item.application_id,
+                    study_group_id=item.group_id,
+                )
+                for item in allocation.assignments
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        TeamMember.objects.bulk_create(
+            [
+                TeamMember(team=team, user=leader, role=TeamMember.Role.LEADER)
+                for team in teams
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+        result = self._to_dict(semester_id, allocation, applications, groups)
+        result["created_teams"] = len(teams)
+        return result
+
+    def _load(
+        self, semester_id: int, teams_per_application: int, lock: bool = False
+    ) -> tuple[dict[int, ApplicationDemand], dict[int, GroupSupply]]:
+        applications_qs = (
+            ProjectApplication.objects.filter(
+                semester_id=semester_id,
+                status_id=APPROVED_STATUS_CODE,
+            )
+            .exclude(Exists(Team.objects.filter(project_application=OuterRef("pk"))))
+            .order_by("id")
+        )
+        if lock:
+            # Параллельный запуск дождётся окончания текущего
+            applications_qs = applications_qs.select_for_update()
+        titles = dict(applications_qs.values_list("id", "title"))
+
+        institutes: dict[int, set[str]] = defaultdict(set)
+        TargetInstitutes = ProjectApplication.target_institutes.through
+        for app_id, code in TargetInstitutes.objects.filter(
+            projectapplication_id__in=titles
+        ).values_list("projectapplication_id", "institute_id"):
+            institutes[app_id].add(code)
+
+        tag_departments: dict[int, set[int]] = defaultdict(set)
+        TagDepartments = Tag.departments.through
+        tag_rows = ProjectApplication.tags.through.objects.filter(
+            projectapplication_id__in=titles
+        ).values_list("projectapplication_id", "tag_id")
+        apps_by_tag: dict[int, list[int]] = defaultdict(list)
+        for app_id, tag_id in tag_rows:
+            apps_by_tag[tag_id].append(app_id)
+        for tag_id, department_id in TagDepartments.objects.filter(
+            tag_id__in=apps_by_tag
+        ).values_list("tag_id", "department_id"):
+            for app_id in apps_by_tag[tag_id]:
+                tag_departments[app_id].add(department_id)
+
+        applications = {
+            app_id: ApplicationDemand(
+                id=app_id,
+                title=title or f"Заявка #{app_id}",
+                institute_codes=frozenset(institutes[app_id]),
+                tag_department_ids=frozenset(tag_departments[app_id]),
+                slots=teams_per_application,
+            )
+            for app_id, title in titles.items()
+        }
+
+        group_rows = (
+            StudyGroup.objects.filter(is_end=False)
+            .exclude(teams__project_application__semester_id=semester_id)
+            .order_by("id")
+            .values_list(
+                "id",
+                "code",
+                "name",
+                "institute_id",
+                "institute__department_id",
+                "course_number",
+            )
+        )
+        groups = {row[0]: GroupSupply(*row) for row in group_rows}
+        return applications, groups
+
+    @staticmethod
+    def _team_name(application: ApplicationDemand, group: GroupSupply) -> str:
+        return f"{group.name}: {application.title}"[:255]
+
+    @staticmethod
+    def _to_dict(
+        semester_id: int,
+        allocation: AllocationResult,
+        applications: dict[int, ApplicationDemand],
+        groups: dict[int, GroupSupply],
+    ) -> dict[str, Any]:
+        return {
+            "semester_id": semester_id,
+            "assignments": [
+                {
+                    "application_id": item.application_id,
+                    "application_title": applications[item.application_id].title,
+                    "study_group_id": item.group_id,
+                    "study_group_code": groups[item.group_id].code,
+                    "score": item.score,
+                }
+                for item in allocation.assignments
+            ],
+            "unfilled": [
+                {"application_id": app_id, "missing": missing}
+                for app_id, missing in allocation.unfilled.items()
+            ],
+            "unused_groups": len(allocation.unused_group_ids),
+            "created_teams": 0,
+        }
@@ -0,0 +1,83 @@
+"""Сервис для операций с командами."""
+
+from django.db import transaction
+
+from teams.models import Team, TeamMember
+from teams.repositories.team import TeamRepository
+
+
+class TeamService:
+    """Оркестрация операций с составом команд."""
+
+    # Статусы результата по каждому пользователю
+    ADDED = "added"
+    ALREADY_MEMBER = "already_member"
+    REMOVED = "removed"
+    NOT_MEMBER = "not_member"
+    IS_LEADER = "leader"
+    NOT_FOUND = "not_found"
+
+    def __init__(self):
+        self.repository = TeamRepository()
+
+    @transaction.atomic
+    def add_members(
+        self, team: Team, user_ids: list[int], role: str = TeamMember.Role.MEMBER
+    ) -> list[dict]:
+        """Добавляет пользователей в команду одной вставкой.
+
+        Args:
+            team: Команда
+            user_ids: ID пользователей (повторы игнорируются)
+            role: Роль новых участников
+
+        Returns:
+            Список {"user_id", "status"} в порядке входных ID
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        existing_users = self.repository.get_existing_user_ids(user_ids)
+        current = self.repository.get_member_roles(team, user_ids)
+
+        results = []
+        to_add = []
+        for user_id in user_ids:
+            if user_id not in existing_users:
+                status = self.NOT_FOUND
+            elif user_id in current:
+                status = self.ALREADY_MEMBER
+            else:
+                status = self.ADDED
+                to_add.append(user_id)
+            results.append({"user_id": user_id, "status": status})
+
+        # ignore_conflicts защищает от параллельного добавления того же участника
+        self.repository.bulk_add_members(team, to_add, role)
+        return results
+
+    @transaction.atomic
+    def remove_members(self, team: Team, user_ids: list[int]) -> list[dict]:
+        """Удаляет пользователей из команды одним запросом.
+
+        Руководитель команды не удаляется.
+
+        Returns:
+            Список {"user_id", "status"} в порядке входных ID
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        current = self.repository.get_member_roles(team, user_ids)
+
+        results = []
+        to_remove = []
+        for user_id in user_ids:
+            role = current.get(user_id)
+            if role is None:
+                status = self.NOT_MEMBER
+            elif role == TeamMember.Role.LEADER:
+                status = self.IS_LEADER
+            else:
+                status = self.REMOVED
+                to_remove.append(user_id)
+            results.append({"user_id": user_id, "status": status})
+
+        self.repository.bulk_remove_members(team, to_remove)
+        return results
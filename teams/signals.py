@@ -0,0 +1,14 @@
+"""Сигналы teams: инвалидация карты направлений институтов."""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from teams.cache import invalidate_institute_access
+from teams.models import StudyGroup
+
+
+@receiver(post_save, sender=StudyGroup)
+@receiver(post_delete, sender=StudyGroup)
+def invalidate_institute_access_map(sender, **kwargs) -> None:
+    """Учебные группы задают направления институтов в карте доступа."""
+    invalidate_institute_access()
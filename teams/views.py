@@ -3,17 +3,46 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from teams.models import Team, TeamMember
+from accounts.models import Semester
+from accounts.permissions import IsAdminOrCpds
+from core.pagination import CappedCursorPagination
+from teams.filters import TeamFilter
+from teams.models import TeamMember
 from teams.permissions import TeamPermission
-from teams.serializers import TeamMemberSerializer, TeamSerializer
+from teams.repositories.team import TeamRepository
+from teams.serializers import (
+    TeamFormationSerializer,
+    TeamListSerializer,
+    TeamMemberSerializer,
+    TeamMembersBulkSerializer,
+    TeamSerializer,
+)
+from teams.services.team_formation_service import TeamFormationService
+from teams.services.team_service import TeamService
 
 
 class TeamViewSet(viewsets.ModelViewSet):
-    """CRUD для команд и управления участниками."""
+    """CRUD для команд и управления участниками.
+
+    Списки (в том числе my/) отдаются курсорной пагинацией без состава
+    команд — только с числом участников; состав доступен в карточке команды.
+    """
 
-    queryset = Team.objects.select_related("leader").prefetch_related("members__user")
     serializer_class = TeamSerializer
     permission_classes = [IsAuthenticated, TeamPermission]
+    pagination_class = CappedCursorPagination
+    filterset_class = TeamFilter
+
+    def get_queryset(self):
+        repository = TeamRepository()
+        if self.action in {"list", "my_teams"}:
+            return repository.get_list_queryset()
+        return repository.get_detail_queryset()
+
+    def get_serializer_class(self):
+        if self.action in {"list", "my_teams"}:
+            return TeamListSerializer
+        return TeamSerializer
 
     def perform_create(self, serializer):
         leader = serializer.validated_data.get("leader") or self.request.user
@@ -34,18 +63,53 @@ class TeamViewSet(viewsets.ModelViewSet):
         user = serializer.validated_data["user"]
         role = serializer.validated_data.get("role", TeamMember.Role.MEMBER)
 
-        if TeamMember.objects.filter(team=team, user=user).exists():
+        [result] = TeamService().add_members(team, [user.id], role)
+        if result["status"] == TeamService.ALREADY_MEMBER:
             return Response(
                 {"error": "Пользователь уже состоит в команде"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        member = TeamMember.objects.create(team=team, user=user, role=role)
+        member = TeamMember.objects.select_related("user").get(team=team, user=user)
         return Response(
             TeamMemberSerializer(member).data,
             status=status.HTTP_201_CREATED,
         )
 
+    @decorators.action(detail=True, methods=["post"], url_path="members/bulk")
+    def add_members_bulk(self, request: Request, pk: int = None) -> Response:
+        """POST /api/teams/teams/{id}/members/bulk/ — добавить участников списком.
+
+        Тело: {"user_ids": [...], "role": "member"}. Ответ содержит статус по
+        каждому пользователю: added, already_member или not_found.
+        """
+        team = self.get_object()
+        serializer = TeamMembersBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = TeamService().add_members(
+            team,
+            serializer.validated_data["user_ids"],
+            serializer.validated_data["role"],
+        )
+        return Response({"results": results})
+
+    @decorators.action(detail=True, methods=["post"], url_path="members/bulk-remove")
+    def remove_members_bulk(self, request: Request, pk: int = None) -> Response:
+        """POST /api/teams/teams/{id}/members/bulk-remove/ — удалить участников списком.
+
+        Тело: {"user_ids": [...]}. Ответ содержит статус по каждому
+        пользователю: removed, not_member или leader (руководитель не удаляется).
+        """
+        team = self.get_object()
+        serializer = TeamMembersBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = TeamService().remove_members(
+            team, serializer.validated_data["user_ids"]
+        )
+        return Response({"results": results})
+
     @decorators.action(
         detail=True,
         methods=["delete"],
@@ -72,9 +136,43 @@ class TeamViewSet(viewsets.ModelViewSet):
         member.delete()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @decorators.action(
+        detail=False,
+        methods=["post"],
+        url_path="formation",
+        permission_classes=[IsAuthenticated, IsAdminOrCpds],
+    )
+    def formation(self, request: Request) -> Response:
+        """POST /api/teams/teams/formation/ — распределить группы по заявкам.
+
+        Учебные группы назначаются на одобренные заявки семестра, каждая
+        группа становится командой. По умолчанию (dry_run=true) возвращает
+        только план; с dry_run=false создаёт команды, руководителем
+        которых становится текущий пользователь.
+        """
+        serializer = TeamFormationSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            semester_id = Semester.resolve_list_semester_id(data["semester_id"])
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        service = TeamFormationService()
+        if data["dry_run"]:
+            result = service.preview(semester_id, data["teams_per_application"])
+            return Response(result)
+        result = service.form(
+            semester_id, request.user, data["teams_per_application"]
+        )
+        return Response(result, status=status.HTTP_201_CREATED)
+
     @decorators.action(detail=False, methods=["get"], url_path="my")
     def my_teams(self, request: Request) -> Response:
         """GET /api/teams/teams/my/ — команды текущего пользователя."""
-        queryset = self.get_queryset().filter(members__user=request.user).distinct()
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        queryset = self.filter_queryset(
+            TeamRepository().filter_by_member(self.get_queryset(), request.user.id)
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
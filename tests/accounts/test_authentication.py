@@ -0,0 +1,115 @@
+"""Тесты CachedJWTAuthentication."""
+
+import pickle
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.authentication import CachedJWTAuthentication
+from accounts.cache import principal_cache_key
+from accounts.utils import get_user_department_with_parent
+
+
+def _authenticate(user):
+    token = AccessToken.for_user(user)
+    request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+    return CachedJWTAuthentication().authenticate(request)
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    def test_loads_user_with_relations_in_one_query(self, make_user):
+        user = make_user(role_code="department_validator", with_department=True)
+
+        with CaptureQueriesContext(connection) as ctx:
+            principal, _ = _authenticate(user)
+            # Связанные объекты уже загружены
+            assert principal.role.code == "department_validator"
+            assert principal.department.parent.name == "Parent Dept"
+        assert len(ctx.captured_queries) == 1
+
+    def test_principal_is_cached_per_token(self, make_user):
+        user = make_user(with_department=True)
+        token = AccessToken.for_user(user)
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        CachedJWTAuthentication().authenticate(request)
+
+        with CaptureQueriesContext(connection) as ctx:
+            principal, _ = CachedJWTAuthentication().authenticate(request)
+        assert principal.pk == user.pk
+        assert len(ctx.captured_queries) == 0
+
+    def test_password_hash_is_not_cached(self, make_user):
+        user = make_user()
+        token = AccessToken.for_user(user)
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        CachedJWTAuthentication().authenticate(request)
+
+        cached = cache.get(principal_cache_key(user.pk, token["jti"]))
+        assert cached.pk == user.pk
+        assert "password" in cached.get_deferred_fields()
+        assert user.password.encode() not in pickle.dumps(cached)
+
+    def test_user_change_invalidates_cache(self, make_user):
+        user = make_user()
+        _authenticate(user)
+        token = AccessToken.for_user(user)
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        CachedJWTAuthentication().authenticate(request)
+
+        user.is_active = False
+        user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            CachedJWTAuthentication().authenticate(request)
+
+    def test_department_change_invalidates_cache(self, make_user, departments):
+        user = make_user(with_department=True)
+        token = AccessToken.for_user(user)
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        CachedJWTAuthentication().authenticate(request)
+
+        departments["parent"].name = "Renamed"
+        departments["parent"].save()
+
+        principal, _ = CachedJWTAuthentication().authenticate(request)
+        assert principal.department.parent.name == "Renamed"
+
+    def test_ttl_zero_disables_cache(self, make_user, settings):
+        settings.AUTH_PRINCIPAL_CACHE_TTL = 0
+        user = make_user()
+        token = AccessToken.for_user(user)
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        CachedJWTAuthentication().authenticate(request)
+
+        with CaptureQueriesContext(connection) as ctx:
+            CachedJWTAuthentication().authenticate(request)
+        assert len(ctx.captured_queries) == 1
+
+
+@pytest.mark.django_db
+class TestGetUserDepartmentWithParent:
+    def test_no_query_when_already_loaded(self, make_user):
+        user = make_user(with_department=True)
+        principal, _ = _authenticate(user)
+
+        with CaptureQueriesContext(connection) as ctx:
+            department = get_user_department_with_parent(principal)
+        assert department.parent is not None
+        assert len(ctx.captured_queries) == 0
+
+    def test_loads_department_once(self, make_user, user_model):
+        user = user_model.objects.get(pk=make_user(with_department=True).pk)
+
+        with CaptureQueriesContext(connection) as ctx:
+            department = get_user_department_with_parent(user)
+            assert department.parent.name == "Parent Dept"
+        assert len(ctx.captured_queries) == 1
+
+    def test_user_without_department(self, make_user):
+        assert get_user_department_with_parent(make_user()) is None
@@ -0,0 +1,35 @@
+"""Тесты курсорной пагинации справочников accounts."""
+
+import pytest
+from rest_framework.test import APIClient
+
+from accounts.models import Department, Semester
+
+
+@pytest.mark.django_db
+class TestAccountsListPagination:
+    def test_departments_paginated_by_cursor(self, departments):
+        response = APIClient().get("/api/accounts/departments/?page_size=1")
+
+        assert response.status_code == 200
+        assert len(response.data["results"]) == 1
+        assert response.data["next"]
+
+    def test_departments_legacy_list(self, departments):
+        response = APIClient().get("/api/accounts/departments/?legacy=true")
+
+        assert isinstance(response.data, list)
+        assert len(response.data) == Department.objects.count()
+
+    def test_page_size_capped(self, make_user):
+        for position in range(105):
+            Semester.objects.create(
+                code=f"s{position}", name=f"Семестр {position}", position=position
+            )
+        client = APIClient()
+        client.force_authenticate(make_user())
+
+        response = client.get("/api/accounts/semesters/?page_size=1000")
+
+        assert len(response.data["results"]) == 100
+        assert response.data["results"][0]["code"] == "s0"
@@ -0,0 +1,158 @@
+"""Тесты пакетного одобрения и отклонения заявок на регистрацию."""
+
+from django.core import mail
+import pytest
+from rest_framework.test import APIClient
+
+from accounts.models import RegistrationRequest, User
+from core.models import EmailOutbox
+
+URL = "/api/accounts/registration-requests/"
+
+
+@pytest.fixture
+def make_request(departments):
+    def _make(index: int, **extra):
+        return RegistrationRequest.objects.create(
+            last_name=f"Фамилия{index}",
+            first_name="Имя",
+            email=f"reg{index}@example.com",
+            phone="+70000000000",
+            department=departments["child"],
+            **extra,
+        )
+
+    return _make
+
+
+@pytest.fixture
+def cpds_client(make_user):
+    client = APIClient()
+    client.force_authenticate(user=make_user(role_code="cpds"))
+    return client
+
+
+@pytest.mark.django_db
+class TestBulkApprove:
+    def test_creates_users_and_queues_emails(
+        self, cpds_client, make_request, roles, django_assert_max_num_queries
+    ):
+        requests = [make_request(i) for i in range(5)]
+        ids = [r.pk for r in requests]
+
+        with django_assert_max_num_queries(15):
+            response = cpds_client.post(
+                URL + "bulk-approve/",
+                {"ids": ids, "role_id": "user"},
+                format="json",
+            )
+
+        assert response.status_code == 200
+        assert response.data["queued_emails"] == 5
+        assert {row["status"] for row in response.data["results"]} == {"approved"}
+        users = User.objects.filter(email__startswith="reg")
+        assert users.count() == 5
+        assert all(
+            u.role_id == "user" and not u.has_usable_password() for u in users
+        )
+        outbox = EmailOutbox.objects.filter(status=EmailOutbox.Status.PENDING)
+        assert outbox.count() == 5
+        assert "/reset-password/" in outbox.first().body
+
+    def test_link_in_email_sets_password(self, cpds_client, make_request):
+        req = make_request(1)
+        cpds_client.post(
+            URL + "bulk-approve/", {"ids": [req.pk], "role_id": "user"}, format="json"
+        )
+
+        body = EmailOutbox.objects.get(to_email=req.email).body
+        uid, token = body.split("/reset-password/")[1].split()[0].split("/")
+        response = APIClient().post(
+            "/api/accounts/password/reset/confirm/",
+            {"uid": uid, "token": token, "new_password": "NewSecret123"},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert User.objects.get(email=req.email).check_password("NewSecret123")
+
+    def test_password_reset_reaches_user_without_password(
+        self, cpds_client, make_request
+    ):
+        req = make_request(1)
+        cpds_client.post(
+            URL + "bulk-approve/", {"ids": [req.pk], "role_id": "user"}, format="json"
+        )
+
+        response = APIClient().post(
+            "/api/accounts/password/reset/", {"email": req.email}, format="json"
+        )
+
+        assert response.status_code == 200
+        assert len(mail.outbox) == 1
+        assert mail.outbox[0].to == [req.email]
+
+    def test_any_invalid_request_rolls_back_batch(
+        self, cpds_client, make_request, make_user
+    ):
+        ok = make_request(1)
+        processed = make_request(2, status=RegistrationRequest.Status.REJECTED)
+        taken = make_request(3)
+        make_user(role_code="user", email=taken.email)
+
+        response = cpds_client.post(
+            URL + "bulk-approve/",
+            {"ids": [ok.pk, processed.pk, taken.pk, 999999], "role_id": "user"},
+            format="json",
+        )
+
+        assert response.status_code == 400
+        assert set(response.data["errors"]) == {processed.pk, taken.pk, 999999}
+        ok.refresh_from_db()
+        assert ok.status == RegistrationRequest.Status.SUBMITTED
+        assert not EmailOutbox.objects.exists()
+
+    def test_existing_email_is_reported(self, cpds_client, make_request, make_user):
+        taken = make_request(3)
+        make_user(role_code="user", email=taken.email)
+
+        response = cpds_client.post(
+            URL + "bulk-approve/", {"ids": [taken.pk], "role_id": "user"}, format="json"
+        )
+
+        assert response.status_code == 400
+        assert list(response.data["errors"]) == [taken.pk]
+
+    def test_requires_cpds(self, make_user, make_request):
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="user"))
+
+        response = client.post(
+            URL + "bulk-approve/",
+            {"ids": [make_request(1).pk], "role_id": "user"},
+            format="json",
+        )
+
+        assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestBulkReject:
+    def test_rejects_and_queues_notifications(self, cpds_client, make_request):
+        requests = [make_request(i) for i in range(3)]
+
+        response = cpds_client.post(
+            URL + "bulk-reject/",
+            {"ids": [r.pk for r in requests], "reason": "Дубликат"},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert (
+            RegistrationRequest.objects.filter(
+                status=RegistrationRequest.Status.REJECTED, reason="Дубликат"
+            ).count()
+            == 3
+        )
+        assert EmailOutbox.objects.count() == 3
+        assert not User.objects.filter(email__startswith="reg").exists()
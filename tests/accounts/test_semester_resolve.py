@@ -1,5 +1,8 @@
 """Тесты разбора semester_id для GET-списков."""
 
+from io import StringIO
+
+from django.core.management import call_command
 import pytest
 
 from accounts.models import (
@@ -43,3 +46,52 @@ class TestSemesterResolveListSemesterId:
     def test_next_not_configured_raises(self):
         with pytest.raises(ValueError, match="next"):
             Semester.resolve_list_semester_id("next")
+
+
+@pytest.mark.django_db
+class TestSemesterSettingMapCache:
+    @pytest.fixture
+    def configured(self):
+        active = Semester.objects.create(code="a-sem", name="A", position=1)
+        upcoming = Semester.objects.create(code="n-sem", name="N", position=2)
+        Settings.objects.create(code=ACTIVE_SEMESTER_SETTING_CODE, value=active.code)
+        Settings.objects.create(code=NEXT_SEMESTER_SETTING_CODE, value=upcoming.code)
+        return active, upcoming
+
+    def test_map_contains_codes_and_ids(self, configured):
+        active, upcoming = configured
+        setting_map = Semester.get_setting_map()
+        assert setting_map["codes"] == {"active": "a-sem", "next": "n-sem"}
+        assert setting_map["ids"] == {"active": active.pk, "next": upcoming.pk}
+
+    def test_resolution_is_cached(self, configured, django_assert_num_queries):
+        Semester.get_setting_map()
+        with django_assert_num_queries(0):
+            assert Semester.get_active() == configured[0]
+            assert Semester.get_next() == configured[1]
+            Semester.resolve_list_semester_id("next")
+            Semester.resolve_list_semester_id(str(configured[0].pk))
+
+    def test_settings_change_invalidates(self, configured):
+        active, upcoming = configured
+        assert Semester.get_active() == active
+        setting = Settings.objects.get(code=ACTIVE_SEMESTER_SETTING_CODE)
+        setting.value = upcoming.code
+        setting.save()
+        assert Semester.get_active() == upcoming
+
+    def test_new_semester_invalidates(self, configured):
+        Semester.get_setting_map()
+        semester = Semester.objects.create(code="x-sem", name="X", position=3)
+        assert Semester.resolve_list_semester_id(str(semester.pk)) == semester.pk
+
+    def test_import_app_settings_invalidates(self, configured, tmp_path):
+        active, upcoming = configured
+        assert Semester.get_active() == active
+        csv_path = tmp_path / "settings.csv"
+        csv_path.write_text(
+            f"code,description,value\n{ACTIVE_SEMESTER_SETTING_CODE},,{upcoming.code}\n",
+            encoding="utf-8",
+        )
+        call_command("import_app_settings", file=str(csv_path), stdout=StringIO())
+        assert Semester.get_active() == upcoming
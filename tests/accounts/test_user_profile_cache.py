@@ -0,0 +1,102 @@
+"""Тесты кеша профиля /api/accounts/user/ и кода института в UserSerializer."""
+
+from django.db.models import Prefetch
+import pytest
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from accounts.serializers import UserSerializer
+from showcase.models import Institute
+
+URL = "/api/accounts/user/"
+
+
+@pytest.fixture
+def user(make_user):
+    return make_user(role_code="department_validator", with_department=True)
+
+
+@pytest.fixture
+def client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.mark.django_db
+class TestUserProfileCache:
+    def test_repeated_request_is_served_from_cache(
+        self, client, django_assert_num_queries
+    ):
+        first = client.get(URL)
+
+        with django_assert_num_queries(0):
+            second = client.get(URL)
+
+        assert second.status_code == 200
+        assert second.data == first.data
+
+    def test_user_change_invalidates_profile(self, client, user):
+        client.get(URL)
+
+        user.first_name = "Новое имя"
+        user.save()
+
+        assert client.get(URL).data["first_name"] == "Новое имя"
+
+    def test_department_change_invalidates_profile(self, client, departments):
+        client.get(URL)
+
+        departments["child"].name = "Переименовано"
+        departments["child"].save()
+
+        assert client.get(URL).data["department"]["name"] == "Переименовано"
+
+    def test_institute_change_invalidates_profile(self, client, departments):
+        assert client.get(URL).data["institute_code"] is None
+
+        Institute.objects.create(
+            code="CHILD-INST", name="Child", position=1, department=departments["child"]
+        )
+
+        assert client.get(URL).data["institute_code"] == "CHILD-INST"
+
+
+@pytest.mark.django_db
+class TestInstituteCode:
+    def test_uses_prefetched_institutes(
+        self, user, departments, django_assert_num_queries
+    ):
+        Institute.objects.create(
+            code="B", name="B", position=2, department=departments["child"]
+        )
+        Institute.objects.create(
+            code="A", name="A", position=1, department=departments["child"]
+        )
+        loaded = (
+            User.objects.select_related("department", "role")
+            .prefetch_related(
+                Prefetch(
+                    "department__institutes",
+                    queryset=Institute.objects.filter(is_active=True),
+                )
+            )
+            .get(pk=user.pk)
+        )
+
+        with django_assert_num_queries(0):
+            assert UserSerializer(loaded).data["institute_code"] == "A"
+
+    def test_falls_back_to_cached_map(self, user, departments):
+        Institute.objects.create(
+            code="A", name="A", position=1, department=departments["child"]
+        )
+        Institute.objects.create(
+            code="OFF",
+            name="Off",
+            position=0,
+            department=departments["child"],
+            is_active=False,
+        )
+
+        assert UserSerializer(user).data["institute_code"] == "A"
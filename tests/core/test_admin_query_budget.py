@@ -0,0 +1,138 @@
+"""Бюджет SQL-запросов для списков админки и оценочный пагинатор."""
+
+from unittest import mock
+
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+import pytest
+
+from accounts.models import Semester
+from core.pagination import EstimatedCountPaginator
+from showcase.models import (
+    ProjectApplication,
+    ProjectApplicationComment,
+    ProjectApplicationStatusLog,
+    Tag,
+)
+from teams.models import Team, TeamMember
+
+CHANGELISTS = [
+    "/admin/showcase/projectapplication/",
+    "/admin/showcase/projectapplicationstatuslog/",
+    "/admin/showcase/projectapplicationcomment/",
+    "/admin/showcase/tag/",
+    "/admin/accounts/user/",
+    "/admin/accounts/registrationrequest/",
+    "/admin/teams/team/",
+    "/admin/teams/teammember/",
+]
+# Сессия, пользователь, права, COUNT, строки страницы, фильтры списка
+QUERY_BUDGET = 15
+
+
+@pytest.fixture
+def admin_client(make_user):
+    user = make_user(role_code="admin", email="root@example.com")
+    user.is_staff = True
+    user.is_superuser = True
+    user.save()
+    client = Client()
+    client.force_login(user)
+    return client, user
+
+
+def _populate(count, user, departments, statuses):
+    semester, _ = Semester.objects.get_or_create(
+        code="adm", defaults={"name": "Adm", "position": 1}
+    )
+    for index in range(count):
+        application = ProjectApplication.objects.create(
+            title=f"Проект {index}-{count}",
+            status_id="await_cpds",
+            semester=semester,
+            author=user,
+        )
+        ProjectApplicationStatusLog.objects.create(
+            application=application,
+            actor=user,
+            from_status_id="created",
+            to_status_id="await_cpds",
+        )
+        ProjectApplicationComment.objects.create(
+            application=application, author=user, field="goal", text="Комментарий"
+        )
+        tag = Tag.objects.create(name=f"Тег {index}-{count}", category="Категория")
+        tag.departments.add(departments["child"])
+        team = Team.objects.create(
+            name=f"Команда {index}-{count}", leader=user, project_application=application
+        )
+        TeamMember.objects.create(team=team, user=user)
+
+
+def _count_queries(client, url):
+    with CaptureQueriesContext(connection) as ctx:
+        response = client.get(url)
+    assert response.status_code == 200, url
+    return len(ctx.captured_queries)
+
+
+@pytest.mark.django_db
+class TestAdminChangelistQueryBudget:
+    @pytest.mark.parametrize("url", CHANGELISTS)
+    def test_query_count_does_not_depend_on_rows(
+        self, url, admin_client, departments, statuses
+    ):
+        client, user = admin_client
+        _populate(2, user, departments, statuses)
+        few = _count_queries(client, url)
+
+        _populate(10, user, departments, statuses)
+        many = _count_queries(client, url)
+
+        assert many == few
+        assert many <= QUERY_BUDGET
+
+    def test_application_change_form_does_not_query_per_tag(
+        self, admin_client, departments, statuses
+    ):
+        client, user = admin_client
+        _populate(2, user, departments, statuses)
+        application = ProjectApplication.objects.first()
+        url = f"/admin/showcase/projectapplication/{application.pk}/change/"
+        _count_queries(client, url)  # прогрев кеша ContentType
+        few = _count_queries(client, url)
+
+        _populate(10, user, departments, statuses)
+        many = _count_queries(client, url)
+
+        assert many == few
+
+
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+    def test_unfiltered_large_table_uses_estimate(self, statuses):
+        with mock.patch("core.pagination.estimate_table_rows", return_value=50000):
+            paginator = EstimatedCountPaginator(Tag.objects.order_by("id"), 20)
+            assert paginator.count == 50000
+
+    def test_filtered_list_is_counted_exactly(self, statuses):
+        Tag.objects.create(name="Точный", category="К")
+        with mock.patch("core.pagination.estimate_table_rows", return_value=50000):
+            paginator = EstimatedCountPaginator(
+                Tag.objects.filter(name="Точный").order_by("id"), 20
+            )
+            assert paginator.count == 1
+
+    def test_small_estimate_falls_back_to_count(self, statuses):
+        Tag.objects.create(name="Один", category="К")
+        with mock.patch("core.pagination.estimate_table_rows", return_value=5):
+            paginator = EstimatedCountPaginator(Tag.objects.order_by("id"), 20)
+            assert paginator.count == 1
+
+    def test_sqlite_has_no_estimate(self):
+        from core.pagination import estimate_table_rows
+
+        if connection.vendor == "postgresql":
+            pytest.skip("Проверка только для СУБД без статистики pg_class")
+        assert estimate_table_rows(Tag) is None
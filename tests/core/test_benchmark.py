@@ -0,0 +1,111 @@
+"""Тесты бенчмарка основных эндпоинтов."""
+
+from io import StringIO
+import json
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+import pytest
+
+from core.benchmark import percentile
+from showcase.models import ProjectApplication
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile([], 95) == 0.0
+
+
+@pytest.mark.django_db
+class TestRunBenchmark:
+    @pytest.fixture
+    def load_data(self):
+        call_command(
+            "generate_load_data",
+            institutes=1,
+            departments_per_institute=2,
+            users_per_role=1,
+            applications=40,
+            stdout=StringIO(),
+        )
+
+    def test_report_contains_all_scenarios(self, load_data):
+        out = StringIO()
+        call_command("run_benchmark", iterations=2, warmup=1, stdout=out)
+
+        report = json.loads(out.getvalue())
+        assert set(report["scenarios"]) == {
+            "list",
+            "coordination",
+            "retrieve",
+            "approve",
+            "department-plans",
+            "tags",
+        }
+        for name, stats in report["scenarios"].items():
+            assert stats["requests"] == 2, name
+            assert stats["p95_ms"] >= stats["p50_ms"] > 0
+        # Список тегов после прогрева отдаётся из кеша без запросов
+        assert report["scenarios"]["tags"]["queries_max"] == 0
+        assert report["scenarios"]["list"]["queries_max"] >= 1
+        assert report["scenarios"]["approve"]["status_codes"] == {"200": 2}
+
+    def test_changes_are_rolled_back(self, load_data):
+        before = ProjectApplication.objects.filter(status_id="approved").count()
+        call_command(
+            "run_benchmark",
+            scenario=["approve"],
+            iterations=2,
+            warmup=1,
+            stdout=StringIO(),
+        )
+        assert ProjectApplication.objects.filter(status_id="approved").count() == before
+
+    def test_reconnect_mode_reports_connections(self, load_data):
+        out = StringIO()
+        call_command(
+            "run_benchmark",
+            scenario=["list", "tags"],
+            iterations=2,
+            warmup=1,
+            reconnect=True,
+            stdout=out,
+        )
+
+        report = json.loads(out.getvalue())
+        assert report["reconnect"] is True
+        for stats in report["scenarios"].values():
+            assert stats["requests"] == 2
+            assert stats["connections_opened"] >= 0
+
+    def test_reconnect_mode_rejects_writing_scenarios(self, load_data):
+        with pytest.raises(CommandError, match="approve"):
+            call_command(
+                "run_benchmark",
+                scenario=["approve"],
+                iterations=1,
+                reconnect=True,
+                stdout=StringIO(),
+            )
+
+    def test_payload_benchmark_report(self, load_data):
+        out = StringIO()
+        call_command(
+            "run_payload_benchmark",
+            scenario=["retrieve", "tags"],
+            repeat=2,
+            stdout=out,
+        )
+
+        report = json.loads(out.getvalue())
+        assert set(report["scenarios"]) == {"retrieve", "tags"}
+        for stats in report["scenarios"].values():
+            assert stats["raw_bytes"] == stats["fast_raw_bytes"] > 0
+            assert stats["gzip_bytes"] > 0
+            assert stats["render_stdlib_p50_ms"] >= 0
+
+    def test_missing_data_raises_command_error(self):
+        with pytest.raises(CommandError):
+            call_command("run_benchmark", scenario=["list"], stdout=StringIO())
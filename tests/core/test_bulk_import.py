@@ -0,0 +1,96 @@
+"""Тесты движка множественного импорта справочников."""
+
+import pandas as pd
+import pytest
+
+from accounts.models import Department, RegistrationRequest, Role
+from core.bulk_import import BulkUpsert, ImportDataError, import_transaction, read_table
+from showcase.models import ApplicationStatus
+
+
+@pytest.mark.django_db
+class TestBulkUpsert:
+    def test_plan_splits_create_update_unchanged_delete(self):
+        Role.objects.create(code="same", name="Same")
+        Role.objects.create(code="changed", name="Old")
+        Role.objects.create(code="gone", name="Gone")
+
+        plan = BulkUpsert(Role, "code", ["name"]).plan(
+            [
+                {"code": "same", "name": "Same"},
+                {"code": "changed", "name": "New"},
+                {"code": "new", "name": "New role"},
+            ],
+            delete_missing=True,
+        )
+
+        assert [obj.code for obj in plan.to_create] == ["new"]
+        assert [obj.code for obj in plan.to_update] == ["changed"]
+        assert plan.unchanged == 1
+        assert plan.to_delete == ["gone"]
+        # План не меняет базу
+        assert Role.objects.get(code="changed").name == "Old"
+
+    def test_apply_uses_constant_number_of_queries(
+        self, django_assert_max_num_queries
+    ):
+        ApplicationStatus.objects.bulk_create(
+            [
+                ApplicationStatus(code=f"s{i}", name=f"S{i}", position=i)
+                for i in range(50)
+            ]
+        )
+        records = [
+            {"code": f"s{i}", "name": f"Status {i}", "position": i, "is_active": True}
+            for i in range(100)
+        ]
+        engine = BulkUpsert(
+            ApplicationStatus, "code", ["name", "position", "is_active"]
+        )
+        queryset = ApplicationStatus.objects.filter(code__startswith="s")
+
+        with django_assert_max_num_queries(8):
+            result = engine.run(records, queryset=queryset)
+
+        assert (result.created, result.updated, result.unchanged) == (50, 50, 0)
+        assert queryset.count() == 100
+        assert ApplicationStatus.objects.get(code="s3").name == "Status 3"
+
+    def test_duplicate_keys_rejected(self):
+        with pytest.raises(ImportDataError):
+            BulkUpsert(Role, "code", ["name"]).plan(
+                [{"code": "a", "name": "A"}, {"code": "a", "name": "B"}]
+            )
+
+    def test_protected_rows_are_kept(self):
+        keep = Department.objects.create(name="Занятое", short_name="B")
+        Department.objects.create(name="Свободное", short_name="F")
+        RegistrationRequest.objects.create(
+            last_name="И",
+            first_name="И",
+            email="r@example.com",
+            phone="+70000000000",
+            department=keep,
+        )
+
+        result = BulkUpsert(Department, "name", ["short_name"]).run(
+            [], delete_missing=True
+        )
+
+        assert result.deleted == 1
+        assert result.protected == ["Занятое"]
+        assert list(Department.objects.values_list("name", flat=True)) == ["Занятое"]
+
+    def test_import_transaction_dry_run_rolls_back(self):
+        with import_transaction(dry_run=True):
+            BulkUpsert(Role, "code", ["name"]).run([{"code": "x", "name": "X"}])
+        assert not Role.objects.filter(code="x").exists()
+
+
+def test_read_table_replaces_nan_with_none(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame([{"code": "a", "department": None}]).to_csv(path, index=False)
+
+    assert read_table(str(path), ("code",)) == [{"code": "a", "department": None}]
+    with pytest.raises(ImportDataError):
+        read_table(str(path), ("code", "name"))
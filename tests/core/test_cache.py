@@ -0,0 +1,40 @@
+"""Тесты ограничения TTL для кеша в памяти процесса."""
+
+from accounts.cache import get_principal_ttl
+from core.cache import cache_ttl, is_shared_cache
+
+
+def _use_backend(settings, backend):
+    settings.CACHES = {"default": {"BACKEND": backend, "LOCATION": "test"}}
+
+
+def test_local_cache_ttl_is_capped(settings):
+    _use_backend(settings, "django.core.cache.backends.locmem.LocMemCache")
+    settings.LOCAL_CACHE_MAX_TTL = 5
+
+    assert not is_shared_cache()
+    assert cache_ttl(3600) == 5
+    assert cache_ttl(3) == 3
+    assert cache_ttl(0) == 0
+
+
+def test_shared_cache_keeps_configured_ttl(settings, tmp_path):
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": str(tmp_path),
+        }
+    }
+    settings.AUTH_PRINCIPAL_CACHE_TTL = 60
+
+    assert is_shared_cache()
+    assert cache_ttl(3600) == 3600
+    assert get_principal_ttl() == 60
+
+
+def test_principal_ttl_capped_for_local_cache(settings):
+    _use_backend(settings, "django.core.cache.backends.locmem.LocMemCache")
+    settings.LOCAL_CACHE_MAX_TTL = 5
+    settings.AUTH_PRINCIPAL_CACHE_TTL = 60
+
+    assert get_principal_ttl() == 5
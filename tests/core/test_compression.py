@@ -0,0 +1,92 @@
+"""Тесты сжатия ответов (CompressionMiddleware)."""
+
+import gzip
+import json
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import RequestFactory
+import pytest
+
+from core import middleware
+from core.middleware import CompressionMiddleware, parse_accept_encoding
+
+PAYLOAD = {"results": [{"id": i, "title": f"Проект {i}"} for i in range(200)]}
+
+
+def _call(response, accept_encoding="gzip, deflate"):
+    request = RequestFactory().get("/api/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    return CompressionMiddleware(lambda request: response)(request)
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip;q=0.5, br, identity;q=0, x;q=abc") == {
+        "gzip": 0.5,
+        "br": 1.0,
+        "identity": 0.0,
+        "x": 0.0,
+    }
+
+
+def test_compresses_large_json_with_gzip(monkeypatch):
+    monkeypatch.setattr(middleware, "brotli", None)
+    response = JsonResponse(PAYLOAD)
+    response["ETag"] = '"abc"'
+    original = response.content
+
+    response = _call(response)
+
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Vary"] == "Accept-Encoding"
+    assert response["ETag"] == 'W/"abc"'
+    assert int(response["Content-Length"]) == len(response.content) < len(original)
+    assert json.loads(gzip.decompress(response.content)) == PAYLOAD
+
+
+def test_small_response_not_compressed(settings):
+    settings.RESPONSE_COMPRESSION_MIN_SIZE = 1024
+    response = _call(JsonResponse({"id": 1}))
+
+    assert not response.has_header("Content-Encoding")
+    assert json.loads(response.content) == {"id": 1}
+
+
+@pytest.mark.parametrize("accept_encoding", ["", "identity", "gzip;q=0", "deflate"])
+def test_respects_accept_encoding(monkeypatch, accept_encoding):
+    monkeypatch.setattr(middleware, "brotli", None)
+    response = _call(JsonResponse(PAYLOAD), accept_encoding)
+
+    assert not response.has_header("Content-Encoding")
+    assert response["Vary"] == "Accept-Encoding"
+
+
+def test_skips_binary_and_streaming_responses():
+    binary = HttpResponse(b"x" * 5000, content_type="application/vnd.ms-excel")
+    assert not _call(binary).has_header("Content-Encoding")
+
+    streaming = StreamingHttpResponse(iter([b"x" * 5000]), content_type="text/csv")
+    assert not _call(streaming).has_header("Content-Encoding")
+
+
+class FakeBrotli:
+    @staticmethod
+    def compress(data, quality):
+        return b"br:" + str(quality).encode()
+
+
+def test_prefers_brotli_when_available(monkeypatch, settings):
+    settings.RESPONSE_COMPRESSION_BROTLI_QUALITY = 5
+    monkeypatch.setattr(middleware, "brotli", FakeBrotli)
+
+    response = _call(JsonResponse(PAYLOAD), "gzip, br")
+    assert response["Content-Encoding"] == "br"
+    assert response.content == b"br:5"
+
+    response = _call(JsonResponse(PAYLOAD), "gzip, br;q=0.5")
+    assert response["Content-Encoding"] == "gzip"
+
+
+def test_disabled_by_setting(settings):
+    settings.RESPONSE_COMPRESSION_ENABLED = False
+    with pytest.raises(MiddlewareNotUsed):
+        CompressionMiddleware(lambda request: HttpResponse())
@@ -0,0 +1,119 @@
+"""Тесты маршрутизации чтения на реплику (core.db_router)."""
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory
+import pytest
+from rest_framework.test import APIClient
+
+from accounts.models import Role
+from core import db_router
+from core.middleware import ReplicaRoutingMiddleware
+
+AUTH_HEADER = "Bearer test-token"
+
+
+@pytest.fixture
+def sqlite_replica(db, tmp_path, settings, django_db_blocker):
+    """Отдельный SQLite-файл в роли реплики с таблицей ролей."""
+    config = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": str(tmp_path / "replica.sqlite3"),
+    }
+    settings.DATABASES = {**settings.DATABASES, db_router.REPLICA_DB_ALIAS: config}
+    connections.settings[db_router.REPLICA_DB_ALIAS] = connections.configure_settings(
+        {"default": {}, db_router.REPLICA_DB_ALIAS: config}
+    )[db_router.REPLICA_DB_ALIAS]
+    with django_db_blocker.unblock():
+        with connections[db_router.REPLICA_DB_ALIAS].schema_editor() as editor:
+            editor.create_model(Role)
+        Role.objects.using(db_router.REPLICA_DB_ALIAS).create(
+            code="replica_only", name="Только на реплике"
+        )
+    yield
+    connections[db_router.REPLICA_DB_ALIAS].close()
+    del connections[db_router.REPLICA_DB_ALIAS]
+    del connections.settings[db_router.REPLICA_DB_ALIAS]
+
+
+def _role_codes(response) -> set[str]:
+    return {item["code"] for item in response.json()}
+
+
+class TestPrimaryReplicaRouter:
+    def test_without_replica_router_does_not_interfere(self):
+        token = db_router.begin_request(use_replica=True)
+        try:
+            assert router.db_for_read(Role) == "default"
+            assert db_router.PrimaryReplicaRouter().db_for_read(Role) is None
+        finally:
+            db_router.end_request(token)
+
+    def test_reads_replica_until_first_write(self, settings):
+        settings.DATABASES = {**settings.DATABASES, "replica": {}}
+        replica_router = db_router.PrimaryReplicaRouter()
+
+        assert replica_router.db_for_read(Role) == "default"
+        token = db_router.begin_request(use_replica=True)
+        try:
+            assert replica_router.db_for_read(Role) == "replica"
+            assert replica_router.db_for_write(Role) == "default"
+            assert replica_router.db_for_read(Role) == "default"
+        finally:
+            db_router.end_request(token)
+
+    def test_migrations_skip_replica(self):
+        replica_router = db_router.PrimaryReplicaRouter()
+        assert replica_router.allow_migrate("replica", "accounts") is False
+        assert replica_router.allow_migrate("default", "accounts") is None
+
+
+@pytest.mark.django_db
+class TestReplicaRoutingMiddleware:
+    def test_disabled_without_replica(self):
+        with pytest.raises(MiddlewareNotUsed):
+            ReplicaRoutingMiddleware(lambda request: HttpResponse())
+
+    def test_safe_request_reads_replica(self, sqlite_replica, make_user, roles):
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="admin"))
+
+        response = client.get("/api/accounts/roles/")
+
+        assert response.status_code == 200
+        assert _role_codes(response) == {"replica_only"}
+
+    def test_write_makes_client_sticky_to_primary(
+        self, sqlite_replica, make_user, roles
+    ):
+        request = RequestFactory().post("/", HTTP_AUTHORIZATION=AUTH_HEADER)
+
+        def write_then_read(request):
+            Role.objects.create(code="fresh", name="Новая роль")
+            assert router.db_for_read(Role) == "default"
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(write_then_read)(request)
+
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="admin"))
+        response = client.get("/api/accounts/roles/", HTTP_AUTHORIZATION=AUTH_HEADER)
+        assert "fresh" in _role_codes(response)
+
+        # Другой клиент по-прежнему читает с реплики
+        response = client.get("/api/accounts/roles/", HTTP_AUTHORIZATION="Bearer other")
+        assert _role_codes(response) == {"replica_only"}
+
+    def test_sticky_window_can_be_disabled(self, sqlite_replica, settings):
+        settings.REPLICA_STICKY_SECONDS = 0
+        request = RequestFactory().post("/", HTTP_AUTHORIZATION=AUTH_HEADER)
+
+        def write(request):
+            Role.objects.create(code="fresh", name="Новая роль")
+            return HttpResponse()
+
+        ReplicaRoutingMiddleware(write)(request)
+
+        client_key = db_router.client_key(request)
+        assert not db_router.is_sticky_primary(client_key)
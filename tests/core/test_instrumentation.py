@@ -0,0 +1,118 @@
+"""Тесты инструментирования запросов (QueryInstrumentationMiddleware)."""
+
+import logging
+
+from django.db import connection
+import pytest
+from rest_framework.test import APIClient
+
+from accounts.models import Department
+from core import metrics
+from core.instrumentation import QueryRecorder, RequestStatsRegistry, request_stats
+
+
+@pytest.fixture(autouse=True)
+def clean_stats():
+    request_stats.reset()
+    yield
+    request_stats.reset()
+
+
+class TestQueryRecorder:
+    def test_counts_queries_and_duplicates(self, departments):
+        recorder = QueryRecorder()
+        with connection.execute_wrapper(recorder):
+            for dept in departments.values():
+                Department.objects.filter(id=dept.id).first()
+            Department.objects.count()
+
+        assert recorder.count == 3
+        assert recorder.duration >= 0
+        duplicates = recorder.duplicates(threshold=2)
+        assert len(duplicates) == 1
+        assert list(duplicates.values()) == [2]
+
+
+class TestRequestStatsRegistry:
+    def test_histograms_and_averages(self):
+        registry = RequestStatsRegistry()
+        registry.record("view-a", 5.0, 1, 1.0)
+        registry.record("view-a", 700.0, 30, 100.0, {"SELECT 1": 10})
+
+        stats = registry.snapshot()["view-a"]
+        assert stats["requests"] == 2
+        assert stats["max_queries"] == 30
+        assert stats["duration_histogram_ms"]["le_10"] == 1
+        assert stats["duration_histogram_ms"]["le_1000"] == 1
+        assert stats["queries_histogram"]["le_1"] == 1
+        assert stats["queries_histogram"]["le_50"] == 1
+        assert stats["duplicate_queries"] == [{"sql": "SELECT 1", "max_per_request": 10}]
+
+
+@pytest.mark.django_db
+class TestQueryInstrumentationMiddleware:
+    def test_records_endpoint_stats(self, make_user):
+        user = make_user(role_code="admin")
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.get("/api/accounts/departments/")
+        assert response.status_code == 200
+
+        stats = request_stats.snapshot()
+        assert "department-list" in stats
+        assert stats["department-list"]["requests"] == 1
+        assert stats["department-list"]["avg_queries"] >= 1
+
+    def test_counts_connection_reuse(self, make_user, settings):
+        settings.METRICS_MULTIPROC_DIR = ""
+        metrics.registry.reset()
+        user = make_user(role_code="admin")
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        client.get("/api/accounts/departments/")
+
+        # В тесте соединение открыто заранее — запрос его переиспользует
+        text = metrics.registry.render()
+        assert (
+            'db_connections_total{view="department-list",alias="default",'
+            'state="reused"} 1'
+        ) in text
+        metrics.registry.reset()
+
+    def test_logs_requests_over_threshold(self, make_user, settings, caplog):
+        settings.QUERY_INSTRUMENTATION = {"ENABLED": True, "MAX_QUERIES": 1}
+        user = make_user(role_code="admin")
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        with caplog.at_level(logging.WARNING, logger="core.middleware"):
+            client.get("/api/accounts/departments/")
+
+        assert any("department-list" in r.getMessage() for r in caplog.records)
+
+
+@pytest.mark.django_db
+class TestRequestStatsView:
+    def test_staff_only(self, make_user):
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="admin"))
+        response = client.get("/api/core/request-stats/")
+        assert response.status_code == 403
+
+    def test_staff_gets_stats_and_resets(self, make_user):
+        staff = make_user(role_code="admin")
+        staff.is_staff = True
+        staff.save()
+        client = APIClient()
+        client.force_authenticate(user=staff)
+
+        client.get("/api/accounts/departments/")
+        response = client.get("/api/core/request-stats/")
+        assert response.status_code == 200
+        assert "department-list" in response.data["endpoints"]
+
+        response = client.delete("/api/core/request-stats/")
+        assert response.status_code == 204
+        assert "department-list" not in request_stats.snapshot()
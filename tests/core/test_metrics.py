@@ -0,0 +1,164 @@
+"""Тесты реестра метрик и эндпоинта в формате Prometheus."""
+
+from unittest.mock import patch
+
+import pytest
+from rest_framework.test import APIClient
+
+from core import metrics
+from core.metrics import MetricsRegistry
+from showcase.models import ProjectApplication
+from showcase.services.application_notification_service import (
+    ApplicationNotificationService,
+)
+from showcase.services.logging_service import ApplicationLoggingService
+
+
+@pytest.fixture(autouse=True)
+def clean_registry(settings):
+    settings.METRICS_MULTIPROC_DIR = ""
+    metrics.registry.reset()
+    yield
+    metrics.registry.reset()
+
+
+class TestMetricsRegistry:
+    def test_render_counter_and_histogram(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "Jobs", ("kind",))
+        histogram = registry.histogram(
+            "job_seconds", "Job time", ("kind",), buckets=(0.1, 1.0)
+        )
+        counter.inc('a"b')
+        counter.inc('a"b', amount=2)
+        histogram.observe(0.05, "x")
+        histogram.observe(0.5, "x")
+        histogram.observe(5, "x")
+
+        text = registry.render()
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{kind="a\\"b"} 3' in text
+        assert 'job_seconds_bucket{kind="x",le="0.1"} 1' in text
+        assert 'job_seconds_bucket{kind="x",le="1"} 2' in text
+        assert 'job_seconds_bucket{kind="x",le="+Inf"} 3' in text
+        assert 'job_seconds_count{kind="x"} 3' in text
+        assert 'job_seconds_sum{kind="x"} 5.55' in text
+
+    def test_label_count_is_validated(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("c_total", "C", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.inc("only-one")
+
+    def test_multiprocess_files_are_merged(self, settings, tmp_path):
+        settings.METRICS_MULTIPROC_DIR = str(tmp_path)
+        first = MetricsRegistry()
+        second = MetricsRegistry()
+        # Имитируем два разных воркера: у второго другое время старта
+        second._started = first._started + 1
+        for registry in (first, second):
+            registry.counter("requests_total", "Requests", ("view",)).inc("list")
+            registry.flush()
+
+        assert len(list(tmp_path.glob("metrics_*.json"))) == 2
+        assert 'requests_total{view="list"} 2' in first.render()
+
+
+@pytest.mark.django_db
+class TestApplicationMetrics:
+    def test_status_transition_counted_on_commit(
+        self, statuses, make_user, django_capture_on_commit_callbacks
+    ):
+        author = make_user()
+        application = ProjectApplication.objects.create(
+            title="T", author=author, status=statuses["created"]
+        )
+        with django_capture_on_commit_callbacks(execute=True):
+            ApplicationLoggingService().log_status_change(
+                application, statuses["created"], statuses["await_cpds"], author
+            )
+
+        text = metrics.registry.render()
+        assert (
+            'application_status_transitions_total{from_status="created",'
+            'to_status="await_cpds"} 1'
+        ) in text
+
+    @patch("showcase.services.application_notification_service.mail.send_mail")
+    def test_email_success_and_failure(self, mock_send_mail):
+        ApplicationNotificationService._send(
+            "a@example.com",
+            "project_application/rejected_subject.txt",
+            "project_application/rejected_body.txt",
+            {},
+        )
+        mock_send_mail.side_effect = RuntimeError("smtp down")
+        ApplicationNotificationService._send(
+            "a@example.com",
+            "project_application/rejected_subject.txt",
+            "project_application/rejected_body.txt",
+            {},
+        )
+
+        text = metrics.registry.render()
+        assert 'emails_sent_total{result="success"} 1' in text
+        assert 'emails_sent_total{result="failure"} 1' in text
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    def test_request_metrics_exposed(self, make_user, settings):
+        settings.METRICS_ALLOWED_IPS = ["127.0.0.1"]
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="admin"))
+        client.get("/api/accounts/departments/")
+
+        response = client.get("/api/core/metrics/", REMOTE_ADDR="127.0.0.1")
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        body = response.content.decode()
+        assert 'http_requests_total{view="department-list",status="200"} 1' in body
+        assert 'http_request_duration_seconds_count{view="department-list"} 1' in body
+        assert 'db_queries_total{view="department-list"}' in body
+
+    def test_forbidden_for_unknown_ip(self, make_user):
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="admin"))
+        response = client.get("/api/core/metrics/", REMOTE_ADDR="10.0.0.5")
+        assert response.status_code == 403
+
+    def test_loopback_not_allowed_by_default(self):
+        response = APIClient().get("/api/core/metrics/", REMOTE_ADDR="127.0.0.1")
+        assert response.status_code in (401, 403)
+
+    def test_proxied_request_ignores_ip_allowlist(self, settings):
+        settings.METRICS_ALLOWED_IPS = ["127.0.0.1"]
+        response = APIClient().get(
+            "/api/core/metrics/",
+            REMOTE_ADDR="127.0.0.1",
+            HTTP_X_FORWARDED_FOR="203.0.113.7",
+        )
+        assert response.status_code in (401, 403)
+
+    def test_bearer_token(self, settings):
+        settings.METRICS_TOKEN = "secret-token"
+        client = APIClient()
+
+        response = client.get(
+            "/api/core/metrics/", HTTP_AUTHORIZATION="Bearer secret-token"
+        )
+        assert response.status_code == 200
+
+        response = client.get("/api/core/metrics/", HTTP_AUTHORIZATION="Bearer wrong")
+        assert response.status_code in (401, 403)
+
+    def test_staff_allowed(self, make_user):
+        user = make_user(role_code="admin")
+        user.is_staff = True
+        user.save(update_fields=["is_staff"])
+        client = APIClient()
+        client.force_authenticate(user=user)
+        response = client.get(
+            "/api/core/metrics/", REMOTE_ADDR="10.0.0.5", HTTP_X_FORWARDED_FOR="x"
+        )
+        assert response.status_code == 200
@@ -0,0 +1,68 @@
+"""Тесты предгенерированной OpenAPI-схемы (core.openapi)."""
+
+from io import StringIO
+import json
+
+from django.core.management import call_command
+import pytest
+
+from core import openapi
+
+
+@pytest.fixture(autouse=True)
+def schema_settings(settings, tmp_path):
+    settings.STATIC_ROOT = tmp_path
+    settings.CODE_VERSION = "test-version"
+    openapi.get_code_version.cache_clear()
+    openapi.clear_schema_cache()
+    yield
+    openapi.get_code_version.cache_clear()
+    openapi.clear_schema_cache()
+
+
+@pytest.mark.django_db
+class TestOpenAPISchema:
+    def test_command_writes_versioned_artefact(self, tmp_path):
+        call_command("generate_openapi_schema", stdout=StringIO())
+
+        path = tmp_path / "openapi" / "test-version.json"
+        schema = json.loads(path.read_bytes())
+        assert "/showcase/project-applications/" in schema["paths"]
+
+    def test_serves_artefact_without_generation(self, client, tmp_path, monkeypatch):
+        path = openapi.schema_file_path()
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b'{"swagger": "2.0", "paths": {}}')
+        monkeypatch.setattr(openapi, "generate_schema", pytest.fail)
+
+        response = client.get("/swagger.json")
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        assert response.json() == {"swagger": "2.0", "paths": {}}
+
+    def test_falls_back_to_memory_cache(self, client, monkeypatch):
+        calls = []
+
+        def generate():
+            calls.append(1)
+            return b'{"paths": {}}'
+
+        monkeypatch.setattr(openapi, "generate_schema", generate)
+
+        assert client.get("/swagger.json").status_code == 200
+        assert client.get("/swagger.json").status_code == 200
+        assert len(calls) == 1
+
+    def test_etag_by_code_version(self, client, monkeypatch):
+        monkeypatch.setattr(openapi, "generate_schema", lambda: b"{}")
+        response = client.get("/swagger.json")
+        assert response["ETag"] == '"test-version"'
+
+        response = client.get("/swagger.json", HTTP_IF_NONE_MATCH='"test-version"')
+        assert response.status_code == 304
+
+    def test_ui_loads_precomputed_schema(self, client):
+        response = client.get("/swagger/")
+        assert response.status_code == 200
+        assert b"/swagger.json" in response.content
@@ -0,0 +1,51 @@
+"""Тесты очереди исходящих писем."""
+
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+import pytest
+
+from core.models import EmailOutbox
+from core.outbox import OutgoingEmail, deliver_pending, enqueue_emails
+
+
+@pytest.mark.django_db
+class TestDeliverPending:
+    def test_sends_and_clears_body(self):
+        enqueue_emails(
+            OutgoingEmail(f"u{i}@example.com", "Тема", "секрет") for i in range(3)
+        )
+
+        result = deliver_pending(batch_size=2)
+
+        assert result.sent == 3
+        assert len(mail.outbox) == 3
+        assert set(EmailOutbox.objects.values_list("status", "body")) == {
+            (EmailOutbox.Status.SENT, "")
+        }
+
+    def test_failure_keeps_email_pending_until_max_attempts(self):
+        enqueue_emails([OutgoingEmail("u@example.com", "Тема", "текст")])
+
+        with mock.patch(
+            "django.core.mail.EmailMessage.send", side_effect=OSError("smtp down")
+        ):
+            first = deliver_pending(max_attempts=2)
+            second = deliver_pending(max_attempts=2)
+
+        item = EmailOutbox.objects.get()
+        assert (first.retried, second.failed) == (1, 1)
+        assert item.status == EmailOutbox.Status.FAILED
+        assert item.attempts == 2
+        assert item.last_error == "smtp down"
+        assert item.body == ""
+
+    def test_command_respects_limit(self):
+        enqueue_emails(
+            OutgoingEmail(f"u{i}@example.com", "Тема", "текст") for i in range(3)
+        )
+
+        call_command("send_outbox_emails", "--limit", "2")
+
+        assert EmailOutbox.objects.filter(status=EmailOutbox.Status.SENT).count() == 2
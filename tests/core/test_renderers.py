@@ -0,0 +1,51 @@
+"""Тесты быстрого JSON-рендерера."""
+
+import datetime
+from decimal import Decimal
+import uuid
+
+from django.utils.translation import gettext_lazy
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from core import renderers
+from core.renderers import FastJSONRenderer
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"id": 1, "title": "Проект", "tags": [1, 2, 3]},
+        [{"created_at": datetime.datetime(2024, 1, 2, 3, 4, 5, 678000)}],
+        {
+            "aware": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC),
+            "date": datetime.date(2024, 1, 2),
+            "amount": Decimal("1.50"),
+            "uid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "lazy": gettext_lazy("Проект"),
+            1: "ключ-число",
+        },
+        {"text": "строка с разделителем "},
+        {"big": 2**70},
+    ],
+)
+def test_output_matches_json_renderer(data):
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_none_renders_empty_body():
+    assert FastJSONRenderer().render(None) == b""
+
+
+def test_indent_falls_back_to_json_renderer():
+    data = {"a": [1, 2]}
+    media_type = "application/json; indent=2"
+    assert FastJSONRenderer().render(data, media_type) == JSONRenderer().render(
+        data, media_type
+    )
+
+
+def test_works_without_orjson(monkeypatch):
+    monkeypatch.setattr(renderers, "orjson", None)
+    data = {"id": 1, "title": "Проект"}
+    assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
@@ -0,0 +1,44 @@
+"""Тесты профилирования запуска и бюджета времени старта Django."""
+
+from io import StringIO
+import json
+
+from django.core.management import call_command
+
+from core.startup import HEAVY_MODULES, parse_importtime, profile_startup
+
+# Сейчас django.setup() и загрузка URL занимают ~0.7 с; бюджет с запасом
+# на медленные CI-машины, но ловит возврат тяжёлых импортов на старт
+STARTUP_BUDGET_S = 3.0
+
+
+def test_parse_importtime():
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     json.decoder\n"
+        "import time:       300 |        420 |   json\n"
+        "some unrelated line\n"
+    )
+    timings = parse_importtime(output)
+    assert [(t.module, t.self_us, t.cumulative_us, t.depth) for t in timings] == [
+        ("json.decoder", 120, 120, 2),
+        ("json", 300, 420, 1),
+    ]
+
+
+def test_startup_within_budget_without_heavy_modules():
+    profile = profile_startup()
+
+    assert profile.total_s < STARTUP_BUDGET_S
+    assert [name for name in HEAVY_MODULES if profile.loaded(name)] == []
+
+
+def test_profile_startup_command_json():
+    out = StringIO()
+    call_command("profile_startup", "--json", "--limit", "5", stdout=out)
+
+    report = json.loads(out.getvalue())
+    assert report["total_s"] > 0
+    assert report["heavy_modules_loaded"] == []
+    assert len(report["imports"]) == 5
+    assert report["imports"][0]["cumulative_ms"] >= report["imports"][-1]["cumulative_ms"]
@@ -0,0 +1,53 @@
+"""Тесты замера пропускной способности по HTTP (core.throughput)."""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+
+from core.throughput import ThroughputRunner
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        status = 200 if self.headers.get("Authorization") == "Bearer t" else 401
+        if self.path == "/missing/":
+            status = 404
+        self.send_response(status)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_counts_requests_and_statuses(server_url):
+    runner = ThroughputRunner(server_url, concurrency=3, duration=0.3, token="t")
+
+    result = runner.run(["/ok/", "/missing/"]).to_dict()
+
+    assert result["requests"] > 0
+    assert result["rps"] > 0
+    assert set(result["status_codes"]) == {"200", "404"}
+    assert result["errors"] == result["status_codes"]["404"]
+    assert result["p95_ms"] >= result["p50_ms"]
+
+
+def test_unreachable_server_is_reported_as_error():
+    runner = ThroughputRunner(
+        "http://127.0.0.1:9", concurrency=1, duration=0.1, timeout=0.5
+    )
+    result = runner.run(["/"]).to_dict()
+    assert result["status_codes"].keys() == {"error"}
+    assert result["errors"] == result["requests"]
@@ -3,6 +3,7 @@
 Проверяем все чистые функции бизнес-логики: фильтрацию по ролям, проверку прав доступа.
 """
 
+from django.contrib.auth.models import AnonymousUser
 import pytest
 
 from accounts.models import Department, User
@@ -367,3 +368,25 @@ class TestCanDeleteTag:
         can_delete, message = TagDomain.can_delete_tag(user, tag)
         assert can_delete is False
         assert "недостаточно прав" in message.lower()
+
+
+@pytest.mark.django_db
+class TestGetVisibilityScope:
+    """Тесты области видимости, используемой как ключ кеша."""
+
+    def test_cpds_and_anonymous_share_scope(self, roles, make_user):
+        assert TagDomain.get_visibility_scope(AnonymousUser()) == ("base", None, None)
+        assert TagDomain.get_visibility_scope(make_user(role_code="cpds")) == (
+            "base",
+            None,
+            None,
+        )
+
+    def test_department_scope_includes_parent(self, roles, make_user, departments):
+        user = make_user(role_code="institute_validator", with_department=True)
+
+        assert TagDomain.get_visibility_scope(user) == (
+            "department",
+            departments["child"].id,
+            departments["parent"].id,
+        )
@@ -0,0 +1,155 @@
+"""Тесты фильтрации и сортировки списков заявок (ProjectApplicationFilter)."""
+
+import datetime
+
+from django.utils import timezone
+import pytest
+from rest_framework.test import APIClient
+
+from accounts.models import Semester
+from showcase.models import (
+    ApplicationInvolvedDepartment,
+    ApplicationStatus,
+    ProjectApplication,
+    Tag,
+)
+
+URL = "/api/showcase/project-applications/my_applications/"
+LIST_URL = "/api/showcase/project-applications/"
+
+
+@pytest.mark.django_db
+class TestProjectApplicationFilter:
+    @pytest.fixture
+    def author(self, make_user):
+        return make_user(role_code="user")
+
+    @pytest.fixture
+    def client(self, author):
+        client = APIClient()
+        client.force_authenticate(author)
+        return client
+
+    @pytest.fixture
+    def make_app(self, statuses, author):
+        def _make(title="t", status_code="created", **fields):
+            return ProjectApplication.objects.create(
+                title=title,
+                company="Acme",
+                author=author,
+                status=ApplicationStatus.objects.get(code=status_code),
+                author_lastname="Иванов",
+                author_firstname="Иван",
+                author_email="user@example.com",
+                author_phone="+79990000000",
+                goal="Длинная цель 1234567890",
+                problem_holder="Носитель",
+                barrier="Длинный барьер",
+                **fields,
+            )
+
+        return _make
+
+    def _ids(self, client, query: str) -> list[int]:
+        response = client.get(f"{URL}?{query}")
+        assert response.status_code == 200, response.data
+        return [item["id"] for item in response.data["results"]]
+
+    def test_status_accepts_several_codes(self, client, make_app):
+        created = make_app(status_code="created")
+        await_cpds = make_app(status_code="await_cpds")
+        make_app(status_code="approved")
+
+        assert self._ids(client, "status=created,await_cpds") == [
+            await_cpds.id,
+            created.id,
+        ]
+
+    def test_relations_filtered_without_duplicates(
+        self, client, make_app, departments, institute
+    ):
+        tagged = make_app()
+        other = make_app()
+        tag = Tag.objects.create(name="ИИ")
+        tagged.tags.add(tag, Tag.objects.create(name="Данные"))
+        tagged.target_institutes.add(institute)
+        for department in departments.values():
+            ApplicationInvolvedDepartment.objects.create(
+                application=other, department=department
+            )
+
+        assert self._ids(client, f"tag={tag.id}") == [tagged.id]
+        assert self._ids(client, f"target_institute={institute.code}") == [tagged.id]
+        assert self._ids(
+            client, f"involved_department={departments['child'].id}"
+        ) == [other.id]
+        assert self._ids(
+            client, f"main_department={departments['child'].id}"
+        ) == []
+
+    def test_flags_semester_and_dates(self, client, make_app):
+        semester = Semester.objects.create(code="spring", name="Весна", position=1)
+        external = make_app(is_external=True, semester=semester)
+        unseen = make_app(has_unseen_changes=True)
+        old = make_app()
+        ProjectApplication.objects.filter(pk=old.pk).update(
+            creation_date=timezone.now() - datetime.timedelta(days=400)
+        )
+
+        assert self._ids(client, "is_external=true") == [external.id]
+        assert self._ids(client, "has_unseen_changes=true") == [unseen.id]
+        assert self._ids(client, f"semester_id={semester.id}") == [external.id]
+        since = (timezone.now() - datetime.timedelta(days=30)).date().isoformat()
+        assert old.id not in self._ids(client, f"creation_date_after={since}")
+
+    def test_ordering_whitelist(self, client, make_app):
+        b = make_app(title="Б")
+        a = make_app(title="А")
+        c = make_app(title="В")
+
+        assert self._ids(client, "ordering=creation_date") == [b.id, a.id, c.id]
+        # Поле не из белого списка игнорируется: порядок по умолчанию
+        assert self._ids(client, "ordering=author_email") == [c.id, a.id, b.id]
+
+    def test_page_list_orders_by_title(self, client, make_app):
+        b = make_app(title="Б")
+        a = make_app(title="А")
+        c = make_app(title="В")
+
+        response = client.get(f"{LIST_URL}?ordering=title")
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.data["results"]] == [a.id, b.id, c.id]
+
+    @pytest.mark.parametrize("ordering", ["-title", "print_number", "company"])
+    def test_cursor_pages_cover_list_despite_nullable_ordering(
+        self, client, make_app, ordering
+    ):
+        apps = [make_app(title=None if i % 2 else "Т") for i in range(6)]
+
+        ids, url = [], f"{URL}?ordering={ordering}&page_size=2"
+        while url:
+            response = client.get(url)
+            ids += [item["id"] for item in response.data["results"]]
+            url = response.data["next"]
+
+        # Сортировка по полю с NULL/пустыми значениями игнорируется в курсорных
+        # списках: порядок по умолчанию, без пропусков и повторов
+        assert ids == [app.id for app in reversed(apps)]
+
+    def test_ordering_paginates_by_cursor(self, client, make_app):
+        apps = [make_app() for _ in range(3)]
+
+        first = client.get(f"{URL}?ordering=creation_date&page_size=2")
+        second = client.get(first.data["next"])
+
+        ids = [item["id"] for item in first.data["results"]]
+        ids += [item["id"] for item in second.data["results"]]
+        assert ids == [app.id for app in apps]
+
+    def test_invalid_value_returns_400(self, client, make_app):
+        make_app()
+
+        response = client.get(f"{URL}?main_department=abc")
+        assert response.status_code == 400
+        assert "main_department" in response.data["error"]
@@ -0,0 +1,259 @@
+"""Тесты async view только для чтения и ленты изменений заявок."""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.core.handlers.asgi import ASGIHandler
+import pytest
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core import middleware as core_middleware
+from core.instrumentation import request_stats
+from showcase.models import (
+    ApplicationInvolvedUser,
+    ProjectApplication,
+    ProjectApplicationStatusLog,
+)
+from showcase.services import change_feed_service
+
+# Синхронная часть async view выполняется в отдельном потоке со своим
+# соединением, поэтому данные должны быть зафиксированы
+pytestmark = pytest.mark.django_db(transaction=True)
+
+
+def _client(user) -> APIClient:
+    client = APIClient()
+    token = RefreshToken.for_user(user).access_token
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    return client
+
+
+@pytest.fixture
+def author(make_user):
+    return make_user(role_code="user", email="author@example.com")
+
+
+@pytest.fixture
+def applications(author, statuses):
+    created = []
+    for index in range(3):
+        application = ProjectApplication.objects.create(
+            title=f"Проект {index}", author=author, status_id="created"
+        )
+        ProjectApplicationStatusLog.objects.create(
+            application=application,
+            actor=author,
+            from_status_id="created",
+            to_status_id="await_cpds",
+        )
+        created.append(application)
+    return created
+
+
+class TestAsyncApplicationViews:
+    def test_list_matches_viewset(self, author, applications):
+        client = _client(author)
+
+        sync_response = client.get("/api/showcase/project-applications/")
+        async_response = client.get("/api/showcase/async/project-applications/")
+
+        assert async_response.status_code == 200
+        assert async_response.json() == sync_response.json()
+        assert async_response.json()["count"] == 3
+
+    def test_list_applies_viewset_filters(self, author, applications):
+        ProjectApplication.objects.filter(pk=applications[0].pk).update(
+            status_id="await_cpds"
+        )
+        client = _client(author)
+        query = "?status=created&ordering=title"
+
+        sync_response = client.get(f"/api/showcase/project-applications/{query}")
+        async_response = client.get(f"/api/showcase/async/project-applications/{query}")
+
+        assert async_response.status_code == 200
+        assert async_response.json() == sync_response.json()
+        assert [item["id"] for item in async_response.json()["results"]] == [
+            applications[1].pk,
+            applications[2].pk,
+        ]
+
+    def test_list_rejects_invalid_filter(self, author):
+        response = _client(author).get(
+            "/api/showcase/async/project-applications/?main_department=abc"
+        )
+        assert response.status_code == 400
+        assert "main_department" in response.json()["error"]
+
+    def test_detail_matches_viewset(self, author, applications):
+        client = _client(author)
+        pk = applications[0].pk
+
+        sync_response = client.get(f"/api/showcase/project-applications/{pk}/")
+        async_response = client.get(f"/api/showcase/async/project-applications/{pk}/")
+
+        assert async_response.status_code == 200
+        assert async_response.json() == sync_response.json()
+
+    def test_detail_not_found(self, author, applications):
+        response = _client(author).get("/api/showcase/async/project-applications/0/")
+        assert response.status_code == 404
+
+    def test_requires_authentication(self, applications):
+        response = APIClient().get("/api/showcase/async/project-applications/")
+        assert response.status_code == 401
+
+    def test_only_get_allowed(self, author):
+        response = _client(author).post("/api/showcase/async/project-applications/")
+        assert response.status_code == 405
+
+
+class TestChangeFeed:
+    def test_returns_changes_after_cursor(self, author, applications):
+        client = _client(author)
+
+        first = client.get("/api/showcase/changes/", {"limit": 2}).json()
+        assert len(first["results"]) == 2
+        assert first["results"][0]["to_status"] == "await_cpds"
+
+        rest = client.get("/api/showcase/changes/", {"after": first["last_id"]}).json()
+        assert len(rest["results"]) == 1
+        assert rest["results"][0]["id"] > first["last_id"]
+
+    def test_other_users_changes_are_hidden(self, make_user, applications):
+        stranger = make_user(role_code="user", email="stranger@example.com")
+        response = _client(stranger).get("/api/showcase/changes/")
+        assert response.json() == {"results": [], "last_id": 0}
+
+        cpds = make_user(role_code="cpds", email="cpds@example.com")
+        response = _client(cpds).get("/api/showcase/changes/")
+        assert len(response.json()["results"]) == 3
+
+    def test_visibility_matches_application_access(self, make_user, applications):
+        moderator = make_user(role_code="moderator", email="moderator@example.com")
+        response = _client(moderator).get("/api/showcase/changes/")
+        assert len(response.json()["results"]) == 3
+
+        # Причастному пользователю карточка заявки недоступна — и журнал тоже
+        involved = make_user(role_code="user", email="involved@example.com")
+        ApplicationInvolvedUser.objects.create(
+            application=applications[0], user=involved
+        )
+        response = _client(involved).get("/api/showcase/changes/")
+        assert response.json()["results"] == []
+
+    def test_wait_is_capped(self, author, applications, settings):
+        settings.CHANGE_FEED_MAX_WAIT = 0.2
+        settings.CHANGE_FEED_POLL_INTERVAL = 0.05
+        last_id = ProjectApplicationStatusLog.objects.order_by("-id").first().id
+
+        started = time.monotonic()
+        response = _client(author).get(
+            "/api/showcase/changes/", {"after": last_id, "wait": 30}
+        )
+
+        assert response.json() == {"results": [], "last_id": last_id}
+        assert 0.2 <= time.monotonic() - started < 5
+
+    def test_invalid_params(self, author):
+        response = _client(author).get("/api/showcase/changes/", {"after": "x"})
+        assert response.status_code == 400
+
+
+def _threads_in_core_middleware() -> set[int]:
+    """Потоки (кроме текущего), в стеке которых есть кадр core.middleware."""
+    current = threading.get_ident()
+    found = set()
+    for ident, frame in sys._current_frames().items():
+        while ident != current and frame is not None:
+            if frame.f_code.co_filename == core_middleware.__file__:
+                found.add(ident)
+                break
+            frame = frame.f_back
+    return found
+
+
+async def _asgi_get(handler: ASGIHandler, path: str, query: str, token: str):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [
+            (b"host", b"testserver"),
+            (b"authorization", f"Bearer {token}".encode()),
+        ],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Клиент не отключается: ожидание отменит сам Django после ответа
+        await asyncio.Event().wait()
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await handler(scope, receive, send)
+    status = messages[0]["status"]
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return status, json.loads(body)
+
+
+class TestChangeFeedUnderAsgi:
+    def test_long_poll_does_not_hold_middleware_thread(
+        self, author, applications, settings
+    ):
+        settings.CHANGE_FEED_MAX_WAIT = 0.3
+        settings.CHANGE_FEED_POLL_INTERVAL = 0.05
+        request_stats.reset()
+        last_id = ProjectApplicationStatusLog.objects.order_by("-id").first().id
+        token = str(RefreshToken.for_user(author).access_token)
+        query = f"after={last_id}&wait=5"
+        blocked: list[set[int]] = []
+        real_sleep = asyncio.sleep
+
+        async def observing_sleep(delay):
+            blocked.append(_threads_in_core_middleware())
+            await real_sleep(delay)
+
+        # Как config.asgi: обработчик создаётся в основном потоке
+        handler = ASGIHandler()
+
+        async def poll_concurrently():
+            return await asyncio.gather(
+                *(
+                    _asgi_get(handler, "/api/showcase/changes/", query, token)
+                    for _ in range(3)
+                )
+            )
+
+        with mock.patch.object(change_feed_service.asyncio, "sleep", observing_sleep):
+            responses = async_to_sync(poll_concurrently)()
+
+        assert responses == [(200, {"results": [], "last_id": last_id})] * 3
+        # Пока запросы ждут, ни один поток не стоит внутри middleware
+        assert blocked
+        assert not set().union(*blocked)
+        # Инструментирование под ASGI видит SQL из потоков sync_to_async
+        stats = request_stats.snapshot()["change-feed"]
+        assert stats["requests"] == 3
+        assert stats["avg_queries"] >= 1
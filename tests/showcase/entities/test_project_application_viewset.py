@@ -821,3 +821,134 @@ class TestProjectApplicationViewSetIsExternalInResponses:
 
         assert len(results) > 0
         assert "is_external" in results[0]
+
+
+@pytest.mark.django_db
+class TestProjectApplicationListActionsPagination:
+    """Курсорная пагинация списочных действий и флаг ?legacy=true."""
+
+    BASE = "/api/showcase/project-applications"
+
+    def _create_app(self, author, status_code: str = "await_department"):
+        return ProjectApplication.objects.create(
+            title="t",
+            company="Acme",
+            author=author,
+            status=ApplicationStatus.objects.get(code=status_code),
+            author_lastname="Иванов",
+            author_firstname="Иван",
+            author_email="user@example.com",
+            author_phone="+79990000000",
+            goal="Длинная цель 1234567890",
+            problem_holder="Носитель",
+            barrier="Длинный барьер",
+        )
+
+    def test_my_applications_cursor_pages(self, statuses, make_user):
+        user = make_user(role_code="user")
+        apps = [self._create_app(user) for _ in range(3)]
+        client = APIClient()
+        client.force_authenticate(user)
+
+        first = client.get(f"{self.BASE}/my_applications/?page_size=2")
+        assert first.status_code == 200
+        assert [a["id"] for a in first.data["results"]] == [apps[2].id, apps[1].id]
+        assert first.data["next"]
+
+        second = client.get(first.data["next"])
+        assert [a["id"] for a in second.data["results"]] == [apps[0].id]
+        assert second.data["next"] is None
+
+    def test_legacy_flag_returns_plain_list(self, statuses, make_user):
+        user = make_user(role_code="user")
+        for _ in range(3):
+            self._create_app(user)
+        client = APIClient()
+        client.force_authenticate(user)
+
+        response = client.get(f"{self.BASE}/my_applications/?legacy=true")
+        assert response.status_code == 200
+        assert isinstance(response.data, list)
+        assert len(response.data) == 3
+
+    def test_coordination_single_query_with_comments_count(
+        self, statuses, make_user
+    ):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from showcase.models import (
+            ApplicationInvolvedDepartment,
+            ApplicationInvolvedUser,
+            ProjectApplicationComment,
+        )
+
+        validator = make_user(role_code="department_validator", with_department=True)
+        client = APIClient()
+        client.force_authenticate(validator)
+
+        def add_apps(n):
+            for i in range(n):
+                app = self._create_app(validator)
+                if i % 2:
+                    ApplicationInvolvedUser.objects.create(
+                        application=app, user=validator
+                    )
+                else:
+                    ApplicationInvolvedDepartment.objects.create(
+                        application=app, department=validator.department
+                    )
+                for _ in range(i):
+                    ProjectApplicationComment.objects.create(
+                        application=app, field="goal", text="x", author=validator
+                    )
+
+        add_apps(2)
+        with CaptureQueriesContext(connection) as small:
+            client.get(f"{self.BASE}/coordination/")
+        add_apps(4)
+        with CaptureQueriesContext(connection) as large:
+            response = client.get(f"{self.BASE}/coordination/")
+
+        assert response.status_code == 200
+        assert len(response.data["results"]) == 6
+        assert len(large.captured_queries) == len(small.captured_queries)
+        counts = {
+            a["id"]: a["comments_count"] for a in response.data["results"]
+        }
+        for app in ProjectApplication.objects.filter(pk__in=counts):
+            assert counts[app.id] == app.comments.count()
+
+    def test_recent_limit_sets_page_size(self, statuses, make_user):
+        admin = make_user(role_code="admin")
+        for _ in range(3):
+            self._create_app(admin)
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        response = client.get(f"{self.BASE}/recent/?limit=2")
+        assert len(response.data["results"]) == 2
+        assert response.data["next"]
+
+        legacy = client.get(f"{self.BASE}/recent/?limit=2&legacy=1")
+        assert len(legacy.data) == 2
+
+        assert client.get(f"{self.BASE}/recent/?limit=0").status_code == 400
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "my_applications/?cursor=garbage",
+            "recent/?cursor=garbage",
+            "by_status/?status=created&cursor=garbage",
+        ],
+    )
+    def test_malformed_cursor_returns_404(self, statuses, make_user, query):
+        admin = make_user(role_code="admin")
+        self._create_app(admin)
+        client = APIClient()
+        client.force_authenticate(admin)
+
+        response = client.get(f"{self.BASE}/{query}")
+
+        assert response.status_code == 404
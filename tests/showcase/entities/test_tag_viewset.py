@@ -431,3 +431,45 @@ class TestTagViewSetRetrieve:
         response = client.get(f"/api/showcase/tags/{tag.id}/")
 
         assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestTagViewSetCatalogueCache:
+    """Кеш списка тегов и ETag."""
+
+    def test_list_returns_etag_and_304_on_match(self):
+        client = APIClient()
+        Tag.objects.create(name="Тег", category="К", is_base=True)
+
+        response = client.get("/api/showcase/tags/")
+        etag = response["ETag"]
+        cached = client.get("/api/showcase/tags/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == 200
+        assert cached.status_code == 304
+        assert cached["ETag"] == etag
+        assert not cached.content
+
+    def test_list_served_from_cache(self, django_assert_max_num_queries):
+        client = APIClient()
+        Tag.objects.create(name="Тег", category="К", is_base=True)
+        client.get("/api/showcase/tags/")
+
+        with django_assert_max_num_queries(0):
+            response = client.get("/api/showcase/tags/")
+
+        assert [tag["name"] for tag in response.data] == ["Тег"]
+
+    def test_create_invalidates_catalogue(self, roles, make_user):
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="cpds"))
+        first = client.get("/api/showcase/tags/")
+
+        client.post(
+            "/api/showcase/tags/", {"name": "Новый", "category": "К"}, format="json"
+        )
+        second = client.get("/api/showcase/tags/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert second.status_code == 200
+        assert [tag["name"] for tag in second.data] == ["Новый"]
+        assert second["ETag"] != first["ETag"]
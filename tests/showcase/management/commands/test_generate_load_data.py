@@ -0,0 +1,72 @@
+"""Тесты команды generate_load_data."""
+
+from io import StringIO
+
+from django.core.management import call_command
+import pytest
+
+from accounts.models import Department, User
+from showcase.models import (
+    ApplicationInvolvedDepartment,
+    ProjectApplication,
+    ProjectApplicationStatusLog,
+    Tag,
+)
+
+
+def _generate(**kwargs):
+    options = {
+        "institutes": 2,
+        "departments_per_institute": 2,
+        "users_per_role": 2,
+        "applications": 30,
+        "batch_size": 7,
+        "stdout": StringIO(),
+    }
+    options.update(kwargs)
+    call_command("generate_load_data", **options)
+
+
+@pytest.mark.django_db
+class TestGenerateLoadData:
+    def test_generates_consistent_data(self):
+        _generate()
+
+        assert ProjectApplication.objects.count() == 30
+        assert Department.objects.filter(parent__isnull=False).count() == 4
+        assert User.objects.filter(email__endswith="@load.example.com").count() == 12
+        # У каждой заявки есть лог создания и причастные подразделения
+        assert (
+            ProjectApplicationStatusLog.objects.filter(from_status__isnull=True).count()
+            == 30
+        )
+        assert ApplicationInvolvedDepartment.objects.count() == 60
+        numbers = list(
+            ProjectApplication.objects.values_list("year_sequence_number", flat=True)
+        )
+        assert sorted(numbers) == list(range(1, 31))
+        assert Tag.objects.exists()
+
+    def test_same_seed_is_reproducible(self):
+        _generate(seed=7)
+        first = list(
+            ProjectApplication.objects.order_by("year_sequence_number").values_list(
+                "status_id", flat=True
+            )
+        )
+        call_command("generate_load_data", clear=True, stdout=StringIO())
+        _generate(seed=7)
+        second = list(
+            ProjectApplication.objects.order_by("year_sequence_number").values_list(
+                "status_id", flat=True
+            )
+        )
+        assert first == second
+
+    def test_clear_removes_generated_data(self):
+        _generate()
+        call_command("generate_load_data", clear=True, stdout=StringIO())
+
+        assert not ProjectApplication.objects.exists()
+        assert not User.objects.filter(email__endswith="@load.example.com").exists()
+        assert not Department.objects.filter(name__startswith="[LOAD]").exists()
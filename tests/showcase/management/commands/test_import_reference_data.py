@@ -0,0 +1,145 @@
+"""Тесты команд импорта справочников тегов, институтов и ролей."""
+
+from io import StringIO
+
+from django.core.management import call_command
+import pandas as pd
+import pytest
+
+from accounts.models import Department, Role
+from showcase.models import Institute, ProjectApplication, Tag
+
+
+@pytest.mark.django_db
+def test_import_tags_resolves_departments_by_id_and_name(tmp_path):
+    first = Department.objects.create(name="Кафедра 1", short_name="K1")
+    second = Department.objects.create(name="Кафедра 2", short_name="K2")
+    Tag.objects.create(name="Старый", category="X")
+    path = tmp_path / "tags.csv"
+    pd.DataFrame(
+        [
+            {"name": "A", "category": "C", "department": first.pk},
+            {"name": "B", "category": "C", "department": "Кафедра 2"},
+            {"name": "D", "category": "C", "department": None},
+            {"name": "E", "category": "C", "department": "Нет такой"},
+        ]
+    ).to_csv(path, index=False)
+    out = StringIO()
+
+    call_command("import_tags", "--file", str(path), "--mode", "replace", stdout=out)
+
+    tags = {t.name: t for t in Tag.objects.prefetch_related("departments")}
+    assert set(tags) == {"A", "B", "D", "E"}
+    assert all(t.is_base for t in tags.values())
+    assert list(tags["A"].departments.all()) == [first]
+    assert list(tags["B"].departments.all()) == [second]
+    assert not tags["D"].departments.exists()
+    assert "Нет такой" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_tags_dry_run_keeps_data(tmp_path):
+    Tag.objects.create(name="Старый", category="X")
+    path = tmp_path / "tags.csv"
+    pd.DataFrame([{"name": "A", "category": "C"}]).to_csv(path, index=False)
+
+    call_command("import_tags", "--file", str(path), "--dry-run", stdout=StringIO())
+
+    assert list(Tag.objects.values_list("name", flat=True)) == ["Старый"]
+
+
+@pytest.mark.django_db
+def test_import_tags_sync_preserves_application_links(tmp_path, make_user):
+    dep = Department.objects.create(name="Кафедра", short_name="K")
+    kept = Tag.objects.create(name="ИИ", category="ИТ", is_base=True)
+    moved = Tag.objects.create(name="Данные", category="ИТ", is_base=True)
+    removed = Tag.objects.create(name="Устарел", category="ИТ", is_base=True)
+    custom = Tag.objects.create(name="Свой", category="ИТ", is_base=False)
+    application = ProjectApplication.objects.create(title="T", author=make_user())
+    application.tags.set([kept, moved, removed, custom])
+
+    path = tmp_path / "tags.csv"
+    pd.DataFrame(
+        [
+            {"name": "ИИ", "category": "ИТ", "department": None},
+            {"name": "Данные", "category": "ИТ", "department": dep.name},
+            {"name": "Новый", "category": "ИТ", "department": None},
+        ]
+    ).to_csv(path, index=False)
+    out = StringIO()
+
+    call_command("import_tags", "--file", str(path), stdout=out)
+
+    assert set(Tag.objects.values_list("pk", flat=True)) == {
+        kept.pk,
+        moved.pk,
+        custom.pk,
+        Tag.objects.get(name="Новый").pk,
+    }
+    assert list(Tag.objects.get(pk=moved.pk).departments.all()) == [dep]
+    assert set(application.tags.values_list("pk", flat=True)) == {
+        kept.pk,
+        moved.pk,
+        custom.pk,
+    }
+    assert Tag.objects.get(pk=moved.pk).departments_key == (
+        Tag.build_departments_key([dep.pk])
+    )
+    assert "Создано: 1, обновлено: 1, без изменений: 1, удалено: 1." in (
+        out.getvalue()
+    )
+
+
+@pytest.mark.django_db
+def test_import_tags_sync_is_idempotent(tmp_path):
+    path = tmp_path / "tags.csv"
+    pd.DataFrame([{"name": "A", "category": "C"}]).to_csv(path, index=False)
+    call_command("import_tags", "--file", str(path), stdout=StringIO())
+    out = StringIO()
+
+    call_command("import_tags", "--file", str(path), stdout=out)
+
+    assert "Создано: 0, обновлено: 0, без изменений: 1, удалено: 0" in out.getvalue()
+    assert Tag.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_import_institutes_upserts_and_keeps_department_link(tmp_path):
+    dep = Department.objects.create(name="Подразделение", short_name="P")
+    Institute.objects.create(code="I1", name="Старое", position=5, department=dep)
+    Institute.objects.create(code="OLD", name="Удалится", position=9)
+    path = tmp_path / "institutes.csv"
+    pd.DataFrame(
+        [
+            {"code": "I1", "name": "Институт 1", "position": 1},
+            {"code": "I2", "name": "Институт 2", "position": 2},
+        ]
+    ).to_csv(path, index=False)
+    out = StringIO()
+
+    call_command("import_institutes", "--file", str(path), stdout=out)
+
+    institutes = {i.code: i for i in Institute.objects.all()}
+    assert set(institutes) == {"I1", "I2"}
+    assert institutes["I1"].name == "Институт 1"
+    assert institutes["I1"].department == dep
+    assert "Создано: 1, обновлено: 1, без изменений: 0, удалено: 1." in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_user_roles_keeps_users(tmp_path, make_user):
+    user = make_user(role_code="user")
+    path = tmp_path / "user_roles.csv"
+    pd.DataFrame(
+        [
+            {"code": "user", "name": "Студент", "requires_department": False},
+            {"code": "employee", "name": "Работник", "requires_department": True},
+        ]
+    ).to_csv(path, index=False)
+
+    call_command("import_user_roles", "--file", str(path), stdout=StringIO())
+
+    user.refresh_from_db()
+    assert user.role_id == "user"
+    assert Role.objects.get(code="user").name == "Студент"
+    assert Role.objects.get(code="employee").requires_department is True
@@ -265,8 +265,8 @@ class TestRepositoryGetById:
 class TestRepositoryFilter:
     """Тесты для методов фильтрации заявок."""
 
-    def test_filter_coordination_by_user_queryset(self, statuses, make_user):
-        """filter_coordination_by_user_queryset возвращает QuerySet заявок для координации (в работе) для пагинации."""
+    def test_coordination_queryset(self, statuses, make_user):
+        """coordination_queryset возвращает QuerySet заявок для координации (в работе)."""
         user = make_user(role_code="user")
         repo = ProjectApplicationRepository()
 
@@ -299,7 +299,7 @@ class TestRepositoryFilter:
         app2 = repo.create(dto2, user, "approved")
         ApplicationInvolvedUser.objects.create(application=app2, user=user)
 
-        qs = repo.filter_coordination_by_user_queryset(user)
+        qs = repo.coordination_queryset(user)
         assert hasattr(qs, "filter")  # QuerySet
         results = list(qs)
         assert len(results) == 1
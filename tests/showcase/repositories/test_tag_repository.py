@@ -3,11 +3,12 @@
 Проверяем все методы работы с БД: создание, чтение, обновление, удаление.
 """
 
+from django.db import IntegrityError, transaction
 import pytest
 
 from accounts.models import Department
 from showcase.dto.tag import TagCreateDTO, TagUpdateDTO
-from showcase.models import Tag
+from showcase.models import ProjectApplication, Tag
 from showcase.repositories.tag import TagRepository
 
 
@@ -280,3 +281,72 @@ class TestTagRepositoryExists:
         """exists возвращает False для несуществующего тега."""
         repo = TagRepository()
         assert repo.exists(99999) is False
+
+
+@pytest.mark.django_db
+class TestTagDepartmentsKey:
+    """Ключ набора подразделений поддерживается при любых изменениях связей."""
+
+    def test_key_follows_forward_and_reverse_changes(self, departments):
+        parent, child = departments["parent"], departments["child"]
+        tag = Tag.objects.create(name="Тег", category="К")
+
+        tag.departments.set([child, parent])
+        tag.refresh_from_db()
+        assert tag.departments_key == Tag.build_departments_key([parent.id, child.id])
+
+        child.tags.remove(tag)
+        tag.refresh_from_db()
+        assert tag.departments_key == Tag.build_departments_key([parent.id])
+
+        parent.tags.clear()
+        tag.refresh_from_db()
+        assert tag.departments_key == ""
+
+    def test_key_refreshed_when_department_deleted(self):
+        first = Department.objects.create(name="Первое", short_name="1")
+        second = Department.objects.create(name="Второе", short_name="2")
+        tag = Tag.objects.create(name="Тег", category="К")
+        tag.departments.set([first, second])
+
+        second.delete()
+
+        tag.refresh_from_db()
+        assert tag.departments_key == Tag.build_departments_key([first.id])
+
+    def test_department_delete_merges_duplicate_tag(self, departments):
+        parent, child = departments["parent"], departments["child"]
+        kept = Tag.objects.create(name="Тег", category="К")
+        kept.departments.set([parent])
+        merged = Tag.objects.create(name="Тег", category="К", is_base=True)
+        merged.departments.set([parent, child])
+        application = ProjectApplication.objects.create(title="Заявка")
+        application.tags.set([merged])
+
+        child.delete()
+
+        assert not Tag.objects.filter(pk=merged.pk).exists()
+        kept.refresh_from_db()
+        assert kept.is_base is True
+        assert kept.departments_key == Tag.build_departments_key([parent.id])
+        assert list(application.tags.all()) == [kept]
+
+    def test_database_rejects_duplicate_name_and_departments(self):
+        Tag.objects.create(name="Тег", category="К")
+        with pytest.raises(IntegrityError), transaction.atomic():
+            Tag.objects.create(name="Тег", category="Другая")
+
+    def test_duplicate_check_is_single_lookup(
+        self, departments, django_assert_max_num_queries
+    ):
+        for i in range(20):
+            Tag.objects.create(name="Тег", category="К").departments.set(
+                [Department.objects.create(name=f"D{i}", short_name=f"D{i}")]
+            )
+        dto = TagCreateDTO(
+            name="Тег", category="К", department_ids=[departments["parent"].id]
+        )
+
+        # Число запросов не зависит от количества тегов с тем же названием
+        with django_assert_max_num_queries(10):
+            TagRepository().create(dto)
@@ -345,6 +345,106 @@ class TestTagServiceListTags:
         assert general_tag.id in tag_ids
         assert dept_tag.id in tag_ids
 
+    def test_list_tags_assigns_base_tags_in_bulk(
+        self, roles, make_user, departments, django_assert_max_num_queries
+    ):
+        """Базовые теги привязываются к подразделению одной вставкой."""
+        user = make_user(role_code="institute_validator", with_department=True)
+        base_tags = [
+            Tag.objects.create(name=f"Базовый {i}", category="К", is_base=True)
+            for i in range(5)
+        ]
+        Tag.objects.create(name="Небазовый", category="К", is_base=False)
+        service = TagService()
+
+        # Проверка, вставка связей и пересчёт departments_key — без цикла по тегам
+        with django_assert_max_num_queries(7):
+            service.list_tags(user)
+
+        assert set(user.department.tags.values_list("id", flat=True)) == {
+            tag.id for tag in base_tags
+        }
+
+    def test_list_tags_caches_department_flag(
+        self, roles, make_user, departments, django_assert_num_queries
+    ):
+        """Повторный запрос списка не проверяет наличие тегов в БД."""
+        user = make_user(role_code="institute_validator", with_department=True)
+        tag = Tag.objects.create(name="Свой", category="К")
+        tag.departments.set([user.department])
+        service = TagService()
+        service.list_tags(user)
+
+        with django_assert_num_queries(0):
+            service.list_tags(user)
+
+    def test_department_flag_invalidated_on_detach(
+        self, roles, make_user, departments
+    ):
+        """После отцепления последнего тега базовые теги снова привязываются."""
+        user = make_user(role_code="institute_validator", with_department=True)
+        admin = make_user(role_code="admin")
+        own = Tag.objects.create(name="Свой", category="К", is_base=True)
+        own.departments.set([user.department])
+        base = Tag.objects.create(name="Базовый", category="К", is_base=True)
+        service = TagService()
+        service.list_tags(user)
+
+        service.detach_department(own.id, user.department.id, admin)
+        service.list_tags(user)
+
+        assert set(user.department.tags.values_list("id", flat=True)) == {
+            own.id,
+            base.id,
+        }
+
+
+@pytest.mark.django_db
+class TestTagServiceDepartmentLinks:
+    """Присоединение и отцепление подразделений не нарушает уникальность тегов."""
+
+    def test_attach_rejects_duplicate_departments_set(
+        self, roles, make_user, departments
+    ):
+        admin = make_user(role_code="admin")
+        parent, child = departments["parent"], departments["child"]
+        Tag.objects.create(name="Тег", category="К").departments.set([parent, child])
+        tag = Tag.objects.create(name="Тег", category="К")
+        tag.departments.set([parent])
+
+        with pytest.raises(ValueError, match="уже существует"):
+            TagService().attach_department(tag.id, child.id, admin)
+
+        assert list(tag.departments.all()) == [parent]
+
+    def test_detach_rejects_duplicate_departments_set(
+        self, roles, make_user, departments
+    ):
+        admin = make_user(role_code="admin")
+        parent, child = departments["parent"], departments["child"]
+        Tag.objects.create(name="Тег", category="К").departments.set([parent])
+        tag = Tag.objects.create(name="Тег", category="К")
+        tag.departments.set([parent, child])
+
+        with pytest.raises(ValueError, match="уже существует"):
+            TagService().detach_department(tag.id, child.id, admin)
+
+        assert set(tag.departments.all()) == {parent, child}
+
+    def test_detach_last_department_deletes_tag_despite_general_duplicate(
+        self, roles, make_user, departments
+    ):
+        admin = make_user(role_code="admin")
+        tag = Tag.objects.create(name="Тег", category="К")
+        tag.departments.set([departments["child"]])
+        Tag.objects.create(name="Тег", category="К")
+
+        assert (
+            TagService().detach_department(tag.id, departments["child"].id, admin)
+            is None
+        )
+        assert not Tag.objects.filter(pk=tag.id).exists()
+
 
 @pytest.mark.django_db
 class TestTagServiceGetTag:
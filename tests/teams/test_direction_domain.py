@@ -131,3 +131,45 @@ class TestGetUserInstituteCodes:
         user = make_user(role_code="institute_validator", with_department=True)
         codes = DirectionDomain.get_user_institute_codes(user)
         assert institute.code in codes
+
+
+@pytest.mark.django_db
+class TestInstituteAccessCache:
+    """Карта доступа кешируется и сбрасывается при изменении справочников."""
+
+    def test_repeated_lookup_uses_cache(
+        self, make_user, institute, django_assert_num_queries
+    ):
+        user = make_user(role_code="institute_validator", with_department=True)
+        DirectionDomain.get_user_institute_codes(user)
+
+        with django_assert_num_queries(0):
+            codes = DirectionDomain.get_user_institute_codes(user)
+        assert codes == [institute.code]
+
+    def test_filtered_queryset_is_single_query(
+        self, make_user, institute, directions, django_assert_num_queries
+    ):
+        user = make_user(role_code="institute_validator", with_department=True)
+        StudyGroup.objects.create(
+            name="Группа", code="cache-g", direction=directions["d1"], institute=institute
+        )
+        list(DirectionDomain.get_filtered_queryset(user, Direction.objects.all()))
+
+        with django_assert_num_queries(1):
+            codes = [
+                d.code
+                for d in DirectionDomain.get_filtered_queryset(
+                    user, Direction.objects.all()
+                )
+            ]
+        assert codes == [directions["d1"].code]
+
+    def test_institute_change_invalidates_map(self, make_user, institute, departments):
+        user = make_user(role_code="institute_validator", with_department=True)
+        assert DirectionDomain.get_user_institute_codes(user) == [institute.code]
+
+        institute.is_active = False
+        institute.save()
+
+        assert DirectionDomain.get_user_institute_codes(user) == []
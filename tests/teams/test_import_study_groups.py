@@ -0,0 +1,95 @@
+"""Тесты команды import_study_groups."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+import pytest
+
+from showcase.models import Institute
+from teams.models import Direction, StudyGroup
+
+HEADER = "Институт,Название группы,Курс,Код,Направление обучения\n"
+
+
+@pytest.fixture
+def references():
+    Institute.objects.create(code="IEF", name="ИЭФ", position=1)
+    Institute.objects.create(code="IUIT", name="ИУЦТ", position=2)
+    Direction.objects.create(level="бакалавриат", code="38.03.05", name="Бизнес")
+    Direction.objects.create(level="бакалавриат", code="09.03.01", name="ИВТ")
+
+
+def write_csv(path, *rows):
+    path.write_text(HEADER + "".join(f"{row}\n" for row in rows), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.django_db
+def test_upsert_counts_across_files_and_batches(tmp_path, references):
+    StudyGroup.objects.create(
+        code="1", name="Старое", institute_id="IEF", direction_id="38.03.05"
+    )
+    StudyGroup.objects.create(
+        code="2",
+        name="ЭБЦ-112",
+        institute_id="IEF",
+        direction_id="38.03.05",
+        course_number=1,
+    )
+    first = write_csv(
+        tmp_path / "ief.csv",
+        "IEF,ЭБЦ-111,1,1,38.03.05",
+        "IEF,ЭБЦ-112,1,2,38.03.05",
+        "IEF,ЭБЦ-113,1,3,38.03.05",
+    )
+    second = write_csv(tmp_path / "iuit.csv", "IUIT,УВП-111,2,4,09.03.01")
+    out = StringIO()
+
+    call_command(
+        "import_study_groups",
+        "--file",
+        first,
+        "--file",
+        second,
+        "--batch-size",
+        "2",
+        stdout=out,
+    )
+
+    assert "создано 2, обновлено 1, без изменений 1" in out.getvalue()
+    assert StudyGroup.objects.get(code="1").name == "ЭБЦ-111"
+    assert StudyGroup.objects.get(code="4").institute_id == "IUIT"
+
+
+@pytest.mark.django_db
+def test_unknown_direction_rolls_back(tmp_path, references):
+    path = write_csv(
+        tmp_path / "groups.csv",
+        "IEF,ЭБЦ-111,1,1,38.03.05",
+        "IEF,ЭБЦ-112,1,2,99.99.99",
+    )
+
+    with pytest.raises(CommandError, match="99.99.99"):
+        call_command(
+            "import_study_groups", "--file", path, "--batch-size", "1", stdout=StringIO()
+        )
+
+    assert not StudyGroup.objects.exists()
+
+
+@pytest.mark.django_db
+def test_clear_removes_only_missing_groups_of_imported_institutes(
+    tmp_path, references
+):
+    StudyGroup.objects.create(
+        code="old", name="Старая", institute_id="IEF", direction_id="38.03.05"
+    )
+    StudyGroup.objects.create(
+        code="other", name="Чужая", institute_id="IUIT", direction_id="09.03.01"
+    )
+    path = write_csv(tmp_path / "groups.csv", "IEF,ЭБЦ-111,1,1,38.03.05")
+
+    call_command("import_study_groups", "--file", path, "--clear", stdout=StringIO())
+
+    assert set(StudyGroup.objects.values_list("code", flat=True)) == {"1", "other"}
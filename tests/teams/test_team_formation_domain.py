@@ -0,0 +1,98 @@
+"""Тесты алгоритма распределения учебных групп по заявкам."""
+
+import time
+
+from teams.domain.team_formation import (
+    INSTITUTE_MATCH_WEIGHT,
+    ApplicationDemand,
+    GroupSupply,
+    TeamFormationDomain,
+)
+
+
+def _group(group_id, institute="A", department_id=None, course=1):
+    return GroupSupply(
+        id=group_id,
+        code=f"g{group_id}",
+        name=f"Группа {group_id}",
+        institute_code=institute,
+        department_id=department_id,
+        course_number=course,
+    )
+
+
+class TestScore:
+    def test_foreign_institute_is_not_eligible(self):
+        app = ApplicationDemand(1, "P", institute_codes=frozenset({"A"}))
+        assert TeamFormationDomain.score(app, _group(1, institute="B")) is None
+
+    def test_institute_and_tag_matches_add_up(self):
+        app = ApplicationDemand(
+            1, "P", institute_codes=frozenset({"A"}), tag_department_ids=frozenset({7})
+        )
+        group = _group(1, institute="A", department_id=7)
+        assert TeamFormationDomain.score(app, group) == INSTITUTE_MATCH_WEIGHT + 1
+
+    def test_application_without_targets_accepts_any_group(self):
+        app = ApplicationDemand(1, "P")
+        assert TeamFormationDomain.score(app, _group(1, institute="Z")) == 0
+
+
+class TestAllocate:
+    def test_each_group_is_assigned_once_and_slots_are_respected(self):
+        apps = [ApplicationDemand(1, "P1", slots=2), ApplicationDemand(2, "P2", slots=2)]
+        groups = [_group(i) for i in range(1, 4)]
+
+        result = TeamFormationDomain.allocate(apps, groups)
+
+        group_ids = [a.group_id for a in result.assignments]
+        assert len(group_ids) == len(set(group_ids)) == 3
+        assert sum(result.unfilled.values()) == 1
+        assert result.unused_group_ids == []
+
+    def test_constrained_application_is_served_first(self):
+        # Заявка 2 может взять только группу института B, заявка 1 — любую
+        apps = [
+            ApplicationDemand(1, "Any"),
+            ApplicationDemand(2, "OnlyB", institute_codes=frozenset({"B"})),
+        ]
+        groups = [_group(1, institute="B"), _group(2, institute="A")]
+
+        result = TeamFormationDomain.allocate(apps, groups)
+
+        by_app = {a.application_id: a.group_id for a in result.assignments}
+        assert by_app == {1: 2, 2: 1}
+        assert result.unfilled == {}
+
+    def test_best_scoring_group_wins(self):
+        apps = [ApplicationDemand(1, "P", tag_department_ids=frozenset({5}))]
+        groups = [_group(1, department_id=None), _group(2, department_id=5)]
+
+        result = TeamFormationDomain.allocate(apps, groups)
+
+        assert [a.group_id for a in result.assignments] == [2]
+        assert result.unused_group_ids == [1]
+
+    def test_scales_to_thousands_of_groups(self):
+        institutes = [f"I{i}" for i in range(20)]
+        apps = [
+            ApplicationDemand(
+                i,
+                f"P{i}",
+                institute_codes=frozenset(institutes[i % 20 : i % 20 + 2]),
+                tag_department_ids=frozenset({i % 7}),
+                slots=3,
+            )
+            for i in range(500)
+        ]
+        groups = [
+            _group(i, institute=institutes[i % 20], department_id=i % 7, course=i % 5)
+            for i in range(5000)
+        ]
+
+        started = time.perf_counter()
+        result = TeamFormationDomain.allocate(apps, groups)
+        elapsed = time.perf_counter() - started
+
+        assert len(result.assignments) == 1500
+        assert elapsed < 3
@@ -0,0 +1,128 @@
+"""Тесты сервиса и эндпоинта формирования команд."""
+
+import pytest
+from rest_framework.test import APIClient
+
+from accounts.models import Semester
+from showcase.models import Institute, ProjectApplication, Tag
+from teams.models import Direction, StudyGroup, Team, TeamMember
+from teams.services.team_formation_service import TeamFormationService
+
+
+@pytest.fixture
+def semester(db):
+    return Semester.objects.create(code="2026-autumn", name="Осень 2026", position=1)
+
+
+@pytest.fixture
+def formation_data(statuses, institute, departments, semester):
+    direction = Direction.objects.create(
+        code="09.03.01", name="Информатика", level=Direction.Level.BAKALAVRIAT
+    )
+    other = Institute.objects.create(code="INST-2", name="Institute 2", position=2)
+    groups = [
+        StudyGroup.objects.create(
+            name=f"Группа {i}", code=f"G{i}", direction=direction, institute=inst
+        )
+        for i, inst in enumerate([institute, institute, other])
+    ]
+    StudyGroup.objects.create(
+        name="Выпуск", code="END", direction=direction, institute=institute, is_end=True
+    )
+
+    tag = Tag.objects.create(name="ИТ", category="Отрасль")
+    tag.departments.add(departments["parent"])
+    targeted = ProjectApplication.objects.create(
+        title="Целевая", status_id="approved", semester=semester
+    )
+    targeted.target_institutes.add(institute)
+    targeted.tags.add(tag)
+    free = ProjectApplication.objects.create(
+        title="Любая", status_id="approved", semester=semester
+    )
+    ProjectApplication.objects.create(
+        title="Не одобрена", status_id="await_cpds", semester=semester
+    )
+    return {"groups": groups, "targeted": targeted, "free": free}
+
+
+@pytest.mark.django_db
+class TestTeamFormationService:
+    def test_preview_does_not_create_teams(self, formation_data, semester):
+        result = TeamFormationService().preview(semester.pk)
+
+        assert Team.objects.count() == 0
+        assert len(result["assignments"]) == 2
+        by_app = {a["application_id"]: a for a in result["assignments"]}
+        targeted = by_app[formation_data["targeted"].pk]
+        assert targeted["study_group_code"] in {"G0", "G1"}
+        assert targeted["score"] == 101
+        assert result["unused_groups"] == 1
+
+    def test_form_creates_teams_and_is_idempotent(
+        self, formation_data, semester, make_user
+    ):
+        leader = make_user(role_code="cpds")
+        service = TeamFormationService()
+
+        result = service.form(semester.pk, leader, teams_per_application=2)
+
+        assert result["created_teams"] == 3
+        teams = Team.objects.all()
+        assert {t.project_application_id for t in teams} == {
+            formation_data["targeted"].pk,
+            formation_data["free"].pk,
+        }
+        assert TeamMember.objects.filter(
+            user=leader, role=TeamMember.Role.LEADER
+        ).count() == 3
+        assert not teams.filter(study_group__code="END").exists()
+
+        again = service.form(semester.pk, leader)
+        assert again["created_teams"] == 0
+
+    def test_form_query_count_is_constant(
+        self, formation_data, semester, make_user, django_assert_max_num_queries
+    ):
+        leader = make_user(role_code="cpds")
+        with django_assert_max_num_queries(10):
+            TeamFormationService().form(semester.pk, leader)
+
+
+@pytest.mark.django_db
+class TestTeamFormationEndpoint:
+    def test_requires_admin_or_cpds(self, formation_data, semester, make_user):
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="user"))
+
+        response = client.post(
+            "/api/teams/teams/formation/", {"semester_id": semester.pk}, format="json"
+        )
+
+        assert response.status_code == 403
+
+    def test_dry_run_then_create(self, formation_data, semester, make_user):
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="cpds"))
+        url = "/api/teams/teams/formation/"
+
+        preview = client.post(url, {"semester_id": semester.pk}, format="json")
+        created = client.post(
+            url, {"semester_id": semester.pk, "dry_run": False}, format="json"
+        )
+
+        assert preview.status_code == 200
+        assert preview.data["created_teams"] == 0
+        assert created.status_code == 201
+        assert created.data["created_teams"] == 2
+        assert Team.objects.count() == 2
+
+    def test_unknown_semester_returns_400(self, formation_data, make_user):
+        client = APIClient()
+        client.force_authenticate(user=make_user(role_code="admin"))
+
+        response = client.post(
+            "/api/teams/teams/formation/", {"semester_id": "999999"}, format="json"
+        )
+
+        assert response.status_code == 400
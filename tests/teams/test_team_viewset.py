@@ -0,0 +1,161 @@
+"""Тесты TeamViewSet: пагинация, фильтры и пакетные операции с составом."""
+
+import pytest
+from rest_framework.test import APIClient
+
+from teams.models import Team, TeamMember
+
+
+@pytest.fixture
+def leader(roles, make_user):
+    return make_user(role_code="user", email="leader@example.com")
+
+
+@pytest.fixture
+def team(leader):
+    team = Team.objects.create(name="Команда", leader=leader)
+    TeamMember.objects.create(team=team, user=leader, role=TeamMember.Role.LEADER)
+    return team
+
+
+@pytest.fixture
+def client_for():
+    def _client(user):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        return client
+
+    return _client
+
+
+@pytest.mark.django_db
+class TestTeamList:
+    def test_list_is_cursor_paginated_with_members_count(
+        self, team, leader, client_for, make_user
+    ):
+        for index in range(3):
+            Team.objects.create(name=f"Команда {index}", leader=leader)
+        member = make_user(role_code="user", email="m@example.com")
+        TeamMember.objects.create(team=team, user=member)
+
+        response = client_for(leader).get("/api/teams/teams/?page_size=2")
+
+        assert response.status_code == 200
+        assert len(response.data["results"]) == 2
+        assert response.data["next"]
+        assert "members" not in response.data["results"][0]
+
+        rest = client_for(leader).get(response.data["next"])
+        names = [row["name"] for row in response.data["results"]]
+        names += [row["name"] for row in rest.data["results"]]
+        assert len(names) == 4
+        counts = {row["name"]: row["members_count"] for row in rest.data["results"]}
+        assert counts["Команда"] == 2
+
+    def test_page_size_is_capped(self, team, leader, client_for):
+        response = client_for(leader).get("/api/teams/teams/?page_size=1000")
+        assert response.status_code == 200
+
+    def test_filter_by_leader_and_member(self, team, leader, client_for, make_user):
+        other = make_user(role_code="user", email="other@example.com")
+        other_team = Team.objects.create(name="Чужая", leader=other)
+        TeamMember.objects.create(team=other_team, user=leader)
+        client = client_for(leader)
+
+        by_leader = client.get(f"/api/teams/teams/?leader={other.id}")
+        by_member = client.get(f"/api/teams/teams/?member={leader.id}")
+
+        assert [row["id"] for row in by_leader.data["results"]] == [other_team.id]
+        assert {row["id"] for row in by_member.data["results"]} == {
+            team.id,
+            other_team.id,
+        }
+
+    def test_my_teams_is_paginated(self, team, leader, client_for, make_user):
+        other = make_user(role_code="user", email="other@example.com")
+        Team.objects.create(name="Чужая", leader=other)
+
+        response = client_for(leader).get("/api/teams/teams/my/")
+
+        assert response.status_code == 200
+        assert [row["id"] for row in response.data["results"]] == [team.id]
+
+    def test_list_query_count_does_not_grow(
+        self, team, leader, client_for, make_user, django_assert_max_num_queries
+    ):
+        for index in range(10):
+            extra = Team.objects.create(name=f"Команда {index}", leader=leader)
+            TeamMember.objects.create(team=extra, user=leader)
+        client = client_for(leader)
+
+        with django_assert_max_num_queries(3):
+            response = client.get("/api/teams/teams/")
+        assert response.status_code == 200
+
+
+@pytest.mark.django_db
+class TestTeamMembersBulk:
+    def test_bulk_add_reports_status_per_user(
+        self, team, leader, client_for, make_user
+    ):
+        new = make_user(role_code="user", email="new@example.com")
+
+        response = client_for(leader).post(
+            f"/api/teams/teams/{team.id}/members/bulk/",
+            {"user_ids": [new.id, leader.id, new.id, 999999]},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response.data["results"] == [
+            {"user_id": new.id, "status": "added"},
+            {"user_id": leader.id, "status": "already_member"},
+            {"user_id": 999999, "status": "not_found"},
+        ]
+        assert team.members.filter(user=new, role=TeamMember.Role.MEMBER).exists()
+
+    def test_bulk_remove_keeps_leader(self, team, leader, client_for, make_user):
+        member = make_user(role_code="user", email="m@example.com")
+        outsider = make_user(role_code="user", email="o@example.com")
+        TeamMember.objects.create(team=team, user=member)
+
+        response = client_for(leader).post(
+            f"/api/teams/teams/{team.id}/members/bulk-remove/",
+            {"user_ids": [member.id, leader.id, outsider.id]},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response.data["results"] == [
+            {"user_id": member.id, "status": "removed"},
+            {"user_id": leader.id, "status": "leader"},
+            {"user_id": outsider.id, "status": "not_member"},
+        ]
+        assert list(team.members.values_list("user_id", flat=True)) == [leader.id]
+
+    def test_bulk_add_requires_team_permission(self, team, client_for, make_user):
+        stranger = make_user(role_code="user", email="s@example.com")
+
+        response = client_for(stranger).post(
+            f"/api/teams/teams/{team.id}/members/bulk/",
+            {"user_ids": [stranger.id]},
+            format="json",
+        )
+
+        assert response.status_code == 403
+
+    def test_bulk_add_rejects_empty_list(self, team, leader, client_for):
+        response = client_for(leader).post(
+            f"/api/teams/teams/{team.id}/members/bulk/",
+            {"user_ids": []},
+            format="json",
+        )
+        assert response.status_code == 400
+
+    def test_single_add_still_rejects_duplicate(self, team, leader, client_for):
+        response = client_for(leader).post(
+            f"/api/teams/teams/{team.id}/members/",
+            {"user": leader.id},
+            format="json",
+        )
+        assert response.status_code == 400
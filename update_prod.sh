@@ -64,7 +64,20 @@ source "${PROJECT_DIR}/venv/bin/activate"
 log_info "Миграции Django..."
 python manage.py migrate
 
+log_info "Генерация OpenAPI-схемы..."
+python manage.py generate_openapi_schema
+
 log_info "Перезапуск systemd: ${GUNICORN_SERVICE}"
 sudo systemctl restart "${GUNICORN_SERVICE}"
 
+# Письма из очереди (одобрение заявок на регистрацию) отправляет только таймер
+OUTBOX_TIMER="project_activity_outbox.timer"
+if systemctl list-unit-files "${OUTBOX_TIMER}" --no-legend 2>/dev/null | grep -q "${OUTBOX_TIMER}"; then
+  log_info "Таймер отправки писем: ${OUTBOX_TIMER}"
+  sudo systemctl enable --now "${OUTBOX_TIMER}"
+else
+  log_warn "Не установлен ${OUTBOX_TIMER}: письма из очереди не отправляются."
+  log_warn "Установите unit-файлы project_activity_outbox.* (docs/manual_deploy.md, раздел 15)."
+fi
+
 log_info "Готово. Статус: sudo systemctl status ${GUNICORN_SERVICE}"